@@ -25,7 +25,7 @@ from packaging.version import parse
 
 import seedfarmer.errors
 from seedfarmer.__metadata__ import __description__, __license__, __title__
-from seedfarmer.models import ProjectSpec
+from seedfarmer.models import BotocoreSpec, ModuleStateStoreSpec, ProjectSpec
 
 _logger: logging.Logger = logging.getLogger(__name__)
 __all__ = ["__description__", "__license__", "__title__"]
@@ -179,6 +179,24 @@ class Config(object):
             self._load_config_data()
         return cast(ProjectSpec, self._project_spec).manifest_validation_fail_on_unknown_fields
 
+    @property
+    def MODULE_STATE_STORE(self) -> Optional[ModuleStateStoreSpec]:
+        if self._project_name_param and self._project_spec is None:
+            return None
+
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).module_state_store
+
+    @property
+    def BOTOCORE(self) -> Optional[BotocoreSpec]:
+        if self._project_name_param and self._project_spec is None:
+            return None
+
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).botocore
+
     @property
     def BUCKET_STORAGE_PATH(self) -> str:
         if self._project_spec is None:
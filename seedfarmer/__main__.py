@@ -107,14 +107,14 @@ def version() -> None:
 @click.option(
     "--enable-session-timeout/--disable-session-timeout",
     default=False,
-    help="Enable boto3 Session timeouts. If enabled, boto3 Sessions will be reset on the timeout interval",
+    help="Enable boto3 Session timeouts. If enabled, expiring boto3 Session credentials are refreshed on the interval",
     show_default=True,
     type=bool,
 )
 @click.option(
     "--session-timeout-interval",
     default=900,
-    help="If --enable-session-timeout, the interval, in seconds, to reset boto3 Sessions",
+    help="If --enable-session-timeout, the interval, in seconds, to refresh boto3 Sessions close to expiry",
     show_default=True,
     type=int,
 )
@@ -139,6 +139,13 @@ def version() -> None:
     show_default=True,
     type=bool,
 )
+@click.option(
+    "--hash-cache/--no-hash-cache",
+    default=True,
+    help="Reuse the hashes of unchanged module files when detecting changes. Use --no-hash-cache to rehash all files",
+    show_default=True,
+    type=bool,
+)
 @safe_execute("Deployment Apply")
 def apply(
     spec: str,
@@ -155,6 +162,7 @@ def apply(
     update_seedkit: bool,
     update_project_policy: bool,
     local: bool,
+    hash_cache: bool,
 ) -> None:
     """Apply manifests to a SeedFarmer managed deployment"""
     if debug:
@@ -180,6 +188,7 @@ def apply(
         update_seedkit=update_seedkit,
         update_project_policy=update_project_policy,
         local=local,
+        use_hash_cache=hash_cache,
     )
 
 
@@ -247,14 +256,14 @@ def apply(
 @click.option(
     "--enable-session-timeout/--disable-session-timeout",
     default=False,
-    help="Enable boto3 Session timeouts. If enabled, boto3 Sessions will be reset on the timeout interval",
+    help="Enable boto3 Session timeouts. If enabled, expiring boto3 Session credentials are refreshed on the interval",
     show_default=True,
     type=bool,
 )
 @click.option(
     "--session-timeout-interval",
     default=900,
-    help="If --enable-session-timeout, the interval, in seconds, to reset boto3 Sessions",
+    help="If --enable-session-timeout, the interval, in seconds, to refresh boto3 Sessions close to expiry",
     show_default=True,
     type=int,
 )
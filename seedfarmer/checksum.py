@@ -13,19 +13,46 @@
 #    limitations under the License.
 
 
+import concurrent.futures
 import hashlib
+import json
+import logging
+import mmap
 import os
+import re
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
-from gitignore_parser import parse_gitignore
+from gitignore_parser import parse_gitignore, rule_from_pattern
 
+import seedfarmer.mgmt.bundle as bundle
 from seedfarmer.models.manifests._module_manifest import DataFile
 
+_logger: logging.Logger = logging.getLogger(__name__)
 
-def _evaluate_gitignore(project_path: str, module_path: str) -> Dict[str, Any]:
+HASH_CACHE_DIR = ".seedfarmer.out"
+HASH_CACHE_FILE = "file-hash-cache.json"
+_HASH_CACHE_VERSION = 1
+# Files modified this recently are hashed but not cached, as a later write within the
+# filesystem timestamp granularity would not change the (size, mtime_ns, inode) signature
+_HASH_CACHE_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+_hash_caches: Dict[str, "FileHashCache"] = {}
+_hash_caches_guard = Lock()
+
+# hashlib releases the GIL while hashing, so files are hashed on a pool shared by all modules
+_HASH_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# Files of at least this size are memory mapped and hashed in a single update
+_HASH_MMAP_MIN_SIZE = 4 * 1024 * 1024
+
+_hash_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_hash_executor_guard = Lock()
+
+
+def _get_gitignore_paths(project_path: str, module_path: str) -> List[str]:
     ignore_paths: List[str] = []
-    ignore_maps: Dict[str, Any] = {}
 
     def _get_paths(working_dir: str) -> None:
         gitignore_path = os.path.join(working_dir, ".gitignore")
@@ -33,9 +60,15 @@ def _evaluate_gitignore(project_path: str, module_path: str) -> Dict[str, Any]:
         if os.path.realpath(working_dir) != os.path.realpath(project_path):
             _get_paths(str(Path(os.path.join(working_dir, os.pardir)).resolve()))
 
-    # If the .gitignore path exists, parse_gitignore returns a function that is callable
     _get_paths(os.path.join(project_path, module_path))
-    for ignore_path in ignore_paths:
+    return ignore_paths
+
+
+def _evaluate_gitignore(project_path: str, module_path: str) -> Dict[str, Any]:
+    ignore_maps: Dict[str, Any] = {}
+
+    # If the .gitignore path exists, parse_gitignore returns a function that is callable
+    for ignore_path in _get_gitignore_paths(project_path=project_path, module_path=module_path):
         if os.path.exists(ignore_path):
             ignore_maps[ignore_path] = parse_gitignore(ignore_path)
 
@@ -58,6 +91,154 @@ def _evaluate_file(filename: str, ignore_maps: Dict[str, Any]) -> bool:
     return False
 
 
+class _IgnoreMatcher:
+    """
+    The .gitignore rules that apply to a module, compiled once for the whole walk of the module
+
+    Paths are matched relative to the module directory, with ``/`` separators.  Each .gitignore
+    is evaluated on its own relative to its directory, and a path is ignored if any of them ignores it,
+    the same as ``_evaluate_file``.  The rules of a .gitignore without negations are joined into a single
+    regular expression, otherwise the last matching rule decides.
+
+    Parameters
+    ----------
+    project_path : str
+       The OPS_ROOT full path (full path of the project)
+    module_path : str
+        The relative path of the module code (relative to OPS_ROOT)
+    """
+
+    def __init__(self, project_path: str, module_path: str) -> None:
+        module_dir = os.path.abspath(os.path.join(project_path, module_path))
+        self._any_rules: List[Tuple[str, Pattern[str]]] = []
+        self._ordered_rules: List[Tuple[str, List[Tuple[Pattern[str], bool]]]] = []
+
+        for ignore_path in _get_gitignore_paths(project_path=project_path, module_path=module_path):
+            base_dir = os.path.dirname(os.path.abspath(ignore_path))
+            rules = []
+            with open(ignore_path, encoding="utf-8") as ignore_file:
+                for line_no, line in enumerate(ignore_file, start=1):
+                    rule = rule_from_pattern(line.rstrip("\n"), base_path=base_dir, source=(ignore_path, line_no))
+                    if rule:
+                        rules.append(rule)
+            if not rules:
+                continue
+
+            prefix = Path(os.path.relpath(module_dir, base_dir)).as_posix()
+            prefix = "" if prefix == "." else f"{prefix}/"
+            if any(rule.negation for rule in rules):
+                self._ordered_rules.append(
+                    (prefix, [(re.compile(rule.regex), rule.negation) for rule in reversed(rules)])
+                )
+            else:
+                self._any_rules.append((prefix, re.compile("|".join(f"(?:{rule.regex})" for rule in rules))))
+
+    def is_ignored(self, relative_path: str) -> bool:
+        for prefix, pattern in self._any_rules:
+            if pattern.search(f"{prefix}{relative_path}"):
+                return True
+        for prefix, ordered_rules in self._ordered_rules:
+            for pattern, negation in ordered_rules:
+                if pattern.search(f"{prefix}{relative_path}"):
+                    if not negation:
+                        return True
+                    break
+        return False
+
+
+class ModuleInventory:
+    """
+    The files of a module, walked once for both the module md5 and the module bundle
+
+    The md5 files respect .gitignore and the excluded files, the bundle files respect the
+    ``BUNDLE_IGNORED_FILE_PATHS`` and ``BUNDLE_ALLOWED_HIDDEN_FILE_PATHS`` of ``seedfarmer.mgmt.bundle``.
+    Hidden directories are in neither.  Directories only the bundle needs, such as those in .gitignore,
+    are walked when the bundle files are first requested, so change detection never walks them.
+    The module is walked on first use of either.
+
+    Parameters
+    ----------
+    project_path : str
+       The OPS_ROOT full path (full path of the project)
+    module_path : str
+        The relative path of the module code (relative to OPS_ROOT)
+    excluded_files : List[str], optional
+        A list of additional file names not in .gitignore that will be excluded from the md5 files
+    """
+
+    def __init__(self, project_path: str, module_path: str, excluded_files: Optional[List[str]] = None) -> None:
+        self.project_path = project_path
+        self.module_path = module_path
+        self.module_dir = os.path.join(project_path, module_path)
+        self._excluded_files = [] if excluded_files is None else excluded_files
+        self._bundle_root = os.path.realpath(self.module_dir)
+        self._bundle_offset = len(os.path.join(self._bundle_root, ""))
+        self._walked = False
+        self._md5_files: List[str] = []
+        self._bundle_files: List[str] = []
+        self._pending_bundle_dirs: List[Tuple[str, str]] = []
+        self._lock = Lock()
+
+    def _walk_module(self) -> List[str]:
+        if not self._walked:
+            self._walked = True
+            self._matcher = _IgnoreMatcher(project_path=self.project_path, module_path=self.module_path)
+            self._walk(
+                dirname=self.module_dir,
+                relative_dir="",
+                bundle_dir=self._bundle_root,
+                in_md5=True,
+                in_bundle=not bundle._is_ignored_dir(self._bundle_root),
+            )
+        return self._md5_files
+
+    def _walk(self, dirname: str, relative_dir: str, bundle_dir: str, in_md5: bool, in_bundle: bool) -> None:
+        subfolders: List[Tuple[str, str, str, bool]] = []
+        with os.scandir(dirname) as entries:
+            for entry in entries:
+                relative_path = f"{relative_dir}{entry.name}"
+                bundle_path = os.path.join(bundle_dir, entry.name)
+                if entry.is_file():
+                    if (
+                        in_md5
+                        and entry.name not in self._excluded_files
+                        and not self._matcher.is_ignored(relative_path)
+                    ):
+                        self._md5_files.append(entry.path)
+                    if in_bundle and bundle._is_valid_dir_file(bundle_path):
+                        self._bundle_files.append(bundle_path[self._bundle_offset :])
+                elif entry.is_dir() and not entry.name.startswith("."):
+                    # ignore all hidden directories and prune any dir neither the md5 nor the bundle needs
+                    subfolder_in_bundle = in_bundle and not bundle._is_ignored_dir(bundle_path)
+                    if in_md5 and not self._matcher.is_ignored(relative_path):
+                        subfolders.append((entry.path, f"{relative_path}/", bundle_path, subfolder_in_bundle))
+                    elif subfolder_in_bundle:
+                        self._pending_bundle_dirs.append((entry.path, bundle_path))
+        for subfolder, relative_subfolder, bundle_subfolder, subfolder_in_bundle in subfolders:
+            self._walk(subfolder, relative_subfolder, bundle_subfolder, in_md5=True, in_bundle=subfolder_in_bundle)
+
+    @property
+    def md5_files(self) -> List[str]:
+        """The files of the module md5, walking the module on first use"""
+        with self._lock:
+            return list(self._walk_module())
+
+    @property
+    def bundle_files(self) -> List[str]:
+        """The files of the module bundle, relative to the module directory"""
+        with self._lock:
+            self._walk_module()
+            while self._pending_bundle_dirs:
+                dirname, bundle_dir = self._pending_bundle_dirs.pop()
+                self._walk(dirname, "", bundle_dir, in_md5=False, in_bundle=True)
+            return list(self._bundle_files)
+
+
+def _list_module_files(project_path: str, module_path: str, excluded_files: List[str]) -> List[str]:
+    """List the files of a module, respecting .gitignore"""
+    return ModuleInventory(project_path=project_path, module_path=module_path, excluded_files=excluded_files).md5_files
+
+
 def _generate_file_hash(filepath: str) -> str:
     hash = hashlib.md5(usedforsecurity=False)
     blocksize = 64 * 1024
@@ -66,6 +247,10 @@ def _generate_file_hash(filepath: str) -> str:
         return hash.hexdigest()
 
     with open(filepath, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size >= _HASH_MMAP_MIN_SIZE:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hash.update(mapped)
+            return hash.hexdigest()
         while True:
             data = fp.read(blocksize)
             if not data:
@@ -75,6 +260,145 @@ def _generate_file_hash(filepath: str) -> str:
     return digest
 
 
+def _file_signature(st: os.stat_result) -> List[int]:
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+class FileHashCache:
+    """
+    An on-disk cache of file md5 hashes
+
+    Entries are keyed by the absolute path of the file and are only valid while the
+    (size, mtime_ns, inode) signature of the file is unchanged, so unchanged files are not read again.
+    Entries of files that were removed or changed are evicted when the cache is loaded.
+
+    Parameters
+    ----------
+    cache_path : str
+        The full path of the cache file
+    """
+
+    def __init__(self, cache_path: str) -> None:
+        self.cache_path = cache_path
+        self._lock = Lock()
+        self._dirty = False
+        self._entries: Dict[str, List[Any]] = self._load()
+
+    def _load(self) -> Dict[str, List[Any]]:
+        try:
+            with open(self.cache_path, encoding="utf-8") as cache_file:
+                content = json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            _logger.debug("Ignoring unreadable file hash cache %s: %s", self.cache_path, e)
+            return {}
+        if not isinstance(content, dict) or content.get("version") != _HASH_CACHE_VERSION:
+            return {}
+
+        entries: Dict[str, List[Any]] = {}
+        for path, entry in content.get("entries", {}).items():
+            try:
+                if entry[:3] == _file_signature(os.stat(path)):
+                    entries[path] = entry
+            except OSError:
+                pass
+        self._dirty = len(entries) != len(content.get("entries", {}))
+        return entries
+
+    def get_file_hash(self, filepath: str) -> str:
+        """Return the md5 of a file, reading the file only if its cached entry is missing or stale"""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return _generate_file_hash(filepath)
+
+        key = os.path.abspath(filepath)
+        signature = _file_signature(st)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[:3] == signature:
+            return str(entry[3])
+
+        digest = _generate_file_hash(filepath)
+        try:
+            unchanged = _file_signature(os.stat(filepath)) == signature
+        except OSError:
+            unchanged = False
+        if unchanged and time.time_ns() - st.st_mtime_ns > _HASH_CACHE_RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[key] = signature + [digest]
+                self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        """Write the cache to disk if any entry was added or evicted since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as cache_file:
+                    json.dump({"version": _HASH_CACHE_VERSION, "entries": self._entries}, cache_file)
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+            except OSError as e:
+                _logger.debug("Unable to write the file hash cache %s: %s", self.cache_path, e)
+
+
+def get_hash_cache(project_path: str) -> FileHashCache:
+    """
+    Get the FileHashCache of a project, loading it from disk on first use
+
+    Parameters
+    ----------
+    project_path : str
+       The OPS_ROOT full path (full path of the project)
+
+    Returns
+    -------
+    FileHashCache
+        The same FileHashCache object for every call with the same project path
+    """
+    cache_path = os.path.join(os.path.abspath(project_path), HASH_CACHE_DIR, HASH_CACHE_FILE)
+    with _hash_caches_guard:
+        if cache_path not in _hash_caches:
+            _hash_caches[cache_path] = FileHashCache(cache_path)
+        return _hash_caches[cache_path]
+
+
+def save_hash_caches() -> None:
+    """
+    Write the FileHashCache of every project used to disk, if it changed since it was last saved
+
+    The caches are saved once the modules of a deployment are hashed and bundled rather than after
+    each module, which would rewrite the whole cache file every time.
+    """
+    with _hash_caches_guard:
+        hash_caches = list(_hash_caches.values())
+    for hash_cache in hash_caches:
+        hash_cache.save()
+
+
+def _get_hash_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _hash_executor
+    with _hash_executor_guard:
+        if _hash_executor is None:
+            _hash_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_HASH_MAX_WORKERS, thread_name_prefix="Hash"
+            )
+        return _hash_executor
+
+
+def _hash_files(filepaths: List[str], hash_cache: Optional[FileHashCache] = None) -> List[str]:
+    """Hash the files concurrently, returning the hashes in the same order as the files"""
+    hash_file = hash_cache.get_file_hash if hash_cache else _generate_file_hash
+    if len(filepaths) < 2:
+        return [hash_file(filepath) for filepath in filepaths]
+    return list(_get_hash_executor().map(hash_file, filepaths))
+
+
 def _consolidate_hash(hashlist: List[str]) -> str:
     hash = hashlib.md5(
         usedforsecurity=False,
@@ -89,6 +413,8 @@ def get_module_md5(
     module_path: str,
     data_files: Optional[List[DataFile]] = None,
     excluded_files: Optional[List[str]] = [],
+    use_cache: bool = True,
+    inventory: Optional[ModuleInventory] = None,
 ) -> str:
     """
     This will generate an MD5 of the module source code, respecting .gitingore starting at
@@ -106,36 +432,24 @@ def get_module_md5(
         A list of additional files not in .gitignore that will be exclude from the bundle md5
             NOTE: this list of files is ONLY at the module level, not subdirecties of
             the module...use .gitignore for that
+    use_cache : bool, optional
+        Reuse the hashes of unchanged files from the file hash cache of the project, by default True
+    inventory : ModuleInventory, optional
+        The already walked files of the module, so the module is not walked again.  The
+        excluded_files are ignored in favor of those of the inventory.
 
     Returns
     -------
     str
         the md5 of the module code
     """
-    ignore_maps = _evaluate_gitignore(project_path=project_path, module_path=module_path)
-
     excluded_files = [] if excluded_files is None else excluded_files
 
-    all_files = []
-
-    def scandir(dirname: str) -> List[str]:
-        files = [
-            f.path
-            for f in os.scandir(dirname)
-            if f.is_file() and os.path.split(f)[1] not in excluded_files and not _evaluate_file(f.path, ignore_maps)
-        ]
-        all_files.extend(files)
-        subfolders = [f.path for f in os.scandir(dirname) if f.is_dir()]
-        for dirname in list(subfolders):
-            # ignore all hidden directories and any dir already in .gitignore
-            (
-                subfolders.extend(scandir(dirname))
-                if not os.path.split(dirname)[1].startswith(".") and not _evaluate_file(dirname, ignore_maps)
-                else None
-            )
-        return subfolders
-
-    _ = scandir(os.path.join(project_path, module_path))
+    all_files = (
+        inventory.md5_files
+        if inventory
+        else _list_module_files(project_path=project_path, module_path=module_path, excluded_files=excluded_files)
+    )
 
     # Add in the extra files
     if data_files is not None:
@@ -146,7 +460,7 @@ def get_module_md5(
                 else None
             )
 
-    hashvalues: List[str] = []
-    for viable_file in all_files:
-        hashvalues.append(_generate_file_hash(viable_file))
+    # The hash cache is saved once all the modules are hashed, with save_hash_caches
+    hash_cache = get_hash_cache(project_path) if use_cache else None
+    hashvalues = _hash_files(all_files, hash_cache)
     return _consolidate_hash(hashvalues)
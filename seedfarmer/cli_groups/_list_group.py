@@ -281,17 +281,16 @@ def list_deployspec(
     session_manager: ISessionManager = SessionManager().get_or_create(
         project_name=project, profile=profile, region_name=region, qualifier=qualifier
     )
-    dep_manifest = du.generate_deployed_manifest(deployment_name=deployment, skip_deploy_spec=True)
+    module_keys = du.get_deployed_module_keys(deployment_name=deployment)
 
-    if dep_manifest is None:
+    if module_keys is None:
         print_json({})
         return
 
-    dep_manifest.validate_and_set_module_defaults()
     try:
+        module_key = module_keys[(group, module)]
         session = session_manager.get_deployment_session(
-            account_id=dep_manifest.get_module(group=group, module=module).get_target_account_id(),  # type: ignore
-            region_name=dep_manifest.get_module(group=group, module=module).target_region,  # type: ignore
+            account_id=module_key["account_id"], region_name=module_key["region"]
         )
     except Exception:
         _error_messaging(deployment, group, module)
@@ -405,17 +404,16 @@ def list_module_metadata(
     session_manager: ISessionManager = SessionManager().get_or_create(
         project_name=project, profile=profile, region_name=region, qualifier=qualifier
     )
-    dep_manifest = du.generate_deployed_manifest(deployment_name=deployment, skip_deploy_spec=True)
+    module_keys = du.get_deployed_module_keys(deployment_name=deployment)
 
-    if dep_manifest is None:
+    if module_keys is None:
         _error_messaging(deployment, group, module)
         return
 
-    dep_manifest.validate_and_set_module_defaults()
     try:
+        module_key = module_keys[(group, module)]
         session = session_manager.get_deployment_session(
-            account_id=dep_manifest.get_module(group=group, module=module).get_target_account_id(),  # type: ignore
-            region_name=dep_manifest.get_module(group=group, module=module).target_region,  # type: ignore
+            account_id=module_key["account_id"], region_name=module_key["region"]
         )
     except Exception:
         _error_messaging(deployment, group, module)
@@ -512,31 +510,21 @@ def list_all_module_metadata(
 
     load_dotenv_files(config.OPS_ROOT, env_files=env_files)
 
-    session = SessionManager().get_or_create(
-        project_name=project, profile=profile, region_name=region, qualifier=qualifier
+    SessionManager().get_or_create(project_name=project, profile=profile, region_name=region, qualifier=qualifier)
+    module_info_index = du.ModuleInfoIndex()
+    dep_manifest = du.generate_deployed_manifest(
+        deployment_name=deployment, skip_deploy_spec=True, module_info_index=module_info_index
     )
-    dep_manifest = du.generate_deployed_manifest(deployment_name=deployment, skip_deploy_spec=True)
 
     if dep_manifest is None:
         _error_messaging(deployment)
         return
     dep_manifest.validate_and_set_module_defaults()
     try:
-        all_metadata_json = {
-            f"{group.name}-{module.name}": mi.get_module_metadata(
-                deployment=deployment,
-                group=group.name,
-                module=module.name,
-                session=(
-                    session.get_deployment_session(
-                        account_id=module.get_target_account_id(),  # type: ignore
-                        region_name=module.target_region,  # type: ignore
-                    )
-                ),
-            )
-            for group in dep_manifest.groups
-            for module in group.modules
-        }
+        # The metadata was fetched with the rest of the module info when generating the deployed manifest
+        all_metadata_json = du.get_deployed_modules_metadata(
+            deployment_manifest=dep_manifest, module_info_index=module_info_index
+        )
         sys.stdout.write(json.dumps(all_metadata_json))
     except Exception:
         _error_messaging(deployment)
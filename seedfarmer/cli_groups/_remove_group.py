@@ -154,3 +154,5 @@ def remove_module_data(
             .get_deployment_session(account_id=target_account_id, region_name=target_region)
         )
     mi.remove_module_info(deployment, group, module, session=session)
+    cache_key = f"{target_account_id}-{target_region}" if target_account_id and target_region else None
+    mi.invalidate_cached_module_info(deployment=deployment, group=group, module=module, cache_key=cache_key)
@@ -177,6 +177,8 @@ def store_deployspec(
         )
 
     du.update_deployspec(deployment, group, module, path, session=session)
+    cache_key = f"{target_account_id}-{target_region}" if target_account_id and target_region else None
+    mi.invalidate_cached_module_info(deployment=deployment, group=group, module=module, cache_key=cache_key)
 
 
 @store.command(
@@ -295,6 +297,8 @@ def store_module_metadata(
     d = yaml.safe_load(sys.stdin.read())
     if d:
         mi.write_metadata(deployment=deployment, group=group, module=module, data=d, session=session)
+        cache_key = f"{target_account_id}-{target_region}" if target_account_id and target_region else None
+        mi.invalidate_cached_module_info(deployment=deployment, group=group, module=module, cache_key=cache_key)
     else:
         _logger.info("No Data avaiable...skipping")
 
@@ -424,5 +428,7 @@ def store_module_md5(
         elif type.casefold() == "spec":
             _type = mi.ModuleConst.DEPLOYSPEC
         mi.write_module_md5(deployment=deployment, group=group, module=module, hash=d, type=_type, session=session)
+        cache_key = f"{target_account_id}-{target_region}" if target_account_id and target_region else None
+        mi.invalidate_cached_module_info(deployment=deployment, group=group, module=module, cache_key=cache_key)
     else:
         _logger.info("No Data available...skipping")
@@ -161,11 +161,9 @@ def taint_module(
     )
 
     try:
-        dep_manifest = du.generate_deployed_manifest(deployment_name=deployment, skip_deploy_spec=True)
-        dep_manifest.validate_and_set_module_defaults()  # type: ignore
+        module_key = du.get_deployed_module_keys(deployment_name=deployment)[(group, module)]  # type: ignore
         session = session_manager.get_deployment_session(
-            account_id=dep_manifest.get_module(group=group, module=module).get_target_account_id(),  # type: ignore
-            region_name=dep_manifest.get_module(group=group, module=module).target_region,  # type: ignore
+            account_id=module_key["account_id"], region_name=module_key["region"]
         )
     except Exception:
         _error_messaging(deployment, group, module)
@@ -178,4 +176,10 @@ def taint_module(
         type=mi.ModuleConst.BUNDLE,
         session=session,
     )
+    mi.invalidate_cached_module_info(
+        deployment=deployment,
+        group=group,
+        module=module,
+        cache_key=f"{module_key['account_id']}-{module_key['region']}",
+    )
     _logger.debug("Module %s-%s-%s marked for redeploy", module, group, deployment)
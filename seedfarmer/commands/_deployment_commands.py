@@ -18,7 +18,8 @@ import json
 import logging
 import os
 import threading
-from typing import Any, Dict, List, Optional, cast
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
 import yaml
 
@@ -37,10 +38,13 @@ from seedfarmer.mgmt.module_info import (
     get_deployspec_path,
     get_module_metadata,
     get_modulestack_path,
+    get_skipped_write_count,
+    invalidate_cached_module_info,
     remove_deployed_deployment_manifest,
     remove_deployment_manifest,
     write_deployment_manifest,
 )
+from seedfarmer.mgmt.module_state_store import check_remote_module_state_store
 from seedfarmer.models import DeploySpec
 from seedfarmer.models.deploy_responses import ModuleDeploymentResponse, StatusType
 from seedfarmer.models.manifests import DataFile, DeploymentManifest, ModuleManifest, ModulesManifest, NetworkMapping
@@ -61,6 +65,8 @@ from seedfarmer.utils import get_generic_module_deployment_role_name
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+_PLAN_MAX_WORKERS = 16
+
 
 def _process_git_module_path(module: ModuleManifest) -> None:
     working_dir, module_directory, commit_hash = sf_git.clone_module_repo(module.path)
@@ -171,6 +177,8 @@ def destroy_generic_module_deployment_role(
 
 def _execute_deploy(
     mdo: ModuleDeployObject,
+    build_limiter: Optional[du.BuildConcurrencyLimiter] = None,
+    module_info_index: Optional[du.ModuleInfoIndex] = None,
 ) -> ModuleDeploymentResponse:
     module_manifest = cast(
         ModuleManifest, mdo.deployment_manifest.get_module(str(mdo.group_name), str(mdo.module_name))
@@ -233,14 +241,32 @@ def _execute_deploy(
             module_manifest=module_manifest,
             account_id=account_id,
             region=region,
+            module_info=(
+                module_info_index.get_module_info(
+                    group=str(mdo.group_name), account_id=account_id, region=region, module_name=module_manifest.name
+                )
+                or {}
+                if module_info_index
+                else None
+            ),
         )
         if mdo.deployment_manifest.name
         else None
     )
-    return DeployModuleFactory().create(mdo).deploy_module()
+    try:
+        with build_limiter.acquire(account_id, region) if build_limiter else nullcontext():
+            return DeployModuleFactory().create(mdo).deploy_module()
+    finally:
+        # The build persists the md5 hashes and metadata of the module, in a process of its own
+        invalidate_cached_module_info(
+            cast(str, mdo.deployment_manifest.name), str(mdo.group_name), str(mdo.module_name), f"{account_id}-{region}"
+        )
 
 
-def _execute_destroy(mdo: ModuleDeployObject) -> Optional[ModuleDeploymentResponse]:
+def _execute_destroy(
+    mdo: ModuleDeployObject,
+    build_limiter: Optional[du.BuildConcurrencyLimiter] = None,
+) -> Optional[ModuleDeploymentResponse]:
     module_manifest = cast(
         ModuleManifest, mdo.deployment_manifest.get_module(str(mdo.group_name), str(mdo.module_name))
     )
@@ -306,7 +332,17 @@ def _execute_destroy(mdo: ModuleDeployObject) -> Optional[ModuleDeploymentRespon
         )
 
     mdo.module_role_arn = get_role_arn(role_name=mdo.module_role_name, session=session)
-    resp = DeployModuleFactory().create(mdo).destroy_module()
+    try:
+        with build_limiter.acquire(target_account_id, target_region) if build_limiter else nullcontext():
+            resp = DeployModuleFactory().create(mdo).destroy_module()
+    finally:
+        # The build removes the persisted data of the module, in a process of its own
+        invalidate_cached_module_info(
+            cast(str, mdo.deployment_manifest.name),
+            str(mdo.group_name),
+            str(mdo.module_name),
+            f"{target_account_id}-{target_region}",
+        )
 
     if resp.status == StatusType.SUCCESS.value and module_stack_exists:
         commands.destroy_module_stack(
@@ -321,11 +357,115 @@ def _execute_destroy(mdo: ModuleDeployObject) -> Optional[ModuleDeploymentRespon
     return resp
 
 
+def _verify_deploy_response(deploy_response: List[ModuleDeploymentResponse]) -> None:
+    _logger.debug(deploy_response)
+    (
+        print_modules_build_info("Build Info Debug Data", deploy_response)  # type: ignore
+        if _logger.isEnabledFor(logging.DEBUG)
+        else None
+    )
+    for dep_resp_object in deploy_response:
+        if dep_resp_object.status in ["ERROR", "error", "Error"]:
+            _logger.error("At least one module failed to deploy...exiting deployment")
+            print_errored_modules_build_info(
+                "These modules had errors deploying",
+                deploy_response,  # type: ignore
+            )
+            raise seedfarmer.errors.ModuleDeploymentError(
+                error_message="At least one module failed to deploy...exiting deployment"
+            )
+
+
+def _deploy_by_dependency(
+    deployment_manifest_wip: DeploymentManifest,
+    module_upstream_dep: Dict[str, List[str]],
+    build_limiter: Optional[du.BuildConcurrencyLimiter] = None,
+    module_info_index: Optional[du.ModuleInfoIndex] = None,
+) -> List[ModuleDeploymentResponse]:
+    """
+    Deploy all modules of the deployment_manifest_wip, starting each module as soon as the modules it
+    depends on have completed rather than waiting on the entire preceding group.  Modules without explicit
+    dependencies still wait on all preceding groups.  The number of modules in flight is capped by
+    `maxConcurrentModules` and the `concurrency` of each group.  Once a module fails, no new modules are
+    started and the modules in flight are allowed to complete.
+    """
+    dependency_graph = du.generate_deploy_dependency_graph(deployment_manifest_wip.groups, module_upstream_dep)
+    group_concurrency = {_group.name: _group.concurrency for _group in deployment_manifest_wip.groups}
+    pending: List[ModuleDeployObject] = [
+        ModuleDeployObject(
+            deployment_manifest=deployment_manifest_wip, group_name=_group.name, module_name=_module.name
+        )
+        for _group in deployment_manifest_wip.groups
+        for _module in _group.modules
+        if _module and _module.deploy_spec
+    ]
+    if not pending:
+        return []
+    max_workers = deployment_manifest_wip.max_concurrent_modules or len(pending)
+
+    def _exec_deploy(mdo: ModuleDeployObject) -> ModuleDeploymentResponse:
+        thread_name = threading.current_thread().name
+        threading.current_thread().name = (f"{thread_name}-{mdo.group_name}_{mdo.module_name}").replace("_", "-")
+        try:
+            return _execute_deploy(mdo, build_limiter, module_info_index)
+        finally:
+            threading.current_thread().name = thread_name
+
+    # Modules without a deployspec are not deployed, so the modules depending on them must not wait on them
+    completed: Set[str] = set(
+        [
+            f"{_group.name}-{_module.name}"
+            for _group in deployment_manifest_wip.groups
+            for _module in _group.modules
+            if _module and not _module.deploy_spec
+        ]
+    )
+    running: Dict[concurrent.futures.Future[ModuleDeploymentResponse], ModuleDeployObject] = {}
+    group_running: Dict[str, int] = {}
+    deploy_response: List[ModuleDeploymentResponse] = []
+    failed = False
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Deploy") as workers:
+        while pending or running:
+            for mdo in [] if failed else list(pending):
+                if len(running) >= max_workers:
+                    break
+                group_name = str(mdo.group_name)
+                limit = group_concurrency.get(group_name)
+                if limit and group_running.get(group_name, 0) >= limit:
+                    continue
+                if dependency_graph[f"{group_name}-{mdo.module_name}"].issubset(completed):
+                    _logger.debug("Dependencies satisfied, starting %s-%s", group_name, mdo.module_name)
+                    pending.remove(mdo)
+                    running[workers.submit(_exec_deploy, mdo)] = mdo
+                    group_running[group_name] = group_running.get(group_name, 0) + 1
+            if not running:
+                if pending and not failed:
+                    raise seedfarmer.errors.InvalidConfigurationError(
+                        "Unable to schedule modules due to a dependency cycle: "
+                        f"{[f'{m.group_name}-{m.module_name}' for m in pending]}"
+                    )
+                break
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                mdo = running.pop(future)
+                group_running[str(mdo.group_name)] -= 1
+                resp = future.result()
+                deploy_response.append(resp)
+                if resp.status in ["ERROR", "error", "Error"]:
+                    failed = True
+                else:
+                    completed.add(f"{mdo.group_name}-{mdo.module_name}")
+    return deploy_response
+
+
 def _deploy_validated_deployment(
     deployment_manifest: DeploymentManifest,
     deployment_manifest_wip: DeploymentManifest,
     groups_to_deploy: List[ModulesManifest],
     dryrun: bool,
+    module_upstream_dep: Optional[Dict[str, List[str]]] = None,
+    build_limiter: Optional[du.BuildConcurrencyLimiter] = None,
+    module_info_index: Optional[du.ModuleInfoIndex] = None,
 ) -> None:
     if groups_to_deploy:
         if dryrun:
@@ -348,44 +488,42 @@ def _deploy_validated_deployment(
             _logger.debug(
                 "DeploymentManifest for deploy after filter =  %s", json.dumps(deployment_manifest_wip.model_dump())
             )
-        for _group in deployment_manifest_wip.groups:
-            if len(_group.modules) > 0:
-                threads = _group.concurrency if _group.concurrency else len(_group.modules)
-                with concurrent.futures.ThreadPoolExecutor(max_workers=threads, thread_name_prefix="Deploy") as workers:
-
-                    def _exec_deploy(mdo: ModuleDeployObject) -> ModuleDeploymentResponse:
-                        threading.current_thread().name = (
-                            f"{threading.current_thread().name}-{mdo.group_name}_{mdo.module_name}"
-                        ).replace("_", "-")
-                        return _execute_deploy(mdo)
-
-                    mdos = []
-                    for _module in _group.modules:
-                        if _module and _module.deploy_spec:
-                            mdo = ModuleDeployObject(
-                                deployment_manifest=deployment_manifest_wip,
-                                group_name=_group.name,
-                                module_name=_module.name,
-                            )
-                            mdos.append(mdo)
-
-                    deploy_response = list(workers.map(_exec_deploy, mdos))
-                    _logger.debug(deploy_response)
-                    (
-                        print_modules_build_info("Build Info Debug Data", deploy_response)  # type: ignore
-                        if _logger.isEnabledFor(logging.DEBUG)
-                        else None
-                    )
-                    for dep_resp_object in deploy_response:
-                        if dep_resp_object.status in ["ERROR", "error", "Error"]:
-                            _logger.error("At least one module failed to deploy...exiting deployment")
-                            print_errored_modules_build_info(
-                                "These modules had errors deploying",
-                                deploy_response,  # type: ignore
-                            )
-                            raise seedfarmer.errors.ModuleDeploymentError(
-                                error_message="At least one module failed to deploy...exiting deployment"
-                            )
+        build_limiter = build_limiter if build_limiter else du.BuildConcurrencyLimiter(deployment_manifest_wip)
+        if deployment_manifest_wip.dependency_scheduling:
+            _logger.info("Scheduling module deployments by dependency")
+            deploy_response = _deploy_by_dependency(
+                deployment_manifest_wip=deployment_manifest_wip,
+                module_upstream_dep=module_upstream_dep if module_upstream_dep else {},
+                build_limiter=build_limiter,
+                module_info_index=module_info_index,
+            )
+            _verify_deploy_response(deploy_response)
+        else:
+            for _group in deployment_manifest_wip.groups:
+                if len(_group.modules) > 0:
+                    threads = _group.concurrency if _group.concurrency else len(_group.modules)
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=threads, thread_name_prefix="Deploy"
+                    ) as workers:
+
+                        def _exec_deploy(mdo: ModuleDeployObject) -> ModuleDeploymentResponse:
+                            threading.current_thread().name = (
+                                f"{threading.current_thread().name}-{mdo.group_name}_{mdo.module_name}"
+                            ).replace("_", "-")
+                            return _execute_deploy(mdo, build_limiter, module_info_index)
+
+                        mdos = []
+                        for _module in _group.modules:
+                            if _module and _module.deploy_spec:
+                                mdo = ModuleDeployObject(
+                                    deployment_manifest=deployment_manifest_wip,
+                                    group_name=_group.name,
+                                    module_name=_module.name,
+                                )
+                                mdos.append(mdo)
+
+                        deploy_response = list(workers.map(_exec_deploy, mdos))
+                        _verify_deploy_response(deploy_response)
 
         print_manifest_inventory(f"Modules Deployed: {deployment_manifest_wip.name}", deployment_manifest_wip, False)
     else:
@@ -529,6 +667,7 @@ def destroy_deployment(
     dryrun: bool = False,
     show_manifest: bool = False,
     remove_seedkit: bool = False,
+    build_limiter: Optional[du.BuildConcurrencyLimiter] = None,
 ) -> None:
     """
     destroy_deployment
@@ -557,6 +696,9 @@ def destroy_deployment(
         project use it!!  Use with caution!!
 
         By default False
+    build_limiter: BuildConcurrencyLimiter, optional
+        The limiter shared by all module builds of the deployment.  If not provided, one is created
+        from the limits in the destroy_manifest.
     """
     if not destroy_manifest.groups:
         print_bolded("Nothing to destroy", "white")
@@ -569,6 +711,7 @@ def destroy_deployment(
         f"Modules scheduled to be destroyed for: {destroy_manifest.name}", destroy_manifest, False, "red"
     )
     if not dryrun:
+        build_limiter = build_limiter if build_limiter else du.BuildConcurrencyLimiter(destroy_manifest)
         for _group in reversed(destroy_manifest.groups):
             if len(_group.modules) > 0:
                 threads = _group.concurrency if _group.concurrency else len(_group.modules)
@@ -580,7 +723,7 @@ def destroy_deployment(
                         threading.current_thread().name = (
                             f"{threading.current_thread().name}-{mdo.group_name}_{mdo.module_name}"
                         ).replace("_", "-")
-                        return _execute_destroy(mdo)
+                        return _execute_destroy(mdo, build_limiter)
 
                     mdos = []
                     for _module in _group.modules:
@@ -632,12 +775,78 @@ def destroy_deployment(
         print_manifest_json(destroy_manifest)
 
 
+def _plan_module(
+    deployment_manifest: DeploymentManifest,
+    deployment_manifest_wip: DeploymentManifest,
+    group_name: str,
+    module: ModuleManifest,
+    use_hash_cache: bool = True,
+) -> None:
+    _logger.debug("Working on -- %s", module)
+    if not module.path:
+        raise seedfarmer.errors.InvalidManifestError("Unable to parse module manifest, `path` not specified")
+
+    if module.path.startswith("git::"):
+        _process_git_module_path(module=module)
+    elif module.path.startswith("archive::"):
+        _process_archive_path(
+            module=module,
+            secret_name=deployment_manifest.archive_secret,
+        )
+
+    if module.data_files is not None:
+        _process_data_files(
+            data_files=module.data_files,
+            module_name=module.name,
+            group_name=group_name,
+            secret_name=deployment_manifest.archive_secret,
+        )
+
+    deployspec_path = get_deployspec_path(str(module.get_local_path()))
+    with open(deployspec_path, encoding="utf-8") as module_spec_file:
+        module.deploy_spec = DeploySpec(**yaml.safe_load(module_spec_file))
+
+    md5_excluded_module_files = [
+        "README.md",
+        "modulestack.template",
+        "setup.cfg",
+        "requirements-dev.txt",
+        "requirements-dev.in",
+        ".gitignore",
+    ]
+
+    # Walk the module once, the same inventory provides the bundle files if the module needs to build
+    file_inventory = checksum.ModuleInventory(
+        project_path=config.OPS_ROOT,
+        module_path=str(module.get_local_path()),
+        excluded_files=md5_excluded_module_files,
+    )
+    module.set_file_inventory(file_inventory)
+    module.set_use_hash_cache(use_hash_cache)
+    module.bundle_md5 = checksum.get_module_md5(
+        project_path=config.OPS_ROOT,
+        module_path=str(module.get_local_path()),
+        data_files=module.data_files,
+        use_cache=use_hash_cache,
+        inventory=file_inventory,
+    )
+    resolve_params_for_checksum(deployment_manifest=deployment_manifest_wip, module=module, group_name=group_name)
+
+    module.manifest_md5 = hashlib.md5(
+        json.dumps(module.model_dump(), sort_keys=True).encode("utf-8"),
+        usedforsecurity=False,
+    ).hexdigest()
+    module.deployspec_md5 = hashlib.md5(open(deployspec_path, "rb").read(), usedforsecurity=False).hexdigest()
+
+
 def deploy_deployment(
     deployment_manifest: DeploymentManifest,
     module_info_index: du.ModuleInfoIndex,
     module_upstream_dep: Dict[str, List[str]],
     dryrun: bool = False,
     show_manifest: bool = False,
+    build_limiter: Optional[du.BuildConcurrencyLimiter] = None,
+    use_hash_cache: bool = True,
 ) -> None:
     """
     deploy_deployment
@@ -663,6 +872,12 @@ def deploy_deployment(
         This flag indicates to print out the DeploymentManifest object as s dictionary.
 
         By default False
+    build_limiter: BuildConcurrencyLimiter, optional
+        The limiter shared by all module builds of the deployment.  If not provided, one is created
+        from the limits in the deployment_manifest.
+    use_hash_cache: bool, optional
+        Reuse the hashes of unchanged module files from the file hash cache of the project.
+        By default True
     """
     deployment_manifest_wip = deployment_manifest.model_copy()
     deployment_name = cast(str, deployment_manifest_wip.name)
@@ -676,63 +891,41 @@ def deploy_deployment(
         _logger.warn("You have configured your deployment to FORCE all dependent modules to redeploy")
         _logger.debug(f"Upstream Module Dependencies : {json.dumps(module_upstream_dep, indent=4)}")
 
-    groups_to_deploy = []
-    unchanged_modules = []
-    _group_mod_to_deploy: List[str] = []
     for group in deployment_manifest_wip.groups:
-        modules_to_deploy = []
         _logger.info(" Verifying all modules in %s for deploy ", group.name)
         du.validate_group_parameters(group=group)
-        for module in group.modules:
-            _logger.debug("Working on -- %s", module)
-            if not module.path:
-                raise seedfarmer.errors.InvalidManifestError("Unable to parse module manifest, `path` not specified")
-
-            if module.path.startswith("git::"):
-                _process_git_module_path(module=module)
-            elif module.path.startswith("archive::"):
-                _process_archive_path(
-                    module=module,
-                    secret_name=deployment_manifest.archive_secret,
-                )
-
-            if module.data_files is not None:
-                _process_data_files(
-                    data_files=module.data_files,
-                    module_name=module.name,
-                    group_name=group.name,
-                    secret_name=deployment_manifest.archive_secret,
-                )
 
-            deployspec_path = get_deployspec_path(str(module.get_local_path()))
-            with open(deployspec_path, encoding="utf-8") as module_spec_file:
-                module.deploy_spec = DeploySpec(**yaml.safe_load(module_spec_file))
-
-            md5_excluded_module_files = [
-                "README.md",
-                "modulestack.template",
-                "setup.cfg",
-                "requirements-dev.txt",
-                "requirements-dev.in",
-                ".gitignore",
-            ]
-
-            module.bundle_md5 = checksum.get_module_md5(
-                project_path=config.OPS_ROOT,
-                module_path=str(module.get_local_path()),
-                data_files=module.data_files,
-                excluded_files=md5_excluded_module_files,
-            )
-            resolve_params_for_checksum(
-                deployment_manifest=deployment_manifest_wip, module=module, group_name=group.name
-            )
+    # Fetch, checksum and resolve all modules concurrently.  Each module only updates its own ModuleManifest,
+    # so the results do not depend on the order in which the modules complete
+    modules_to_plan = [(group.name, module) for group in deployment_manifest_wip.groups for module in group.modules]
+    if modules_to_plan:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(_PLAN_MAX_WORKERS, len(modules_to_plan)), thread_name_prefix="Plan"
+        ) as workers:
+
+            def _plan(args: Tuple[str, ModuleManifest]) -> None:
+                thread_name = threading.current_thread().name
+                threading.current_thread().name = (f"{thread_name}-{args[0]}_{args[1].name}").replace("_", "-")
+                try:
+                    _plan_module(
+                        deployment_manifest=deployment_manifest,
+                        deployment_manifest_wip=deployment_manifest_wip,
+                        group_name=args[0],
+                        module=args[1],
+                        use_hash_cache=use_hash_cache,
+                    )
+                finally:
+                    threading.current_thread().name = thread_name
 
-            module.manifest_md5 = hashlib.md5(
-                json.dumps(module.model_dump(), sort_keys=True).encode("utf-8"),
-                usedforsecurity=False,
-            ).hexdigest()
-            module.deployspec_md5 = hashlib.md5(open(deployspec_path, "rb").read(), usedforsecurity=False).hexdigest()
+            _ = list(workers.map(_plan, modules_to_plan))
+        checksum.save_hash_caches()
 
+    groups_to_deploy = []
+    unchanged_modules = []
+    _group_mod_to_deploy: List[str] = []
+    for group in deployment_manifest_wip.groups:
+        modules_to_deploy = []
+        for module in group.modules:
             _build_module = du.need_to_build(
                 deployment_name=deployment_name,
                 group_name=group.name,
@@ -768,12 +961,19 @@ def deploy_deployment(
         if unchanged_modules
         else None
     )
-    _deploy_validated_deployment(
-        deployment_manifest=deployment_manifest,
-        deployment_manifest_wip=deployment_manifest_wip,
-        groups_to_deploy=groups_to_deploy,
-        dryrun=dryrun,
-    )
+    try:
+        _deploy_validated_deployment(
+            deployment_manifest=deployment_manifest,
+            deployment_manifest_wip=deployment_manifest_wip,
+            groups_to_deploy=groups_to_deploy,
+            dryrun=dryrun,
+            module_upstream_dep=module_upstream_dep,
+            build_limiter=build_limiter,
+            module_info_index=module_info_index,
+        )
+    finally:
+        # The bundles of the deployed modules reuse and add file hashes as well
+        checksum.save_hash_caches()
     print_bolded(f"To see all deployed modules, run seedfarmer list modules -d {deployment_name}")
     print_manifest_json(deployment_manifest) if show_manifest else None
 
@@ -793,6 +993,7 @@ def apply(
     update_seedkit: bool = False,
     update_project_policy: bool = False,
     local: bool = False,
+    use_hash_cache: bool = True,
 ) -> None:
     """
     apply
@@ -826,9 +1027,9 @@ def apply(
 
         By default False
     enable_session_timeout: bool
-        If enabled, boto3 Sessions will be reset on the timeout interval
+        If enabled, boto3 Session credentials close to expiry are refreshed on the timeout interval
     session_timeout_interval: int
-        The interval, in seconds, to reset boto3 Sessions
+        The interval, in seconds, to refresh boto3 Sessions close to expiry
     update_seedkit: bool
         Force update run of seedkit, defaults to False
     update_project_policy: bool
@@ -837,6 +1038,9 @@ def apply(
         If set to true, use the credentials of active session and do not
         use the seedfarmer roles
         By default False
+    use_hash_cache: bool
+        Reuse the hashes of unchanged module files from the file hash cache of the project,
+        defaults to True
 
     Raises
     ------
@@ -860,6 +1064,8 @@ def apply(
 
     deployment_manifest = DeploymentManifest(**manifest_input)
     _logger.debug(deployment_manifest.model_dump())
+    if not DeployModuleFactory.is_local():
+        check_remote_module_state_store()
 
     # Initialize the SessionManager for the entire project
     session_manager = SessionManager().get_or_create(
@@ -937,11 +1143,14 @@ def apply(
         )
         raise seedfarmer.errors.InvalidConfigurationError("Modules cannot be destroyed due to dependencies")
 
+    # Share the build limits across the destroy and deploy of modules
+    build_limiter = du.BuildConcurrencyLimiter(deployment_manifest)
     destroy_deployment(
         destroy_manifest=destroy_manifest,
         remove_deploy_manifest=False,
         dryrun=dryrun,
         show_manifest=show_manifest,
+        build_limiter=build_limiter,
     )
     deploy_deployment(
         deployment_manifest=deployment_manifest,
@@ -949,7 +1158,11 @@ def apply(
         module_upstream_dep=module_depends_on_dict,
         dryrun=dryrun,
         show_manifest=show_manifest,
+        build_limiter=build_limiter,
+        use_hash_cache=use_hash_cache,
     )
+    if get_skipped_write_count():
+        _logger.info("Skipped %s writes of unchanged deployment and module info", get_skipped_write_count())
 
 
 @bind_session_mgr
@@ -1000,9 +1213,9 @@ def destroy(
 
         By default False
     enable_session_timeout: bool
-        If enabled, boto3 Sessions will be reset on the timeout interval
+        If enabled, boto3 Session credentials close to expiry are refreshed on the timeout interval
     session_timeout_interval: int
-        The interval, in seconds, to reset boto3 Sessions
+        The interval, in seconds, to refresh boto3 Sessions close to expiry
     local: bool
         If set to true, use the credentials of active session and do not
         use the seedfarmer roles
@@ -1018,6 +1231,8 @@ def destroy(
     """
     project = config.PROJECT
     _logger.debug("Preparing to destroy %s", deployment_name)
+    if not DeployModuleFactory.is_local():
+        check_remote_module_state_store()
 
     session_manager = SessionManager().get_or_create(
         project_name=project,
@@ -12,11 +12,12 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import hashlib
 import logging
 import random
 import string
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Union
 
 from boto3 import Session
 
@@ -28,9 +29,14 @@ from seedfarmer.error_handler import log_error_safely
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+# Content addressed bundles expire with the "SeedFarmerBundles" lifecycle rule of the seedkit bucket.
+# Bundles uploaded longer ago than the max age are uploaded again so they do not expire during a build.
+CONTENT_ADDRESSED_BUNDLE_PREFIX = "seedfarmer/bundles"
+_CONTENT_ADDRESSED_BUNDLE_MAX_AGE = timedelta(days=6)
+
 
 def _print_codebuild_logs(
-    events: List[cloudwatch.CloudWatchEvent],
+    events: Iterable[cloudwatch.CloudWatchEvent],
     codebuild_log_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     for event in events:
@@ -46,25 +52,63 @@ def _wait_execution(
     codebuild_log_callback: Optional[Callable[[str], None]] = None,
     session: Optional[Union[Callable[[], Session], Session]] = None,
 ) -> Optional[codebuild.BuildInfo]:
-    start_time: Optional[datetime] = None
-    stream_name: Optional[str] = None
+    log_tailer: Optional[cloudwatch.LogTailer] = None
     status: Optional[codebuild.BuildInfo] = None
     for status in codebuild.wait(build_id=build_id, session=session):
         if status.logs.enabled and status.logs.group_name:
-            if stream_name is None:
+            if log_tailer is None:
                 stream_name = cloudwatch.get_stream_name_by_prefix(
                     group_name=status.logs.group_name, prefix=f"{stream_name_prefix}/", session=session
                 )
-            if stream_name is not None:
-                events = cloudwatch.get_log_events(
-                    group_name=status.logs.group_name, stream_name=stream_name, start_time=start_time, session=session
-                )
-                _print_codebuild_logs(events=events.events, codebuild_log_callback=codebuild_log_callback)
-                if events.last_timestamp is not None:
-                    start_time = events.last_timestamp + timedelta(milliseconds=1)
+                if stream_name is not None:
+                    log_tailer = cloudwatch.LogTailer(
+                        group_name=status.logs.group_name, stream_name=stream_name, session=session
+                    )
+            if log_tailer is not None:
+                _print_codebuild_logs(events=log_tailer.tail(), codebuild_log_callback=codebuild_log_callback)
     return status
 
 
+def _bundle_digest(bundle_path: Union[str, IO[bytes]]) -> str:
+    hash = hashlib.sha256()
+    if isinstance(bundle_path, str):
+        with open(bundle_path, "rb") as bundle_file:
+            for block in iter(lambda: bundle_file.read(1024 * 1024), b""):
+                hash.update(block)
+    else:
+        for block in iter(lambda: bundle_path.read(1024 * 1024), b""):
+            hash.update(block)
+        bundle_path.seek(0)
+    return hash.hexdigest()
+
+
+def _upload_bundle(
+    bundle_path: Union[str, IO[bytes]],
+    bucket: str,
+    key: str,
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+) -> None:
+    # The bundle is either the path of the zip or a file object of a streamed zip
+    if isinstance(bundle_path, str):
+        s3.upload_file(src=bundle_path, bucket=bucket, key=key, session=session)
+    else:
+        s3.upload_fileobj(fileobj=bundle_path, bucket=bucket, key=key, session=session)
+
+
+def _upload_content_addressed_bundle(
+    bundle_path: Union[str, IO[bytes]],
+    bucket: str,
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+) -> str:
+    key = f"{CONTENT_ADDRESSED_BUNDLE_PREFIX}/{_bundle_digest(bundle_path)}.zip"
+    last_modified = s3.get_object_last_modified(bucket=bucket, key=key, session=session)
+    if last_modified is not None and datetime.now(timezone.utc) - last_modified < _CONTENT_ADDRESSED_BUNDLE_MAX_AGE:
+        _logger.debug("Bundle already uploaded to %s/%s, skipping upload", bucket, key)
+    else:
+        _upload_bundle(bundle_path=bundle_path, bucket=bucket, key=key, session=session)
+    return key
+
+
 def _execute_codebuild(
     stack_outputs: Dict[str, str],
     bundle_location: str,
@@ -99,7 +143,7 @@ def _execute_codebuild(
 
 def run(
     stack_outputs: Dict[str, str],
-    bundle_path: str,
+    bundle_path: Union[str, IO[bytes]],
     buildspec: Dict[str, Any],
     timeout: int,
     overrides: Optional[Dict[str, Any]] = None,
@@ -108,6 +152,7 @@ def run(
     bundle_id: Optional[str] = None,
     prebuilt_bundle: Optional[str] = None,
     yaml_dumper: Optional[Any] = None,  # Accepts ruamel.yaml.YAML instance or PyYAML dump function
+    content_addressed_bundle: bool = False,
 ) -> Optional[codebuild.BuildInfo]:
     execution_id = "".join(random.choice(string.ascii_lowercase) for i in range(8))
 
@@ -117,14 +162,18 @@ def run(
         loc = f"{o[0]}/{o[1]}"
     else:
         try:
-            key: str = (
-                f"seedfarmer/{bundle_id}/{execution_id}/bundle.zip"
-                if bundle_id
-                else f"seedfarmer/{execution_id}/bundle.zip"
-            )
             bucket = stack_outputs["Bucket"]
-            s3.delete_objects(bucket=bucket, keys=[key], session=session)
-            s3.upload_file(src=bundle_path, bucket=bucket, key=key, session=session)
+            if content_addressed_bundle:
+                # Identical bundles share a key, they are only uploaded once and cleaned up by the bucket lifecycle
+                key = _upload_content_addressed_bundle(bundle_path=bundle_path, bucket=bucket, session=session)
+            else:
+                key = (
+                    f"seedfarmer/{bundle_id}/{execution_id}/bundle.zip"
+                    if bundle_id
+                    else f"seedfarmer/{execution_id}/bundle.zip"
+                )
+                s3.delete_objects(bucket=bucket, keys=[key], session=session)
+                _upload_bundle(bundle_path=bundle_path, bucket=bucket, key=key, session=session)
             loc = f"{bucket}/{key}"
         except Exception as e:
             log_error_safely(
@@ -152,8 +201,8 @@ def run(
         _logger.error(f"CodeBuild execution failed: {e}")
         raise seedfarmer.errors.RemoteDeploymentRuntimeError(f"CodeBuild execution failed: {e}")
     finally:
-        # Clean up S3 bundle even if execution failed (unless it's prebuilt)
-        if not prebuilt_bundle:
+        # Clean up S3 bundle even if execution failed (unless it's prebuilt or content addressed)
+        if not prebuilt_bundle and not content_addressed_bundle:
             try:
                 s3.delete_objects(bucket=bucket, keys=[key], session=session)
             except Exception as e:
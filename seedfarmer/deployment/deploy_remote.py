@@ -21,6 +21,7 @@ import seedfarmer
 import seedfarmer.deployment.codebuild_remote as codebuild_remote
 import seedfarmer.errors
 import seedfarmer.mgmt.bundle as bundle
+import seedfarmer.mgmt.bundle_cache as bundle_cache
 import seedfarmer.services._codebuild as codebuild
 from seedfarmer import config
 from seedfarmer.commands._runtimes import get_runtimes
@@ -199,7 +200,14 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
         cmds_install = self._codebuild_install_commands(module_manifest, stack_outputs, runtime_versions)
 
         try:
-            bundle_zip = bundle.generate_bundle(dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id)
+            file_inventory = module_manifest.get_file_inventory()
+            bundle_zip = bundle_cache.get_bundle(
+                project_path=config.OPS_ROOT,
+                dirs=dirs_tuples,
+                files=files_tuples,
+                dir_files={"module": file_inventory.bundle_files} if file_inventory else None,
+                use_hash_cache=module_manifest.get_use_hash_cache(),
+            )
         except Exception as e:
             log_error_safely(_logger, e, f"Failed to generate deployment bundle for {module_manifest.name}")
             _logger.error(f"Bundle generation failed for module {module_manifest.name}: {e}")
@@ -278,6 +286,7 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 bundle_id=bundle_id,
                 prebuilt_bundle=None,  # NEVER CHECK FOR THIS BUNDLE ON DEPLOY
                 yaml_dumper=yaml,
+                content_addressed_bundle=bool(self.mdo.deployment_manifest.content_addressed_bundles),
             )
         except Exception as e:
             log_error_safely(_logger, e, f"Remote deployment failed for module {module_manifest.name}")
@@ -285,6 +294,8 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
             raise seedfarmer.errors.ModuleDeploymentError(
                 f"Remote deployment execution failed for module {module_manifest.name}: {e}"
             )
+        finally:
+            bundle_zip.close()
 
         bi = cast(codebuild.BuildInfo, build_info)
         deploy_info = {
@@ -366,7 +377,7 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 if extra_files is not None:
                     extra_file_bundle.update(extra_files)  # type: ignore [arg-type]
                 files_tuples = [(v, f"{k}") for k, v in extra_file_bundle.items()]
-                bundle_zip = bundle.generate_bundle(dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id)
+                bundle_zip = bundle.stream_bundle(dirs=dirs_tuples, files=files_tuples)
             except Exception as e:
                 log_error_safely(_logger, e, f"Failed to generate destroy bundle for {module_manifest.name}")
                 _logger.error(f"Destroy bundle generation failed for module {module_manifest.name}: {e}")
@@ -436,7 +447,7 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
         try:
             build_info = codebuild_remote.run(
                 stack_outputs=stack_outputs,  # type: ignore [arg-type]
-                bundle_path=str(bundle_zip),
+                bundle_path=bundle_zip if bundle_zip is not None else "",
                 buildspec=buildspec,
                 timeout=90,
                 overrides=overrides,
@@ -446,6 +457,7 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 .get_deployment_session(account_id=account_id, region_name=region),
                 bundle_id=bundle_id,
                 prebuilt_bundle=prebuilt_bundle,
+                content_addressed_bundle=bool(self.mdo.deployment_manifest.content_addressed_bundles),
             )
         except Exception as e:
             log_error_safely(_logger, e, f"Remote destroy failed for module {module_manifest.name}")
@@ -453,6 +465,9 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
             raise seedfarmer.errors.ModuleDeploymentError(
                 f"Remote destroy execution failed for module {module_manifest.name}: {e}"
             )
+        finally:
+            if bundle_zip is not None:
+                bundle_zip.close()
 
         bi = cast(codebuild.BuildInfo, build_info)
         deploy_info = {
@@ -34,6 +34,7 @@ from seedfarmer.errors import InvalidConfigurationError
 from seedfarmer.services._secrets_manager import get_secrets_manager_value
 from seedfarmer.services._service_utils import create_signed_request
 from seedfarmer.services.session_manager import SessionManager
+from seedfarmer.utils import get_path_lock
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -133,23 +134,25 @@ def _get_release_with_link(archive_url: str, secret_name: Optional[str]) -> Tupl
     archive_name = parsed_url.path.replace("/", "_")
     extracted_dir = parsed_url.path.replace(".tar.gz", "").replace(".zip", "").replace("/", "_")
 
-    if os.path.isdir(os.path.join(parent_dir, extracted_dir)):
-        return os.path.join(parent_dir, extracted_dir), module
-    else:
-        resp = _download_archive(
-            archive_url=parsed_url._replace(fragment="", query="").geturl(),
-            secret_name=secret_name,
-        )
-
-        if resp.status_code == 200:
-            return _process_archive(archive_name, resp, extracted_dir), module
-
+    # Modules sharing an archive share the extracted_dir, only one thread may download and extract it
+    with get_path_lock(os.path.join(parent_dir, extracted_dir)):
+        if os.path.isdir(os.path.join(parent_dir, extracted_dir)):
+            return os.path.join(parent_dir, extracted_dir), module
         else:
-            _logger.error(f"Error fetching archive at {archive_url}: {resp.status_code} {resp.reason}")
-            raise InvalidConfigurationError(
-                f"Error fetching archive at {archive_url}: {resp.status_code} {resp.reason}"
+            resp = _download_archive(
+                archive_url=parsed_url._replace(fragment="", query="").geturl(),
+                secret_name=secret_name,
             )
 
+            if resp.status_code == 200:
+                return _process_archive(archive_name, resp, extracted_dir), module
+
+            else:
+                _logger.error(f"Error fetching archive at {archive_url}: {resp.status_code} {resp.reason}")
+                raise InvalidConfigurationError(
+                    f"Error fetching archive at {archive_url}: {resp.status_code} {resp.reason}"
+                )
+
 
 def fetch_archived_module(release_path: str, secret_name: Optional[str] = None) -> Tuple[str, str]:
     """
@@ -17,9 +17,10 @@ import logging
 import os
 import pathlib
 import shutil
+import tempfile
 import zipfile
 from pprint import pformat
-from typing import List, MutableSet, Optional, Tuple
+from typing import IO, Dict, List, MutableSet, Optional, Tuple
 
 from seedfarmer import CLI_ROOT
 from seedfarmer.utils import create_output_dir
@@ -39,6 +40,17 @@ BUNDLE_IGNORED_FILE_PATHS: MutableSet[str] = {
 
 BUNDLE_ALLOWED_HIDDEN_FILE_PATHS: MutableSet[str] = {".python-version"}
 
+# Bundles larger than this are spooled to a temporary file instead of memory
+BUNDLE_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# The support scripts added to the root of every bundle
+_BUNDLE_RESOURCE_FILES = ["retrieve_docker_creds.py", "pypi_mirror_support.py", "npm_mirror_support.py"]
+
+# Streamed bundles are reproducible, every entry has the same timestamp and one of two permissions
+_BUNDLE_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_BUNDLE_ZIP_FILE_MODE = 0o100644
+_BUNDLE_ZIP_EXECUTABLE_MODE = 0o100755
+
 
 def _is_valid_image_file(file_path: str, allowed_hidden_files: Optional[List[str]] = None) -> bool:
     if not all([word not in file_path for word in BUNDLE_IGNORED_FILE_PATHS]):
@@ -53,32 +65,45 @@ def _is_valid_image_file(file_path: str, allowed_hidden_files: Optional[List[str
     return True
 
 
-def _list_files(path: str) -> List[str]:
-    # Use a pattern that includes hidden files
-    all_files_pattern = os.path.join(path, "**", "*")
-    hidden_files_pattern = os.path.join(path, "**", ".*")
-
-    files = []
-
-    # Get all regular files
-    files.extend(
-        [
-            f
-            for f in glob.iglob(all_files_pattern, recursive=True)
-            if os.path.isfile(f) and _is_valid_image_file(file_path=f)
-        ]
-    )
+def _is_ignored_dir(dir_path: str) -> bool:
+    # True when every file under the directory fails _is_valid_image_file, so it can be pruned
+    dir_path = f"{dir_path}{os.sep}"
+    return any(word in dir_path for word in BUNDLE_IGNORED_FILE_PATHS if word.endswith("/") or "/" not in word)
 
-    # Get all hidden files
-    files.extend(
-        [
-            f
-            for f in glob.iglob(hidden_files_pattern, recursive=True)
-            if os.path.isfile(f) and _is_valid_image_file(file_path=f)
-        ]
-    )
 
-    return list(set(files))
+def _is_valid_dir_file(file_path: str) -> bool:
+    # _is_valid_image_file for a file whose directory is already known not to be ignored
+    filename = os.path.basename(file_path)
+    for word in BUNDLE_IGNORED_FILE_PATHS:
+        if "/" not in word:
+            if word in filename:
+                return False
+        elif not word.endswith("/") and word in file_path:
+            return False
+    if filename.startswith("."):
+        return filename in BUNDLE_ALLOWED_HIDDEN_FILE_PATHS
+    return True
+
+
+def _walk_files(path: str, files: List[str]) -> None:
+    # Hidden directories are never bundled
+    subfolders: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if _is_valid_dir_file(entry.path):
+                    files.append(entry.path)
+            elif entry.is_dir() and not entry.name.startswith(".") and not _is_ignored_dir(entry.path):
+                subfolders.append(entry.path)
+    for subfolder in subfolders:
+        _walk_files(subfolder, files)
+
+
+def _list_files(path: str) -> List[str]:
+    files: List[str] = []
+    if not _is_ignored_dir(path):
+        _walk_files(path, files)
+    return files
 
 
 def _make_zipfile(
@@ -128,7 +153,12 @@ def _make_zipfile(
     return zip_filename
 
 
-def generate_dir(out_dir: str, dir: str, name: str) -> str:
+def generate_dir(out_dir: str, dir: str, name: str, files: Optional[List[str]] = None) -> str:
+    """Copy the files of 'dir' to 'out_dir'/'name'
+
+    'files' are the paths relative to 'dir' of the files to copy, as listed by a
+    ``seedfarmer.checksum.ModuleInventory``.  If not provided, they are listed from 'dir'.
+    """
     absolute_dir = os.path.realpath(dir)
     final_dir = os.path.realpath(os.path.join(out_dir, name))
     _logger.debug("absolute_dir: %s", absolute_dir)
@@ -137,7 +167,7 @@ def generate_dir(out_dir: str, dir: str, name: str) -> str:
     shutil.rmtree(final_dir)
 
     _logger.debug("Copying files to %s", final_dir)
-    files: List[str] = _list_files(path=absolute_dir)
+    files = [os.path.join(absolute_dir, f) for f in files] if files is not None else _list_files(path=absolute_dir)
     if len(files) == 0:
         raise ValueError(f"{name} ({absolute_dir}) is empty!")
     for file in files:
@@ -158,7 +188,13 @@ def generate_bundle(
     files: Optional[List[Tuple[str, str]]] = None,
     bundle_id: Optional[str] = None,
     path_override: Optional[str] = None,
+    dir_files: Optional[Dict[str, List[str]]] = None,
 ) -> str:
+    """Generate the bundle zip of the directories and files
+
+    'dir_files' maps the name of a directory in 'dirs' to the files to copy from it, relative
+    to the directory.  Directories without an entry have their files listed when copied.
+    """
     bundle_dir = (
         create_output_dir(f"{bundle_id}/bundle", path_override)
         if bundle_id
@@ -166,30 +202,19 @@ def generate_bundle(
     )
     remote_dir = os.path.dirname(bundle_dir)
 
-    # Add the docker login script
-    shutil.copy(
-        src=os.path.join(CLI_ROOT, "resources/retrieve_docker_creds.py"),
-        dst=os.path.join(bundle_dir, "retrieve_docker_creds.py"),
-    )
-
-    # Add the pypi credentials support
-    shutil.copy(
-        src=os.path.join(CLI_ROOT, "resources/pypi_mirror_support.py"),
-        dst=os.path.join(bundle_dir, "pypi_mirror_support.py"),
-    )
-
-    # Add the npm credentials support
-    shutil.copy(
-        src=os.path.join(CLI_ROOT, "resources/npm_mirror_support.py"),
-        dst=os.path.join(bundle_dir, "npm_mirror_support.py"),
-    )
+    # Add the docker login script and the pypi and npm credentials support
+    for resource_file in _BUNDLE_RESOURCE_FILES:
+        shutil.copy(
+            src=os.path.join(CLI_ROOT, f"resources/{resource_file}"),
+            dst=os.path.join(bundle_dir, resource_file),
+        )
 
     _logger.debug(f"generate_bundle dirs={dirs}")
     # Extra Directories
     if dirs is not None:
         for dir, name in dirs:
             _logger.debug(f"***dir={dir}:name={name}")
-            generate_dir(out_dir=bundle_dir, dir=dir, name=name)
+            generate_dir(out_dir=bundle_dir, dir=dir, name=name, files=(dir_files or {}).get(name))
 
     if files is not None:
         for src_file, name in files:
@@ -208,6 +233,92 @@ def generate_bundle(
     return zip_file
 
 
+def _bundle_entries(
+    dirs: Optional[List[Tuple[str, str]]] = None,
+    files: Optional[List[Tuple[str, str]]] = None,
+    dir_files: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, str]:
+    # The source file of each path in the bundle, later entries replace earlier ones as when copied
+    entries = {
+        resource_file: os.path.join(CLI_ROOT, f"resources/{resource_file}") for resource_file in _BUNDLE_RESOURCE_FILES
+    }
+    if dirs is not None:
+        for dir, name in dirs:
+            absolute_dir = os.path.realpath(dir)
+            relative_files = (dir_files or {}).get(name)
+            if relative_files is None:
+                relative_files = [os.path.relpath(f, absolute_dir) for f in _list_files(path=absolute_dir)]
+            if len(relative_files) == 0:
+                raise ValueError(f"{name} ({absolute_dir}) is empty!")
+            for relative_file in relative_files:
+                entries[os.path.join(name, relative_file)] = os.path.join(absolute_dir, relative_file)
+    if files is not None:
+        for src_file, name in files:
+            entries[name] = src_file
+    return entries
+
+
+def _entry_mode(src_file: str) -> int:
+    return _BUNDLE_ZIP_EXECUTABLE_MODE if os.access(src_file, os.X_OK) else _BUNDLE_ZIP_FILE_MODE
+
+
+def _write_bundle_zip(entries: Dict[str, str], fileobj: IO[bytes]) -> None:
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name in sorted(entries):
+            src_file = entries[name]
+            _logger.debug("adding '%s' as '%s'", src_file, name)
+            zinfo = zipfile.ZipInfo(
+                pathlib.Path(os.path.join("bundle", name)).as_posix(), date_time=_BUNDLE_ZIP_DATE_TIME
+            )
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            # The size lets zipfile decide up front whether the entry needs zip64
+            zinfo.file_size = os.path.getsize(src_file)
+            zinfo.external_attr = _entry_mode(src_file) << 16
+            with open(src_file, "rb") as src, zf.open(zinfo, "w") as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def stream_bundle(
+    dirs: Optional[List[Tuple[str, str]]] = None,
+    files: Optional[List[Tuple[str, str]]] = None,
+    dir_files: Optional[Dict[str, List[str]]] = None,
+    fileobj: Optional[IO[bytes]] = None,
+) -> IO[bytes]:
+    """Zip the bundle directly from the source files, without staging copies of them
+
+    The zip has the same contents as the one of ``generate_bundle``.  It is reproducible, the entries
+    are sorted and have a fixed timestamp and permissions, so the same files always zip to the same bytes.
+
+    Parameters
+    ----------
+    dirs : Optional[List[Tuple[str, str]]]
+        The directories to add, as (source directory, name in the bundle)
+    files : Optional[List[Tuple[str, str]]]
+        The files to add, as (source file, name in the bundle)
+    dir_files : Optional[Dict[str, List[str]]]
+        The files of a directory in 'dirs' by name, relative to the directory.
+        Directories without an entry have their files listed when zipped.
+    fileobj : Optional[IO[bytes]]
+        A seekable binary file object to write the zip to, such as an ``io.BytesIO``.  By default,
+        a temporary file held in memory until it exceeds ``BUNDLE_SPOOL_MAX_SIZE``
+
+    Returns
+    -------
+    IO[bytes]
+        The file object with the zip, positioned at the start.  The caller closes it.
+    """
+    entries = _bundle_entries(dirs=dirs, files=files, dir_files=dir_files)
+    bundle_file = fileobj if fileobj is not None else tempfile.SpooledTemporaryFile(max_size=BUNDLE_SPOOL_MAX_SIZE)
+    try:
+        _write_bundle_zip(entries=entries, fileobj=bundle_file)
+    except Exception:
+        if fileobj is None:
+            bundle_file.close()
+        raise
+    bundle_file.seek(0)
+    return bundle_file
+
+
 def extract_zip(zip_path: str, extract_to: str) -> None:
     """
     Extracts a zip file to the specified directory.
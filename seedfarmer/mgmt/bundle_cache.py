@@ -0,0 +1,128 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import hashlib
+import logging
+import os
+import threading
+from threading import Lock
+from typing import IO, Dict, List, Optional, Tuple
+
+import seedfarmer.checksum as checksum
+import seedfarmer.mgmt.bundle as bundle
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+BUNDLE_CACHE_DIR = "bundle-cache"
+# The least recently used bundles are evicted once the cache is larger than this
+BUNDLE_CACHE_MAX_SIZE = 2 * 1024 * 1024 * 1024
+
+_cache_lock = Lock()
+
+
+def _bundle_key(entries: Dict[str, str], hash_cache: Optional[checksum.FileHashCache]) -> str:
+    # Every entry is part of the key, the bundle has files the module md5 does not (seedfarmer.yaml,
+    # the resource scripts and files in .gitignore), and the hash cache spares reading unchanged files.
+    # The mode of the entry is in the key too, it changes with the executable bit but not the content.
+    hash_file = hash_cache.get_file_hash if hash_cache else checksum._generate_file_hash
+    hash = hashlib.md5(usedforsecurity=False)
+    for name in sorted(entries):
+        src_file = entries[name]
+        hash.update(f"{name}\0{hash_file(src_file)}\0{bundle._entry_mode(src_file):o}\n".encode("utf-8"))
+    return hash.hexdigest()
+
+
+def _evict(cache_dir: str, max_size: int, keep: str) -> None:
+    bundles: List[Tuple[float, int, str]] = []
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".zip"):
+                st = entry.stat()
+                bundles.append((st.st_mtime, st.st_size, entry.path))
+    total_size = sum(size for _, size, _ in bundles)
+    for _, size, path in sorted(bundles):
+        if total_size <= max_size:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+            total_size -= size
+            _logger.debug("Evicted cached bundle %s", path)
+        except OSError as e:
+            _logger.debug("Unable to evict cached bundle %s: %s", path, e)
+
+
+def get_bundle(
+    project_path: str,
+    dirs: Optional[List[Tuple[str, str]]] = None,
+    files: Optional[List[Tuple[str, str]]] = None,
+    dir_files: Optional[Dict[str, List[str]]] = None,
+    max_size: int = BUNDLE_CACHE_MAX_SIZE,
+    use_hash_cache: bool = True,
+) -> IO[bytes]:
+    """
+    Get the reproducible bundle zip of the directories and files from the local bundle cache
+
+    The bundle is keyed by the content of all of its files, including the injected resource scripts.
+    A bundle of unchanged files, such as one of a tainted or force redeployed module, is reused instead of
+    zipped again.  The cache is kept under .seedfarmer.out of the project and the least recently used
+    bundles are evicted once it is larger than max_size.
+
+    Parameters
+    ----------
+    project_path : str
+       The OPS_ROOT full path (full path of the project)
+    dirs : Optional[List[Tuple[str, str]]]
+        The directories to add, as (source directory, name in the bundle)
+    files : Optional[List[Tuple[str, str]]]
+        The files to add, as (source file, name in the bundle)
+    dir_files : Optional[Dict[str, List[str]]]
+        The files of a directory in 'dirs' by name, relative to the directory
+    max_size : int, optional
+        The size in bytes the cache is evicted down to, by default BUNDLE_CACHE_MAX_SIZE
+    use_hash_cache : bool, optional
+        Reuse the hashes of unchanged files from the file hash cache of the project to key the bundle,
+        by default True
+
+    Returns
+    -------
+    IO[bytes]
+        The opened bundle zip.  The caller closes it.
+    """
+    entries = bundle._bundle_entries(dirs=dirs, files=files, dir_files=dir_files)
+    key = _bundle_key(entries, checksum.get_hash_cache(project_path) if use_hash_cache else None)
+
+    cache_dir = os.path.join(os.path.abspath(project_path), checksum.HASH_CACHE_DIR, BUNDLE_CACHE_DIR)
+    bundle_path = os.path.join(cache_dir, f"{key}.zip")
+    with _cache_lock:
+        if os.path.isfile(bundle_path):
+            _logger.debug("Using the cached bundle %s", bundle_path)
+            # The modification time orders the bundles for eviction
+            os.utime(bundle_path)
+            return open(bundle_path, "rb")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{bundle_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as tmp_file:
+            bundle._write_bundle_zip(entries=entries, fileobj=tmp_file)
+        with _cache_lock:
+            os.replace(tmp_path, bundle_path)
+            bundle_file = open(bundle_path, "rb")
+            _evict(cache_dir=cache_dir, max_size=max_size, keep=bundle_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return bundle_file
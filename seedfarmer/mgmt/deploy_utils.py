@@ -15,8 +15,9 @@
 import concurrent.futures
 import logging
 import os
-from threading import Lock
-from typing import Any, Dict, List, Optional, Set, Tuple, cast
+from contextlib import contextmanager
+from threading import BoundedSemaphore, Lock
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, cast
 
 import yaml
 from boto3 import Session
@@ -76,7 +77,56 @@ class ModuleInfoIndex(object):
             return {"group": "", "account_id": "", "region": "", "module_name": ""}
 
 
-def populate_module_info_index(deployment_manifest: DeploymentManifest) -> ModuleInfoIndex:
+class BuildConcurrencyLimiter(object):
+    """
+    Limits the number of module builds (deploy or destroy) running at the same time, based on the
+    `maxConcurrentBuilds` of the DeploymentManifest, its TargetAccountMappings and their RegionMappings.
+    Builds that exceed a limit wait for a slot rather than failing.
+    """
+
+    def __init__(self, deployment_manifest: DeploymentManifest) -> None:
+        super().__init__()
+        self._global: Optional[BoundedSemaphore] = (
+            BoundedSemaphore(deployment_manifest.max_concurrent_builds)
+            if deployment_manifest.max_concurrent_builds
+            else None
+        )
+        self._accounts: Dict[str, BoundedSemaphore] = dict()
+        self._regions: Dict[Tuple[str, str], BoundedSemaphore] = dict()
+        for target_account in deployment_manifest.target_account_mappings:
+            account_id = target_account.actual_account_id
+            if target_account.max_concurrent_builds:
+                self._accounts[account_id] = BoundedSemaphore(target_account.max_concurrent_builds)
+            for region_mapping in target_account.region_mappings:
+                if region_mapping.max_concurrent_builds:
+                    self._regions[(account_id, region_mapping.region)] = BoundedSemaphore(
+                        region_mapping.max_concurrent_builds
+                    )
+
+    @contextmanager
+    def acquire(self, account_id: str, region: str) -> Iterator[None]:
+        # Always acquire in the same order (global, account, region) so waiting builds cannot deadlock
+        semaphores = [
+            s
+            for s in [self._global, self._accounts.get(account_id), self._regions.get((account_id, region))]
+            if s is not None
+        ]
+        acquired: List[BoundedSemaphore] = []
+        try:
+            for semaphore in semaphores:
+                if not semaphore.acquire(blocking=False):
+                    _logger.info("Build concurrency limit reached for %s in %s, waiting...", account_id, region)
+                    semaphore.acquire()
+                acquired.append(semaphore)
+            yield
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+
+def populate_module_info_index(
+    deployment_manifest: DeploymentManifest, module_info_index: Optional[ModuleInfoIndex] = None
+) -> ModuleInfoIndex:
     """
     populate_module_info_index
         Fetch all info for the deployment currently stored, across all Target accounts and regions
@@ -85,13 +135,15 @@ def populate_module_info_index(deployment_manifest: DeploymentManifest) -> Modul
     ----------
     deployment_manifest: DeploymentManifest
         The DeploymentManifest, including TargetAccount and Region mappings
+    module_info_index: ModuleInfoIndex, optional
+        The index to populate, a new index if None
 
     Returns
     -------
     ModuleInfoIndex
         An index of Module info for all Target accounts and regions
     """
-    module_info_index = ModuleInfoIndex()
+    module_info_index = module_info_index if module_info_index is not None else ModuleInfoIndex()
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=len(deployment_manifest.target_accounts_regions)) as workers:
 
@@ -103,7 +155,11 @@ def populate_module_info_index(deployment_manifest: DeploymentManifest) -> Modul
                 .get_or_create()
                 .get_deployment_session(account_id=args["account_id"], region_name=args["region"])
             )
-            module_info = mi.get_parameter_data_cache(deployment=cast(str, deployment_manifest.name), session=session)
+            module_info = mi.get_parameter_data_cache(
+                deployment=cast(str, deployment_manifest.name),
+                session=session,
+                cache_key=f"{args['account_id']}-{args['region']}",
+            )
             for key, value in module_info.items():
                 key_parts = key.split("/")[1:]
                 if len(key_parts) < 4:
@@ -270,8 +326,56 @@ def generate_dependency_maps(manifest: DeploymentManifest) -> Tuple[Dict[str, Li
     return module_depends_on, module_dependencies
 
 
+def generate_deploy_dependency_graph(
+    groups: List[ModulesManifest], module_upstream_dep: Dict[str, List[str]]
+) -> Dict[str, Set[str]]:
+    """
+    Takes the groups scheduled for deploy and returns, for each module, the set of other scheduled modules
+    that must finish deploying before it can start.
+
+    Modules with explicit dependency edges (via `valueFrom.moduleMetadata`) wait only on their upstream modules
+    that are also scheduled.  Modules without explicit dependency edges honor the group ordering and wait on
+    every scheduled module in all preceding groups.
+
+    Parameters
+    ----------
+    groups : List[ModulesManifest]
+        The groups (in deployment order) that contain the modules scheduled to be deployed
+    module_upstream_dep : Dict[str, List[str]]
+        A dict containing all the upstream dependencies of a module.  Each key in the dict is a module name
+        with the format <group_name>-<module_name> and the value is a list of modules, each with the format
+        of <group_name>-<module_name>
+
+    Returns
+    -------
+    Dict[str, Set[str]]
+        A dict with the module (in form of `<group>-<module_name>`) as the key and the set of modules
+        (in form of `<group>-<module_name>`) that must complete before it as the value
+    """
+    scheduled = set([f"{group.name}-{module.name}" for group in groups for module in group.modules])
+    dependency_graph: Dict[str, Set[str]] = {}
+    preceding_modules: Set[str] = set()
+    for group in groups:
+        group_modules = set()
+        for module in group.modules:
+            group_module_name = f"{group.name}-{module.name}"
+            upstream = module_upstream_dep.get(group_module_name)
+            if upstream:
+                dependency_graph[group_module_name] = set(upstream).intersection(scheduled)
+            else:
+                dependency_graph[group_module_name] = set(preceding_modules)
+            group_modules.add(group_module_name)
+        preceding_modules.update(group_modules)
+    return dependency_graph
+
+
 def prepare_ssm_for_deploy(
-    deployment_name: str, group_name: str, module_manifest: ModuleManifest, account_id: str, region: str
+    deployment_name: str,
+    group_name: str,
+    module_manifest: ModuleManifest,
+    account_id: str,
+    region: str,
+    module_info: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     prepare_ssm_for_deploy
@@ -289,61 +393,37 @@ def prepare_ssm_for_deploy(
         The Account Id of where this module is to be deployed
     region : str
         The Region of where this module is to be deployed
+    module_info : Dict[str, Any], optional
+        The info currently stored for the module (from the ModuleInfoIndex), used to skip
+        writing unchanged values.  If None, all values are written
     """
 
-    # Remove the deployspec before writing...remove bloat as we write deployspec separately
     session = SessionManager().get_or_create().get_deployment_session(account_id=account_id, region_name=region)
-    module_manifest_wip = module_manifest.model_copy()
-    module_manifest_wip.deploy_spec = None
-    mi.write_module_manifest(
+    batch = mi.ModuleInfoBatch(
         deployment=deployment_name,
         group=group_name,
         module=module_manifest.name,
-        data=module_manifest_wip.model_dump(),
+        current=module_info,
         session=session,
+        cache_key=f"{account_id}-{region}",
     )
+    # Remove the deployspec before writing...remove bloat as we write deployspec separately
+    module_manifest_wip = module_manifest.model_copy()
+    module_manifest_wip.deploy_spec = None
+    batch.write_module_manifest(data=module_manifest_wip.model_dump())
+    batch.write_deployspec(data=module_manifest.deploy_spec.model_dump()) if module_manifest.deploy_spec else None
     (
-        mi.write_deployspec(
-            deployment=deployment_name,
-            group=group_name,
-            module=module_manifest.name,
-            data=module_manifest.deploy_spec.model_dump(),
-            session=session,
-        )
-        if module_manifest.deploy_spec
-        else None
-    )
-    (
-        mi.write_module_md5(
-            deployment=deployment_name,
-            group=group_name,
-            module=module_manifest.name,
-            hash=module_manifest.deployspec_md5,
-            type=mi.ModuleConst.DEPLOYSPEC,
-            session=session,
-        )
+        batch.write_module_md5(hash=module_manifest.deployspec_md5, type=mi.ModuleConst.DEPLOYSPEC)
         if module_manifest.deployspec_md5
         else None
     )
     (
-        mi.write_module_md5(
-            deployment=deployment_name,
-            group=group_name,
-            module=module_manifest.name,
-            hash=module_manifest.manifest_md5,
-            type=mi.ModuleConst.MANIFEST,
-            session=session,
-        )
+        batch.write_module_md5(hash=module_manifest.manifest_md5, type=mi.ModuleConst.MANIFEST)
         if module_manifest.manifest_md5
         else None
     )
-    mi.remove_module_md5(
-        deployment=deployment_name,
-        group=group_name,
-        module=module_manifest.name,
-        type=mi.ModuleConst.BUNDLE,
-        session=session,
-    )
+    batch.remove_module_md5(type=mi.ModuleConst.BUNDLE)
+    batch.flush()
 
 
 def write_deployed_deployment_manifest(deployment_manifest: DeploymentManifest) -> None:
@@ -369,6 +449,7 @@ def generate_deployed_manifest(
     deployment_name: str,
     skip_deploy_spec: bool = False,
     ignore_deployed: Optional[bool] = False,
+    module_info_index: Optional[ModuleInfoIndex] = None,
 ) -> Optional[DeploymentManifest]:
     """
     Generate a DeploymentManifest object from based off deployed modules in a deployment
@@ -382,21 +463,21 @@ def generate_deployed_manifest(
     ignore_deployed : Optional[bool]
         When fetching the deployment manifest stored, ignore the successfully deployed modules,
         forcing a fetch of the last requested deployment (to include modules that failed to deploy)
+    module_info_index: ModuleInfoIndex, optional
+        An index populated with the module info fetched, so the caller can reuse it
 
     Returns
     -------
     Optional[DeploymentManifest]
         The hydrated DeploymentManifest object of deployed modules
     """
-    session_manager = SessionManager().get_or_create()
-    dep_manifest_dict = mi.get_deployed_deployment_manifest(deployment_name, session=session_manager.toolchain_session)
-    if dep_manifest_dict is None or ignore_deployed:
-        # No successful deployments, just use what was last requested
-        dep_manifest_dict = mi.get_deployment_manifest(deployment_name, session=session_manager.toolchain_session)
+    dep_manifest_dict = _get_deployed_manifest_dict(deployment_name=deployment_name, ignore_deployed=ignore_deployed)
     deployed_manifest = None
     if dep_manifest_dict:
         deployed_manifest = DeploymentManifest(**dep_manifest_dict)
-        module_info_index = populate_module_info_index(deployment_manifest=deployed_manifest)
+        module_info_index = populate_module_info_index(
+            deployment_manifest=deployed_manifest, module_info_index=module_info_index
+        )
         for module_group in dep_manifest_dict["groups"] if dep_manifest_dict["groups"] else []:
             group_name = module_group["name"]
             module_group["modules"] = _populate_group_modules_from_index(
@@ -409,6 +490,115 @@ def generate_deployed_manifest(
     return deployed_manifest
 
 
+def get_deployed_module_keys(deployment_name: str) -> Optional[Dict[Tuple[str, str], Dict[str, str]]]:
+    """
+    get_deployed_module_keys
+        Locate the deployed modules of a deployment straight from the keys of the ModuleInfoIndex.
+        A fast path of generate_deployed_manifest for callers that only need the group, name, account
+        and region of the modules, no ModuleManifest is built or validated
+
+    Parameters
+    ----------
+    deployment_name : str
+        The name of the deployment
+
+    Returns
+    -------
+    Optional[Dict[Tuple[str, str], Dict[str, str]]]
+        The `group`, `module_name`, `account_id` and `region` of each deployed module, with the group and
+        module name as the key.  None if the deployment is not found
+    """
+    dep_manifest_dict = _get_deployed_manifest_dict(deployment_name=deployment_name)
+    if not dep_manifest_dict:
+        return None
+    # Only the target accounts and regions are needed, the modules of the last requested manifest are not validated
+    module_info_index = populate_module_info_index(
+        deployment_manifest=DeploymentManifest(**{**dep_manifest_dict, "groups": []})
+    )
+    module_keys: Dict[Tuple[str, str], Dict[str, str]] = {}
+    for module_group in dep_manifest_dict["groups"] if dep_manifest_dict["groups"] else []:
+        for group_key in module_info_index.get_keys_for_group(module_group["name"]):
+            deployment_params_cache = module_info_index.get_module_info(**group_key)
+            if (
+                mi.get_module_manifest(
+                    deployment_name, group_key["group"], group_key["module_name"], deployment_params_cache
+                )
+                is not None
+            ):
+                module_keys[(group_key["group"], group_key["module_name"])] = group_key
+    return module_keys
+
+
+def _get_deployed_manifest_dict(
+    deployment_name: str, ignore_deployed: Optional[bool] = False
+) -> Optional[Dict[str, Any]]:
+    session_manager = SessionManager().get_or_create()
+    dep_manifest_dict = mi.get_deployed_deployment_manifest(deployment_name, session=session_manager.toolchain_session)
+    if dep_manifest_dict is None or ignore_deployed:
+        # No successful deployments, just use what was last requested
+        dep_manifest_dict = mi.get_deployment_manifest(deployment_name, session=session_manager.toolchain_session)
+    return dep_manifest_dict
+
+
+def get_deployed_modules_metadata(
+    deployment_manifest: DeploymentManifest, module_info_index: ModuleInfoIndex
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    get_deployed_modules_metadata
+        Get the metadata of all modules in a deployed manifest from the ModuleInfoIndex.  The metadata
+        of modules missing from the index is fetched concurrently, per target account and region
+
+    Parameters
+    ----------
+    deployment_manifest: DeploymentManifest
+        The deployed DeploymentManifest, with the module defaults set
+    module_info_index: ModuleInfoIndex
+        The index of the module info of the deployment
+
+    Returns
+    -------
+    Dict[str, Optional[Dict[str, Any]]]
+        The metadata of each module, with `<group>-<module>` as the key
+    """
+    deployment_name = cast(str, deployment_manifest.name)
+    metadata: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+    gaps: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+    for group in deployment_manifest.groups:
+        for module in group.modules:
+            account_id = cast(str, module.get_target_account_id())
+            region = cast(str, module.target_region)
+            module_info = module_info_index.get_module_info(
+                group=group.name, account_id=account_id, region=region, module_name=module.name
+            )
+            if module_info:
+                metadata[(group.name, module.name)] = mi.get_module_metadata(
+                    deployment_name, group.name, module.name, module_info
+                )
+            else:
+                gaps.setdefault((account_id, region), []).append((group.name, module.name))
+
+    if gaps:
+        _logger.debug("Fetching the metadata of modules missing from the index: %s", gaps)
+
+        def _get_modules_metadata(account_region: Tuple[str, str]) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+            session = (
+                SessionManager()
+                .get_or_create()
+                .get_deployment_session(account_id=account_region[0], region_name=account_region[1])
+            )
+            return mi.get_modules_metadata(deployment=deployment_name, modules=gaps[account_region], session=session)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(gaps)) as workers:
+            for modules_metadata in workers.map(_get_modules_metadata, gaps):
+                metadata.update(modules_metadata)
+
+    return {
+        f"{group.name}-{module.name}": metadata.get((group.name, module.name))
+        for group in deployment_manifest.groups
+        for module in group.modules
+    }
+
+
 def get_deployed_group_ordering(deployment_name: str) -> Dict[str, int]:
     """
     This generates a dict of the groups deployed and the index representing the proper deployment ordering
@@ -15,20 +15,31 @@
 import json
 import logging
 import os
+import re
 import sys
+import threading
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple, cast
 
 from boto3 import Session
 
 import seedfarmer.errors
 from seedfarmer import config
+from seedfarmer.mgmt.module_state_store import get_module_state_store
 from seedfarmer.services import _secrets_manager as secrets
 from seedfarmer.services import _ssm as ssm
 from seedfarmer.utils import generate_hash, generate_session_hash, remove_nulls
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+MODULE_INFO_CACHE_DIR = os.path.join(".seedfarmer.out", "module-info-cache")
+_MODULE_INFO_CACHE_VERSION = 1
+_module_info_cache_lock = threading.Lock()
+
+# Number of writes skipped as the value persisted was unchanged
+_skipped_writes = 0
+_skipped_writes_lock = threading.Lock()
+
 
 class ModuleConst(Enum):
     DEPLOYSPEC = "deployspec"
@@ -39,7 +50,7 @@ class ModuleConst(Enum):
     DEPLOYED = "deployed"
 
 
-def get_parameter_data_cache(deployment: str, session: Session) -> Dict[str, Any]:
+def get_parameter_data_cache(deployment: str, session: Session, cache_key: Optional[str] = None) -> Dict[str, Any]:
     """
     get_parameter_data_cache
         Fetch the deployment parameters stored
@@ -50,13 +61,131 @@ def get_parameter_data_cache(deployment: str, session: Session) -> Dict[str, Any
         Name of the deployment
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
+    cache_key: str, optional
+        When set (and the store versions its values), the parameters are cached on disk under the key
+        (i.e. the target account and region), and only the parameters changed since are fetched
 
     Returns
     -------
     Dict[str,Any]
         A dictionary representation of what is in the store (SSM for DDB) of the modules deployed
     """
-    return ssm.get_all_parameter_data_by_path(prefix=_deployment_key(deployment), session=session)
+    store = get_module_state_store()
+    path = _deployment_key(deployment)
+    versions = store.get_versions_by_path(path=path, session=session) if cache_key else None
+    if versions is None:
+        return store.get_by_path(path=path, session=session)
+
+    cache_path = _module_info_cache_path(deployment, cast(str, cache_key))
+    cached = _load_module_info_cache(cache_path)
+    # Entries written or invalidated have no version, as the versions listed may not include the change yet
+    changed = [name for name, version in versions.items() if name not in cached or cached[name][0] != version]
+    written = [
+        name for name, entry in cached.items() if entry[0] is None and name not in versions and name.startswith(path)
+    ]
+    if len(changed) > len(versions) // 2:
+        # Mostly cold, a scan of the path is cheaper than fetching the values by name
+        fetched = store.get_by_path(path=path, session=session)
+    else:
+        fetched = store.get_many(names=changed + written, session=session) if changed or written else {}
+    _logger.debug("Fetched %s of %s parameters of %s, cached in %s", len(changed), len(versions), path, cache_path)
+
+    # A value written after its version was read is fetched again on the next call, as its version changed
+    entries: Dict[str, List[Any]] = {}
+    for name, version in versions.items():
+        if name in fetched:
+            entries[name] = [version, fetched[name]]
+        elif name in cached and cached[name][0] == version:
+            entries[name] = cached[name]
+    for name in written:
+        if name in fetched:
+            entries[name] = [None, fetched[name]]
+    if entries != cached:
+        _save_module_info_cache(cache_path, entries)
+    return {name: entry[1] for name, entry in entries.items()}
+
+
+def _module_info_cache_path(deployment: str, cache_key: str) -> str:
+    return os.path.join(config.OPS_ROOT, MODULE_INFO_CACHE_DIR, f"{deployment}-{cache_key}.json")
+
+
+def _module_info_cache_paths(deployment: str) -> List[str]:
+    # The caches of the target accounts and regions of the deployment, named after the `<account_id>-<region>` key
+    cache_dir = os.path.join(config.OPS_ROOT, MODULE_INFO_CACHE_DIR)
+    pattern = re.compile(rf"{re.escape(deployment)}-\d{{12}}-[a-z0-9-]+\.json")
+    try:
+        return [os.path.join(cache_dir, name) for name in sorted(os.listdir(cache_dir)) if pattern.fullmatch(name)]
+    except OSError:
+        return []
+
+
+def _update_module_info_cache(
+    cache_path: str, writes: Mapping[str, Optional[Dict[str, Any]]], removes: List[str]
+) -> None:
+    # The versions listed by the store are eventually consistent, so the values written are cached without
+    # a version and fetched again by name, rather than trusting a version listed before the write
+    if not os.path.exists(cache_path):
+        return
+    with _module_info_cache_lock:
+        cached = _load_module_info_cache(cache_path)
+        for name, data in writes.items():
+            cached[name] = [None, data]
+        for name in removes:
+            cached.pop(name, None)
+        _save_module_info_cache(cache_path, cached)
+
+
+def invalidate_cached_module_info(deployment: str, group: str, module: str, cache_key: Optional[str] = None) -> None:
+    """
+    invalidate_cached_module_info
+        Mark the persisted data of a module as changed in the module info cached on disk, so it is fetched
+        again by name on the next ``get_parameter_data_cache``.  Used when the data is written or deleted
+        outside of a ModuleInfoBatch (i.e. by a CLI command or the build of the module), as the versions listed
+        by the store may not include the change yet
+
+    Parameters
+    ----------
+    deployment : str
+        The name of the deployment
+    group : str
+        The name of the group
+    module : str
+        The name of the module
+    cache_key: str, optional
+        The key of the module info cached for the target account and region (as passed to
+        ``get_parameter_data_cache``).  If None, the caches of all target accounts and regions are invalidated
+    """
+    cache_paths = (
+        [_module_info_cache_path(deployment, cache_key)] if cache_key else _module_info_cache_paths(deployment)
+    )
+    writes: Dict[str, Optional[Dict[str, Any]]] = {name: None for name in _all_module_keys(deployment, group, module)}
+    for cache_path in cache_paths:
+        _update_module_info_cache(cache_path, writes=writes, removes=[])
+
+
+def _load_module_info_cache(cache_path: str) -> Dict[str, List[Any]]:
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            content = json.load(cache_file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        _logger.debug("Ignoring unreadable module info cache %s: %s", cache_path, e)
+        return {}
+    if not isinstance(content, dict) or content.get("version") != _MODULE_INFO_CACHE_VERSION:
+        return {}
+    return cast(Dict[str, List[Any]], content.get("entries", {}))
+
+
+def _save_module_info_cache(cache_path: str, entries: Dict[str, List[Any]]) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump({"version": _MODULE_INFO_CACHE_VERSION, "entries": entries}, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        _logger.debug("Unable to write the module info cache %s: %s", cache_path, e)
 
 
 def get_all_deployments(session: Optional[Session] = None) -> List[str]:
@@ -73,10 +202,10 @@ def get_all_deployments(session: Optional[Session] = None) -> List[str]:
     List[str]
         A list of the deployments in the account
     """
-    prefix = f"/{config.PROJECT}"
+    prefix = f"/{config.PROJECT}/"
     _filter = f"{ModuleConst.MANIFEST.value}"
     ret = set()
-    params = ssm.list_parameters_with_filter(prefix=prefix, contains_string=_filter, session=session)
+    params = get_module_state_store().list_names(prefix=prefix, contains_string=_filter, session=session)
     for param in params:
         _logger.debug(param)
         p = param.split("/")[3]
@@ -106,13 +235,13 @@ def get_all_groups(
     List[str]
         A list of the group names
     """
-    prefix = _deployment_key(deployment)
+    prefix = f"{_deployment_key(deployment)}/"
     _filter = f"{ModuleConst.MANIFEST.value}"
     ret = set()
     params = (
         params_cache.keys()
         if params_cache
-        else ssm.list_parameters_with_filter(prefix=prefix, contains_string=_filter, session=session)
+        else get_module_state_store().list_names(prefix=prefix, contains_string=_filter, session=session)
     )
     for param in params:
         p = param.split("/")[3]
@@ -144,9 +273,13 @@ def get_deployed_modules(
     List[str]
         A list of the names of the modules in the group
     """
-    prefix = f"/{config.PROJECT}/{deployment}/{group}"
+    prefix = f"/{config.PROJECT}/{deployment}/{group}/"
     _filter = f"{ModuleConst.MD5.value}/{ModuleConst.BUNDLE.value}"
-    params = params_cache.keys() if params_cache else ssm.list_parameters_with_filter(prefix, _filter, session=session)
+    params = (
+        params_cache.keys()
+        if params_cache
+        else get_module_state_store().list_names(prefix=prefix, contains_string=_filter, session=session)
+    )
     ret: List[str] = []
     for param in params:
         ret.append(param.split("/")[4]) if _filter in param else None
@@ -183,7 +316,7 @@ def get_module_md5(
         The md5 hash as a string
     """
     name = _md5_module_key(deployment, group, module, type)
-    p = ssm.get_parameter_if_exists(name=name, session=session)
+    p = get_module_state_store().get(name=name, session=session)
     return p["hash"] if p else None
 
 
@@ -219,6 +352,33 @@ def get_module_metadata(
     return _fetch_helper(_metadata_key(deployment, group, module), params_cache, session=session)
 
 
+def get_modules_metadata(
+    deployment: str, modules: List[Tuple[str, str]], session: Optional[Session] = None
+) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+    """
+    get_modules_metadata
+        Get the metadata stored for several deployed modules, in as few calls as the store allows
+
+    Parameters
+    ----------
+    deployment : str
+        The name of the deployment
+    modules : List[Tuple[str, str]]
+        The group and module name of each module
+    session: Session, optional
+        The boto3.Session to use to for SSM Parameter queries, default None
+
+    Returns
+    -------
+    Dict[Tuple[str, str], Optional[Dict[str, Any]]]
+        The metadata of each module requested, None if not stored
+    """
+    values = get_module_state_store().get_many(
+        names=[_metadata_key(deployment, group, module) for group, module in modules], session=session
+    )
+    return {(group, module): values.get(_metadata_key(deployment, group, module)) for group, module in modules}
+
+
 def get_module_manifest(
     deployment: str,
     group: str,
@@ -441,7 +601,7 @@ def does_md5_match(
     """
     name = _md5_module_key(deployment, group, module, type)
     if not deployment_params_cache:
-        p = ssm.get_parameter_if_exists(name=name, session=session)
+        p = get_module_state_store().get(name=name, session=session)
     else:
         p = deployment_params_cache[name] if name in deployment_params_cache.keys() else None
     if not p:
@@ -473,7 +633,7 @@ def does_module_exist(deployment: str, group: str, module: str, session: Optiona
     bool
         Whether the module is deployed
     """
-    return ssm.does_parameter_exist(
+    return get_module_state_store().exists(
         name=_md5_module_key(deployment, group, module, ModuleConst.BUNDLE), session=session
     )
 
@@ -498,13 +658,19 @@ def write_metadata(
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
     """
-    ssm.put_parameter(name=_metadata_key(deployment, group, module), obj=data, session=session)
+    get_module_state_store().put(name=_metadata_key(deployment, group, module), obj=data, session=session)
 
 
-def write_group_manifest(deployment: str, group: str, data: Dict[str, Any], session: Optional[Session] = None) -> None:
+def write_group_manifest(
+    deployment: str,
+    group: str,
+    data: Dict[str, Any],
+    session: Optional[Session] = None,
+    params_cache: Optional[Dict[str, Any]] = None,
+) -> None:
     """
     write_group_manifest
-        Persists the manifest of a deployed group
+        Persists the manifest of a deployed group, unless unchanged
 
     Parameters
     ----------
@@ -516,16 +682,24 @@ def write_group_manifest(deployment: str, group: str, data: Dict[str, Any], sess
         The metadat of the module
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
+    params_cache : Dict[str,Any], optional
+        A populated dict with the key  of the parameter stored and its value, the write is
+        skipped if it holds the same value
     """
-    ssm.put_parameter(name=_group_key(deployment, group), obj=data, session=session)
+    _put_parameter_if_changed(name=_group_key(deployment, group), data=data, params_cache=params_cache, session=session)
 
 
 def write_module_manifest(
-    deployment: str, group: str, module: str, data: Dict[str, Any], session: Optional[Session] = None
+    deployment: str,
+    group: str,
+    module: str,
+    data: Dict[str, Any],
+    session: Optional[Session] = None,
+    params_cache: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     write_module_manifest
-        Persists the manifest of a deployed module
+        Persists the manifest of a deployed module, unless unchanged
 
     Parameters
     ----------
@@ -539,24 +713,29 @@ def write_module_manifest(
         A dict of the data to be persisted
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
+    params_cache : Dict[str,Any], optional
+        A populated dict with the key  of the parameter stored and its value
     """
-
-    # Temp fix until a larger persistence store is vetted
-    process_data = data
-    current_size = sys.getsizeof(json.dumps(data))
-    if current_size > 8191:
-        _logger.info("The manifest for %s-%s is %s, too large for SSM, reducing", group, module, current_size)
-        process_data = remove_nulls(data)
-        _logger.info("The size is now %s", sys.getsizeof(json.dumps(process_data)))
-    ssm.put_parameter(name=_manifest_key(deployment, group, module), obj=process_data, session=session)
+    _put_parameter_if_changed(
+        name=_manifest_key(deployment, group, module),
+        data=_reduce_module_manifest(group, module, data),
+        params_cache=params_cache,
+        compress=True,
+        session=session,
+    )
 
 
 def write_deployspec(
-    deployment: str, group: str, module: str, data: Dict[str, Any], session: Optional[Session] = None
+    deployment: str,
+    group: str,
+    module: str,
+    data: Dict[str, Any],
+    session: Optional[Session] = None,
+    params_cache: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     write_deployspec
-        Persists the deployspec of a deployed module
+        Persists the deployspec of a deployed module, unless unchanged
 
     Parameters
     ----------
@@ -570,8 +749,16 @@ def write_deployspec(
         A dict of the data to be persisted
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
+    params_cache : Dict[str,Any], optional
+        A populated dict with the key  of the parameter stored and its value
     """
-    ssm.put_parameter(name=_deployspec_key(deployment, group, module), obj=data, session=session)
+    _put_parameter_if_changed(
+        name=_deployspec_key(deployment, group, module),
+        data=data,
+        params_cache=params_cache,
+        compress=True,
+        session=session,
+    )
 
 
 def write_module_md5(
@@ -600,13 +787,20 @@ def write_module_md5(
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
     """
-    ssm.put_parameter(name=_md5_module_key(deployment, group, module, type), obj={"hash": hash}, session=session)
+    get_module_state_store().put(
+        name=_md5_module_key(deployment, group, module, type), obj={"hash": hash}, session=session
+    )
 
 
-def write_deployment_manifest(deployment: str, data: Dict[str, Any], session: Optional[Session] = None) -> None:
+def write_deployment_manifest(
+    deployment: str,
+    data: Dict[str, Any],
+    session: Optional[Session] = None,
+    params_cache: Optional[Dict[str, Any]] = None,
+) -> None:
     """
     write_deployment
-        Persists the deployment manifest
+        Persists the deployment manifest, unless unchanged
 
     Parameters
     ----------
@@ -616,10 +810,15 @@ def write_deployment_manifest(deployment: str, data: Dict[str, Any], session: Op
         A dict of the deployment manifest
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
+    params_cache : Dict[str,Any], optional
+        A populated dict with the key  of the parameter stored and its value, the write is
+        skipped if it holds the same value
     """
     if _logger.isEnabledFor(logging.DEBUG):
         _logger.debug("Writing to %s values %s", _deployment_manifest_key(deployment), data)
-    ssm.put_parameter(name=_deployment_manifest_key(deployment), obj=data, session=session)
+    _put_parameter_if_changed(
+        name=_deployment_manifest_key(deployment), data=data, params_cache=params_cache, session=session
+    )
 
 
 def write_deployed_deployment_manifest(
@@ -641,7 +840,98 @@ def write_deployed_deployment_manifest(
     key = _deployed_deployment_manifest_key(deployment)
     _logger.debug("Writing to %s value %s", key, data)
 
-    ssm.put_parameter(name=key, obj=data, session=session)
+    get_module_state_store().put(name=key, obj=data, session=session)
+
+
+class ModuleInfoBatch(object):
+    """
+    Collects the writes and deletes of the persisted data of a module and flushes them together.
+    Writes of a value already persisted and deletes of data not persisted are skipped, based on
+    the ``current`` data of the module (as indexed in the ModuleInfoIndex), and the remaining
+    calls are batched by the module state store.
+
+    Parameters
+    ----------
+    deployment : str
+        The name of the deployment
+    group : str
+        The name of the group
+    module : str
+        The name of the module
+    current : Dict[str, Any], optional
+        A dict with the key of each parameter persisted for the module and its value.  If None,
+        nothing is skipped
+    session: Session, optional
+        The boto3.Session to use to for SSM Parameter queries, default None
+    cache_key: str, optional
+        The key of the module info cached on disk for the target account and region (as passed to
+        ``get_parameter_data_cache``), updated with the writes and deletes flushed.  If None, no cache is updated
+    """
+
+    def __init__(
+        self,
+        deployment: str,
+        group: str,
+        module: str,
+        current: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None,
+        cache_key: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self.deployment = deployment
+        self.group = group
+        self.module = module
+        self._current = current
+        self._session = session
+        self._cache_key = cache_key
+        self._writes: Dict[str, Dict[str, Any]] = dict()
+        self._removes: List[str] = []
+
+    def write_module_manifest(self, data: Dict[str, Any]) -> None:
+        self._writes[_manifest_key(self.deployment, self.group, self.module)] = _reduce_module_manifest(
+            self.group, self.module, data
+        )
+
+    def write_deployspec(self, data: Dict[str, Any]) -> None:
+        self._writes[_deployspec_key(self.deployment, self.group, self.module)] = data
+
+    def write_module_md5(self, hash: str, type: ModuleConst) -> None:
+        self._writes[_md5_module_key(self.deployment, self.group, self.module, type)] = {"hash": hash}
+
+    def remove_module_md5(self, type: ModuleConst) -> None:
+        self._removes.append(_md5_module_key(self.deployment, self.group, self.module, type))
+
+    def flush(self) -> None:
+        """Persist the collected writes and deletes"""
+        current = self._current
+        writes = {
+            name: data
+            for name, data in self._writes.items()
+            if current is None or not _is_unchanged(name=name, data=data, params_cache=current)
+        }
+        removes = [name for name in self._removes if current is None or name in current]
+        _logger.debug(
+            "Persisting %s of %s writes and %s of %s deletes for %s-%s",
+            len(writes),
+            len(self._writes),
+            len(removes),
+            len(self._removes),
+            self.group,
+            self.module,
+        )
+        self._writes, self._removes = dict(), []
+        if not writes and not removes:
+            return
+        store = get_module_state_store()
+        # Manifests and deployspecs may be large, md5 hashes stay below the compression threshold
+        store.put_many(items=writes, session=self._session, compress=True) if writes else None
+        store.delete(names=removes, session=self._session) if removes else None
+        if self._cache_key:
+            _update_module_info_cache(
+                _module_info_cache_path(self.deployment, self._cache_key),
+                writes=writes,
+                removes=removes,
+            )
 
 
 def remove_module_info(deployment: str, group: str, module: str, session: Optional[Session] = None) -> None:
@@ -660,7 +950,7 @@ def remove_module_info(deployment: str, group: str, module: str, session: Option
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
     """
-    ssm.delete_parameters(parameters=_all_module_keys(deployment, group, module), session=session)
+    get_module_state_store().delete(names=_all_module_keys(deployment, group, module), session=session)
 
 
 def remove_group_info(deployment: str, group: str, session: Optional[Session] = None) -> None:
@@ -677,7 +967,7 @@ def remove_group_info(deployment: str, group: str, session: Optional[Session] =
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
     """
-    ssm.delete_parameters(parameters=(_all_group_keys(deployment, group)), session=session)
+    get_module_state_store().delete(names=(_all_group_keys(deployment, group)), session=session)
 
 
 def remove_module_md5(
@@ -704,7 +994,7 @@ def remove_module_md5(
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
     """
-    ssm.delete_parameters(parameters=[_md5_module_key(deployment, group, module, type)], session=session)
+    get_module_state_store().delete(names=[_md5_module_key(deployment, group, module, type)], session=session)
 
 
 def remove_deployment_manifest(deployment: str, session: Optional[Session] = None) -> None:
@@ -719,7 +1009,7 @@ def remove_deployment_manifest(deployment: str, session: Optional[Session] = Non
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
     """
-    ssm.delete_parameters(parameters=[_deployment_manifest_key(deployment)], session=session)
+    get_module_state_store().delete(names=[_deployment_manifest_key(deployment)], session=session)
 
 
 def remove_deployed_deployment_manifest(deployment: str, session: Optional[Session] = None) -> None:
@@ -734,7 +1024,7 @@ def remove_deployed_deployment_manifest(deployment: str, session: Optional[Sessi
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
     """
-    ssm.delete_parameters(parameters=[_deployed_deployment_manifest_key(deployment)], session=session)
+    get_module_state_store().delete(names=[_deployed_deployment_manifest_key(deployment)], session=session)
 
 
 def _metadata_key(deployment: str, group: str, module: str) -> str:
@@ -788,13 +1078,59 @@ def _deployment_key(deployment: str) -> str:
     return f"/{config.PROJECT}/{deployment}/"
 
 
+def _reduce_module_manifest(group: str, module: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    # Temp fix until a larger persistence store is vetted
+    current_size = sys.getsizeof(json.dumps(data))
+    if current_size > 8191:
+        _logger.info("The manifest for %s-%s is %s, too large for SSM, reducing", group, module, current_size)
+        data = remove_nulls(data)
+        _logger.info("The size is now %s", sys.getsizeof(json.dumps(data)))
+    return data
+
+
+def get_skipped_write_count() -> int:
+    """
+    get_skipped_write_count
+        Get the number of writes skipped as the value persisted was unchanged
+
+    Returns
+    -------
+    int
+        The number of writes skipped
+    """
+    return _skipped_writes
+
+
+def _is_unchanged(name: str, data: Dict[str, Any], params_cache: Dict[str, Any]) -> bool:
+    global _skipped_writes
+    # Compare with the value as it would be read back from the store
+    if name not in params_cache or params_cache[name] != json.loads(json.dumps(data, sort_keys=True)):
+        return False
+    _logger.debug("The value of %s is unchanged, skipping write", name)
+    with _skipped_writes_lock:
+        _skipped_writes += 1
+    return True
+
+
+def _put_parameter_if_changed(
+    name: str,
+    data: Dict[str, Any],
+    params_cache: Optional[Dict[str, Any]] = None,
+    compress: bool = False,
+    session: Optional[Session] = None,
+) -> None:
+    if params_cache is not None and _is_unchanged(name=name, data=data, params_cache=params_cache):
+        return
+    get_module_state_store().put(name=name, obj=data, session=session, compress=compress)
+
+
 def _fetch_helper(
     name: str, params_cache: Optional[Dict[str, Any]] = None, session: Optional[Session] = None
 ) -> Optional[Dict[str, Any]]:
     if params_cache:
         return params_cache.get(name, None)
     else:
-        return ssm.get_parameter_if_exists(name=name, session=session)
+        return get_module_state_store().get(name=name, session=session)
 
 
 def get_module_stack_names(
@@ -0,0 +1,391 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import concurrent.futures
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, cast
+
+from boto3 import Session
+
+import seedfarmer.errors
+from seedfarmer import config
+from seedfarmer.models import ModuleStateStoreType
+from seedfarmer.services import _ssm as ssm
+from seedfarmer.services._service_utils import boto3_client
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+MODULE_STATE_SQLITE_PATH = os.path.join(".seedfarmer.out", "module-state.db")
+
+_SSM_WRITE_MAX_WORKERS = 5
+_DYNAMODB_BATCH_WRITE_MAX_ITEMS = 25
+_DYNAMODB_BATCH_GET_MAX_KEYS = 100
+_DYNAMODB_MAX_RETRIES = 5
+
+
+class ModuleStateStore(ABC):
+    """
+    ModuleStateStore
+        Persists the state of deployed modules (manifests, deployspecs, md5 hashes and metadata).
+        Each value is a JSON document stored under a path-like name: /<project>/<deployment>/...
+    """
+
+    @abstractmethod
+    def put(self, name: str, obj: Dict[str, Any], session: Optional[Session] = None, compress: bool = False) -> None:
+        """
+        Store a value, replacing the current value.  With `compress`, backends with tight size
+        limits may store large values compressed, they are decompressed transparently on read
+        """
+
+    def put_many(
+        self, items: Dict[str, Dict[str, Any]], session: Optional[Session] = None, compress: bool = False
+    ) -> None:
+        """Store several values, replacing the current values"""
+        for name, obj in items.items():
+            self.put(name=name, obj=obj, session=session, compress=compress)
+
+    @abstractmethod
+    def get(self, name: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        """Get a value, None if not stored"""
+
+    def get_many(self, names: List[str], session: Optional[Session] = None) -> Dict[str, Any]:
+        """Get several values, names not stored are left out of the result"""
+        ret: Dict[str, Any] = {}
+        for name in names:
+            value = self.get(name=name, session=session)
+            if value is not None:
+                ret[name] = value
+        return ret
+
+    @abstractmethod
+    def get_by_path(self, path: str, session: Optional[Session] = None) -> Dict[str, Any]:
+        """Get all values stored under a path"""
+
+    def get_versions_by_path(self, path: str, session: Optional[Session] = None) -> Optional[Dict[str, str]]:
+        """
+        Get a version of each value stored under a path, without the values.  The version changes
+        whenever the value is written.  None if the backend does not version the values
+        """
+        return None
+
+    @abstractmethod
+    def list_names(self, prefix: str, contains_string: str, session: Optional[Session] = None) -> List[str]:
+        """List the names beginning with a prefix and containing a string"""
+
+    def exists(self, name: str, session: Optional[Session] = None) -> bool:
+        """Check if a value is stored"""
+        return self.get(name=name, session=session) is not None
+
+    @abstractmethod
+    def delete(self, names: List[str], session: Optional[Session] = None) -> None:
+        """Delete values, names not stored are ignored"""
+
+
+class SsmModuleStateStore(ModuleStateStore):
+    """
+    SsmModuleStateStore
+        Persists the module state as String parameters in SSM Parameter Store of each target account and region
+    """
+
+    def put(self, name: str, obj: Dict[str, Any], session: Optional[Session] = None, compress: bool = False) -> None:
+        ssm.put_parameter(name=name, obj=obj, session=session, compress=compress)
+
+    def put_many(
+        self, items: Dict[str, Dict[str, Any]], session: Optional[Session] = None, compress: bool = False
+    ) -> None:
+        # SSM has no batch write, the parameters are written concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_SSM_WRITE_MAX_WORKERS) as workers:
+            futures = [
+                workers.submit(ssm.put_parameter, name=name, obj=obj, session=session, compress=compress)
+                for name, obj in items.items()
+            ]
+            for future in futures:
+                future.result()
+
+    def get(self, name: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        return ssm.get_parameter_if_exists(name=name, session=session)
+
+    def get_many(self, names: List[str], session: Optional[Session] = None) -> Dict[str, Any]:
+        return ssm.get_parameters(names=names, session=session)
+
+    def get_by_path(self, path: str, session: Optional[Session] = None) -> Dict[str, Any]:
+        return ssm.get_all_parameter_data_by_path(prefix=path, session=session)
+
+    def get_versions_by_path(self, path: str, session: Optional[Session] = None) -> Optional[Dict[str, str]]:
+        return ssm.get_parameter_versions_by_path(prefix=path, session=session)
+
+    def list_names(self, prefix: str, contains_string: str, session: Optional[Session] = None) -> List[str]:
+        return ssm.list_parameters_with_filter(prefix=prefix, contains_string=contains_string, session=session)
+
+    def exists(self, name: str, session: Optional[Session] = None) -> bool:
+        return ssm.does_parameter_exist(name=name, session=session)
+
+    def delete(self, names: List[str], session: Optional[Session] = None) -> None:
+        ssm.delete_parameters(parameters=names, session=session)
+
+
+class DynamoDbModuleStateStore(ModuleStateStore):
+    """
+    DynamoDbModuleStateStore
+        Persists the module state in a DynamoDB table of each target account and region, reading and
+        writing several values per call with BatchGetItem and BatchWriteItem.
+
+        The table has a partition key `deployment` (String), the first two segments of the name
+        (/<project>/<deployment>), and a sort key `name` (String).  The value is a JSON String
+        attribute `value`.
+
+    Parameters
+    ----------
+    table_name : str
+        The name of the DynamoDB table
+    """
+
+    def __init__(self, table_name: str) -> None:
+        super().__init__()
+        self.table_name = table_name
+
+    @staticmethod
+    def _partition_key(name: str) -> str:
+        return "/".join(name.split("/")[:3])
+
+    def _key(self, name: str) -> Dict[str, Any]:
+        return {"deployment": {"S": self._partition_key(name)}, "name": {"S": name}}
+
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        return random.uniform(0.1, 0.1 * 2**attempt)
+
+    def put(self, name: str, obj: Dict[str, Any], session: Optional[Session] = None, compress: bool = False) -> None:
+        self.put_many(items={name: obj}, session=session)
+
+    def put_many(
+        self, items: Dict[str, Dict[str, Any]], session: Optional[Session] = None, compress: bool = False
+    ) -> None:
+        self._batch_write(
+            requests=[
+                {
+                    "PutRequest": {
+                        "Item": {**self._key(name), "value": {"S": json.dumps(obj=obj, sort_keys=True)}},
+                    }
+                }
+                for name, obj in items.items()
+            ],
+            session=session,
+        )
+
+    def get(self, name: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        return cast(Optional[Dict[str, Any]], self.get_many(names=[name], session=session).get(name))
+
+    def get_many(self, names: List[str], session: Optional[Session] = None) -> Dict[str, Any]:
+        client = boto3_client("dynamodb", session=session)
+        ret: Dict[str, Any] = {}
+        names = list(dict.fromkeys(names))
+        for i in range(0, len(names), _DYNAMODB_BATCH_GET_MAX_KEYS):
+            request: Dict[str, Any] = {
+                self.table_name: {"Keys": [self._key(name) for name in names[i : i + _DYNAMODB_BATCH_GET_MAX_KEYS]]}
+            }
+            for attempt in range(_DYNAMODB_MAX_RETRIES + 1):
+                response = client.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    ret[item["name"]["S"]] = json.loads(item["value"]["S"])
+                request = response.get("UnprocessedKeys", {})
+                if not request:
+                    break
+                time.sleep(self._retry_delay(attempt))
+            else:
+                raise seedfarmer.errors.SeedFarmerException(
+                    f"Unable to read the module state from the DynamoDB table {self.table_name}, throttled"
+                )
+        return ret
+
+    def get_by_path(self, path: str, session: Optional[Session] = None) -> Dict[str, Any]:
+        # Same semantics as an SSM path, /<project>/<deployment>/group does not match /<project>/<deployment>/group2
+        prefix = path if path.endswith("/") else f"{path}/"
+        return {name: json.loads(item["value"]["S"]) for name, item in self._query(prefix, session=session).items()}
+
+    def list_names(self, prefix: str, contains_string: str, session: Optional[Session] = None) -> List[str]:
+        return [name for name in self._query(prefix, session=session) if contains_string in name]
+
+    def delete(self, names: List[str], session: Optional[Session] = None) -> None:
+        self._batch_write(
+            requests=[{"DeleteRequest": {"Key": self._key(name)}} for name in dict.fromkeys(names)], session=session
+        )
+
+    def _query(self, prefix: str, session: Optional[Session] = None) -> Dict[str, Dict[str, Any]]:
+        client = boto3_client("dynamodb", session=session)
+        if len(prefix.split("/")) > 3:
+            # The prefix includes the deployment, only its partition is read
+            paginator = client.get_paginator("query")
+            pages = paginator.paginate(
+                TableName=self.table_name,
+                KeyConditionExpression="#deployment = :deployment AND begins_with(#name, :prefix)",
+                ExpressionAttributeNames={"#deployment": "deployment", "#name": "name"},
+                ExpressionAttributeValues={
+                    ":deployment": {"S": self._partition_key(prefix)},
+                    ":prefix": {"S": prefix},
+                },
+            )
+        else:
+            paginator = client.get_paginator("scan")
+            pages = paginator.paginate(
+                TableName=self.table_name,
+                FilterExpression="begins_with(#name, :prefix)",
+                ExpressionAttributeNames={"#name": "name"},
+                ExpressionAttributeValues={":prefix": {"S": prefix}},
+            )
+        return {item["name"]["S"]: item for page in pages for item in page.get("Items", [])}
+
+    def _batch_write(self, requests: List[Dict[str, Any]], session: Optional[Session] = None) -> None:
+        client = boto3_client("dynamodb", session=session)
+        for i in range(0, len(requests), _DYNAMODB_BATCH_WRITE_MAX_ITEMS):
+            request: Dict[str, Any] = {self.table_name: requests[i : i + _DYNAMODB_BATCH_WRITE_MAX_ITEMS]}
+            for attempt in range(_DYNAMODB_MAX_RETRIES + 1):
+                request = client.batch_write_item(RequestItems=request).get("UnprocessedItems", {})
+                if not request:
+                    break
+                time.sleep(self._retry_delay(attempt))
+            else:
+                raise seedfarmer.errors.SeedFarmerException(
+                    f"Unable to write the module state to the DynamoDB table {self.table_name}, throttled"
+                )
+
+
+class SqliteModuleStateStore(ModuleStateStore):
+    """
+    SqliteModuleStateStore
+        Persists the module state in a local SQLite database, for tests and local development.
+        The session is ignored, the state of all target accounts and regions is stored in the same database.
+
+    Parameters
+    ----------
+    path : str
+        The path of the SQLite database file, or ":memory:"
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS module_state (name TEXT PRIMARY KEY, value TEXT)")
+
+    def put(self, name: str, obj: Dict[str, Any], session: Optional[Session] = None, compress: bool = False) -> None:
+        self.put_many(items={name: obj}, session=session)
+
+    def put_many(
+        self, items: Dict[str, Dict[str, Any]], session: Optional[Session] = None, compress: bool = False
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO module_state (name, value) VALUES (?, ?)",
+                [(name, json.dumps(obj=obj, sort_keys=True)) for name, obj in items.items()],
+            )
+
+    def get(self, name: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM module_state WHERE name = ?", (name,)).fetchone()
+        return cast(Dict[str, Any], json.loads(row[0])) if row else None
+
+    def get_by_path(self, path: str, session: Optional[Session] = None) -> Dict[str, Any]:
+        prefix = path if path.endswith("/") else f"{path}/"
+        return {name: json.loads(value) for name, value in self._select(prefix)}
+
+    def list_names(self, prefix: str, contains_string: str, session: Optional[Session] = None) -> List[str]:
+        return [name for name, _ in self._select(prefix) if contains_string in name]
+
+    def delete(self, names: List[str], session: Optional[Session] = None) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany("DELETE FROM module_state WHERE name = ?", [(name,) for name in names])
+
+    def _select(self, prefix: str) -> List[Any]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT name, value FROM module_state WHERE substr(name, 1, ?) = ? ORDER BY name",
+                (len(prefix), prefix),
+            ).fetchall()
+
+
+_store: Optional[ModuleStateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_module_state_store() -> ModuleStateStore:
+    """
+    get_module_state_store
+        Get the store of the module state, as configured with `moduleStateStore` in the seedfarmer.yaml
+
+    Returns
+    -------
+    ModuleStateStore
+        The store of the module state, SSM Parameter Store by default
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            spec = config.MODULE_STATE_STORE
+            if spec is None or spec.type == ModuleStateStoreType.SSM:
+                _store = SsmModuleStateStore()
+            elif spec.type == ModuleStateStoreType.DYNAMODB:
+                _store = DynamoDbModuleStateStore(table_name=spec.table_name or f"{config.PROJECT}-module-state")
+            else:
+                path = spec.path or MODULE_STATE_SQLITE_PATH
+                _store = SqliteModuleStateStore(
+                    path=path if path == ":memory:" else os.path.join(config.OPS_ROOT, path)
+                )
+            _logger.debug("Using the module state store %s", type(_store).__name__)
+        return _store
+
+
+def check_remote_module_state_store() -> None:
+    """
+    check_remote_module_state_store
+        Verify the configured store can be reached by remote deployments, the CodeBuild
+        projects store and remove the module metadata with the module role
+
+    Raises
+    ------
+    InvalidConfigurationError
+        If the SQLite store is configured, it is local to the machine running the CLI
+    """
+    spec = config.MODULE_STATE_STORE
+    if spec is not None and spec.type == ModuleStateStoreType.SQLITE:
+        raise seedfarmer.errors.InvalidConfigurationError(
+            "The sqlite module_state_store is local to the machine running the CLI and cannot be used by "
+            "remote deployments, use the ssm or dynamodb module_state_store or deploy with --local"
+        )
+
+
+def set_module_state_store(store: Optional[ModuleStateStore]) -> None:
+    """
+    set_module_state_store
+        Set the store of the module state, replacing the configured store
+
+    Parameters
+    ----------
+    store : Optional[ModuleStateStore]
+        The store of the module state, None to go back to the configured store
+    """
+    global _store
+    with _store_lock:
+        _store = store
@@ -14,7 +14,13 @@
 
 from seedfarmer.models._base import CamelModel, ModuleRef, ValueFromRef, ValueRef
 from seedfarmer.models._deploy_spec import BuildPhase, BuildPhases, BuildType, DeploySpec, ExecutionType
-from seedfarmer.models._project_spec import ProjectSpec
+from seedfarmer.models._project_spec import (
+    BotocoreRetryMode,
+    BotocoreSpec,
+    ModuleStateStoreSpec,
+    ModuleStateStoreType,
+    ProjectSpec,
+)
 
 __all__ = [
     "CamelModel",
@@ -26,5 +32,9 @@ __all__ = [
     "BuildType",
     "DeploySpec",
     "ExecutionType",
+    "BotocoreRetryMode",
+    "BotocoreSpec",
+    "ModuleStateStoreSpec",
+    "ModuleStateStoreType",
     "ProjectSpec",
 ]
@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from enum import Enum
 from typing import Optional, Union
 
 from pydantic import model_validator
@@ -20,6 +21,43 @@ from seedfarmer.errors.seedfarmer_errors import InvalidManifestError
 from seedfarmer.models._base import CamelModel
 
 
+class ModuleStateStoreType(Enum):
+    SSM = "ssm"
+    DYNAMODB = "dynamodb"
+    SQLITE = "sqlite"
+
+
+class ModuleStateStoreSpec(CamelModel):
+    """
+    ModuleStateStoreSpec
+    This represents where the state of the deployed modules (manifests, deployspecs,
+    md5 hashes and metadata) is persisted.  SSM Parameter Store is the default.
+    """
+
+    type: ModuleStateStoreType = ModuleStateStoreType.SSM
+    table_name: Optional[str] = None
+    path: Optional[str] = None
+
+
+class BotocoreRetryMode(Enum):
+    LEGACY = "legacy"
+    STANDARD = "standard"
+    ADAPTIVE = "adaptive"
+
+
+class BotocoreSpec(CamelModel):
+    """
+    BotocoreSpec
+    This represents the connection pool and retry settings of the AWS clients
+    used by seedfarmer.  The environment variables `SEEDFARMER_BOTOCORE_*` take
+    precedence over these settings.
+    """
+
+    max_pool_connections: int = 10
+    max_attempts: int = 5
+    retry_mode: BotocoreRetryMode = BotocoreRetryMode.LEGACY
+
+
 class ProjectSpec(CamelModel):
     """
     ProjectSpec
@@ -32,6 +70,8 @@ class ProjectSpec(CamelModel):
     project_policy_path: Optional[str] = None
     seedfarmer_version: Optional[Union[int, str]] = None
     manifest_validation_fail_on_unknown_fields: bool = False
+    module_state_store: Optional[ModuleStateStoreSpec] = None
+    botocore: Optional[BotocoreSpec] = None
 
     @model_validator(mode="after")
     def check_for_extra_fields(self) -> "ProjectSpec":
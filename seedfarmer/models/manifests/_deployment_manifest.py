@@ -66,6 +66,7 @@ class RegionMapping(CamelModel):
     seedfarmer_artifact_bucket: Optional[str] = None
     role_prefix: Optional[str] = None
     policy_prefix: Optional[str] = None
+    max_concurrent_builds: Optional[int] = None
 
 
 class TargetAccountMapping(CamelModel):
@@ -89,6 +90,7 @@ class TargetAccountMapping(CamelModel):
     _region_index: Dict[str, RegionMapping] = PrivateAttr(default_factory=dict)
     role_prefix: Optional[str] = None
     policy_prefix: Optional[str] = None
+    max_concurrent_builds: Optional[int] = None
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -180,6 +182,10 @@ class DeploymentManifest(CamelModel):
     description: Optional[str] = None
     target_account_mappings: List[TargetAccountMapping] = []
     force_dependency_redeploy: Optional[bool] = False
+    dependency_scheduling: Optional[bool] = False
+    max_concurrent_modules: Optional[int] = None
+    max_concurrent_builds: Optional[int] = None
+    content_addressed_bundles: Optional[bool] = False
     archive_secret: Optional[str] = None
     _default_account: Optional[TargetAccountMapping] = PrivateAttr(default=None)
     _account_alias_index: Dict[str, TargetAccountMapping] = PrivateAttr(default_factory=dict)
@@ -12,7 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import PrivateAttr, model_validator
 from pydantic.json_schema import SkipJsonSchema
@@ -22,6 +22,9 @@ from seedfarmer.models._base import CamelModel, ValueFromRef
 from seedfarmer.models._deploy_spec import DeploySpec
 from seedfarmer.utils import upper_snake_case
 
+if TYPE_CHECKING:
+    from seedfarmer.checksum import ModuleInventory
+
 
 class ModuleParameter(ValueFromRef):
     _upper_snake_case: str = PrivateAttr()
@@ -104,6 +107,8 @@ class ModuleManifest(CamelModel):
     pypi_mirror_secret: Optional[str] = None
     _target_account_id: Optional[str] = PrivateAttr(default=None)
     _local_path: Optional[str] = PrivateAttr(default=None)
+    _file_inventory: Optional["ModuleInventory"] = PrivateAttr(default=None)
+    _use_hash_cache: bool = PrivateAttr(default=True)
 
     def __init__(self, **kwargs: Any) -> None:
         from seedfarmer.utils import batch_replace_env
@@ -123,3 +128,15 @@ class ModuleManifest(CamelModel):
 
     def get_local_path(self) -> Optional[str]:
         return self._local_path
+
+    def set_file_inventory(self, file_inventory: "ModuleInventory") -> None:
+        self._file_inventory = file_inventory
+
+    def get_file_inventory(self) -> Optional["ModuleInventory"]:
+        return self._file_inventory
+
+    def set_use_hash_cache(self, use_hash_cache: bool) -> None:
+        self._use_hash_cache = use_hash_cache
+
+    def get_use_hash_cache(self) -> bool:
+        return self._use_hash_cache
@@ -17,9 +17,11 @@ from seedfarmer.services._service_utils import (
     boto3_resource,
     create_new_session,
     create_new_session_with_creds,
+    create_new_session_with_refreshable_creds,
     get_botocore_config,
     get_region,
     get_sts_identity_info,
+    set_sts_identity_info,
 )
 
 __all__ = [
@@ -30,5 +32,7 @@ __all__ = [
     "boto3_resource",
     "create_new_session",
     "create_new_session_with_creds",
+    "create_new_session_with_refreshable_creds",
     "get_sts_identity_info",
+    "set_sts_identity_info",
 ]
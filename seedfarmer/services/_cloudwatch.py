@@ -13,7 +13,7 @@
 #    limitations under the License.
 
 from datetime import datetime, timezone
-from typing import Callable, List, NamedTuple, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
 
 from boto3 import Session
 
@@ -129,3 +129,60 @@ def get_log_events(
         events=events,
         last_timestamp=events[-1].timestamp if events else None,
     )
+
+
+class LogTailer:
+    """Tail a CloudWatch Logs stream
+
+    The forward token of the stream is kept between calls to ``tail`` so each call only
+    pages through, and yields, the events logged since the previous call.
+
+    Parameters
+    ----------
+    group_name : str
+        Name of the CloudWatch Logs group
+    stream_name : str
+        Name of the CloudWatch Logs stream in the group
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+    """
+
+    def __init__(
+        self,
+        group_name: str,
+        stream_name: str,
+        session: Optional[Union[Callable[[], Session], Session]] = None,
+    ) -> None:
+        self.group_name = group_name
+        self.stream_name = stream_name
+        self._session = session
+        self._next_token: Optional[str] = None
+
+    def tail(self) -> Iterator[CloudWatchEvent]:
+        """Get the CloudWatch Logs Events logged since the previous call
+
+        Yields
+        -------
+        Iterator[CloudWatchEvent]
+            CloudWatch Logs Events, oldest first
+        """
+        client = boto3_client("logs", session=self._session)
+        while True:
+            args: Dict[str, Any] = {
+                "logGroupName": self.group_name,
+                "logStreamName": self.stream_name,
+                "startFromHead": True,
+            }
+            if self._next_token is not None:
+                args["nextToken"] = self._next_token
+            response = client.get_log_events(**args)
+            for event in response.get("events", []):
+                yield CloudWatchEvent(
+                    timestamp=datetime.fromtimestamp(event["timestamp"] / 1000.0, tz=timezone.utc),
+                    message=str(event.get("message", "")),
+                )
+            # The same token is returned once the end of the stream is reached
+            previous_token = self._next_token
+            self._next_token = response["nextForwardToken"]
+            if self._next_token == previous_token:
+                return
@@ -14,6 +14,7 @@
 
 import io
 import logging
+import threading
 import time
 from datetime import datetime, timezone
 from enum import Enum
@@ -29,6 +30,9 @@ from seedfarmer.utils import LiteralStr
 
 _logger: logging.Logger = logging.getLogger(__name__)
 _BUILD_WAIT_POLLING_DELAY: float = 5  # SECONDS
+_BUILD_WAIT_SLOW_POLLING_DELAY: float = 15  # SECONDS, while all builds are in the BUILD phase
+_BUILD_WAIT_FAST_POLLING_DELAY: float = 2  # SECONDS, while a build is finishing
+_BATCH_GET_BUILDS_MAX_IDS = 100
 
 
 class BuildStatus(Enum):
@@ -199,37 +203,10 @@ def start(
     return response["build"]["id"]
 
 
-def fetch_build_info(build_id: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> BuildInfo:
-    """Fetch info on a CodeBuild execution
-
-    Parameters
-    ----------
-    build_id : str
-        CodeBuild Execution/Build Id
-    session: Optional[Union[Callable[[], Session], Session]], optional
-        Optional Session or function returning a Session to use for all boto3 operations, by default None
-
-    Returns
-    -------
-    BuildInfo
-        Info on the CodeBuild execution
-
-    Raises
-    ------
-    RuntimeError
-        If the Build Id is not found
-    """
-    client = boto3_client("codebuild", session=session)
-    response: Dict[str, List[Dict[str, Any]]] = try_it(
-        f=client.batch_get_builds, ex=botocore.exceptions.ClientError, ids=[build_id], max_num_tries=5
-    )
-    if not response["builds"]:
-        raise RuntimeError(f"CodeBuild build {build_id} not found.")
-    build = response["builds"][0]
-    now = datetime.now(timezone.utc)
+def _build_info(build: Dict[str, Any], now: datetime) -> BuildInfo:
     log_enabled = True if build.get("logs", {}).get("cloudWatchLogs", {}).get("status") == "ENABLED" else False
     return BuildInfo(
-        build_id=build_id,
+        build_id=build["id"],
         status=BuildStatus(value=build["buildStatus"]),
         current_phase=BuildPhaseType(value=build["currentPhase"]),
         start_time=build["startTime"],
@@ -258,9 +235,166 @@ def fetch_build_info(build_id: str, session: Optional[Union[Callable[[], Session
     )
 
 
+def fetch_build_info(build_id: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> BuildInfo:
+    """Fetch info on a CodeBuild execution
+
+    Parameters
+    ----------
+    build_id : str
+        CodeBuild Execution/Build Id
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+
+    Returns
+    -------
+    BuildInfo
+        Info on the CodeBuild execution
+
+    Raises
+    ------
+    RuntimeError
+        If the Build Id is not found
+    """
+    client = boto3_client("codebuild", session=session)
+    response: Dict[str, List[Dict[str, Any]]] = try_it(
+        f=client.batch_get_builds, ex=botocore.exceptions.ClientError, ids=[build_id], max_num_tries=5
+    )
+    if not response["builds"]:
+        raise RuntimeError(f"CodeBuild build {build_id} not found.")
+    return _build_info(build=response["builds"][0], now=datetime.now(timezone.utc))
+
+
+def _polling_delay(build: BuildInfo) -> float:
+    if build.status is not BuildStatus.in_progress or build.current_phase in [
+        BuildPhaseType.post_build,
+        BuildPhaseType.upload_artifacts,
+        BuildPhaseType.finalizing,
+        BuildPhaseType.completed,
+    ]:
+        return _BUILD_WAIT_FAST_POLLING_DELAY
+    if build.current_phase is BuildPhaseType.build:
+        return _BUILD_WAIT_SLOW_POLLING_DELAY
+    return _BUILD_WAIT_POLLING_DELAY
+
+
+class _BuildWaiter:
+    def __init__(self, build_id: str, session: Optional[Union[Callable[[], Session], Session]]) -> None:
+        self.build_id = build_id
+        self.session = session
+        self.build: Optional[BuildInfo] = None
+        self.error: Optional[Exception] = None
+        self.updated = threading.Event()
+
+
+class _BuildMonitor:
+    """Polls the status of all the CodeBuild executions being waited on
+
+    A single thread fetches the in-flight builds of each session with one `batch_get_builds` call per
+    tick (of up to 100 builds) and hands the results to the waiting deployments. The thread stops
+    once no build is waited on and is started again by the next `watch`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, _BuildWaiter] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, build_id: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> _BuildWaiter:
+        waiter = _BuildWaiter(build_id=build_id, session=session)
+        with self._lock:
+            self._waiters[build_id] = waiter
+            self._start()
+        return waiter
+
+    def unwatch(self, build_id: str) -> None:
+        with self._lock:
+            self._waiters.pop(build_id, None)
+
+    def ensure_running(self) -> None:
+        with self._lock:
+            if self._waiters:
+                self._start()
+
+    def _start(self) -> None:
+        # Called with the lock held, (re)starts the thread if it is not running
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="codebuild-monitor", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            delay = _BUILD_WAIT_POLLING_DELAY
+            while True:
+                # Wait before the first poll, the builds have just been started
+                time.sleep(delay)
+                with self._lock:
+                    if not self._waiters:
+                        return
+                    waiters = list(self._waiters.values())
+                delay = self._poll(waiters)
+        finally:
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _poll(self, waiters: List[_BuildWaiter]) -> float:
+        # Builds can only be fetched with the session (account and region) they were started with
+        sessions: Dict[int, List[_BuildWaiter]] = {}
+        for waiter in waiters:
+            sessions.setdefault(id(waiter.session), []).append(waiter)
+
+        delay = _BUILD_WAIT_SLOW_POLLING_DELAY
+        for session_waiters in sessions.values():
+            try:
+                client = boto3_client("codebuild", session=session_waiters[0].session)
+            except Exception as e:
+                self._fail(waiters=session_waiters, error=e)
+                continue
+            for i in range(0, len(session_waiters), _BATCH_GET_BUILDS_MAX_IDS):
+                chunk = session_waiters[i : i + _BATCH_GET_BUILDS_MAX_IDS]
+                try:
+                    response: Dict[str, List[Dict[str, Any]]] = try_it(
+                        f=client.batch_get_builds,
+                        ex=botocore.exceptions.ClientError,
+                        ids=[waiter.build_id for waiter in chunk],
+                        max_num_tries=5,
+                    )
+                    now = datetime.now(timezone.utc)
+                    builds = {build["id"]: build for build in response["builds"]}
+                    chunk_builds = {
+                        waiter.build_id: _build_info(build=builds[waiter.build_id], now=now)
+                        for waiter in chunk
+                        if waiter.build_id in builds
+                    }
+                except Exception as e:
+                    self._fail(waiters=chunk, error=e)
+                    continue
+
+                for waiter in chunk:
+                    if waiter.build_id in chunk_builds:
+                        waiter.build = chunk_builds[waiter.build_id]
+                        delay = min(delay, _polling_delay(waiter.build))
+                    else:
+                        waiter.error = RuntimeError(f"CodeBuild build {waiter.build_id} not found.")
+                    waiter.updated.set()
+        return delay
+
+    @staticmethod
+    def _fail(waiters: List[_BuildWaiter], error: Exception) -> None:
+        for waiter in waiters:
+            waiter.error = error
+            waiter.updated.set()
+
+
+_build_monitor = _BuildMonitor()
+
+
 def wait(build_id: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> Iterable[BuildInfo]:
     """Wait for completion of a CodeBuild execution
 
+    The status is polled by a monitor shared by all the CodeBuild executions being waited on, more
+    often while a build is finishing than while it is in the BUILD phase.
+
     Parameters
     ----------
     build_id : str
@@ -279,20 +413,30 @@ def wait(build_id: str, session: Optional[Union[Callable[[], Session], Session]]
         Info on the CodeBuild execution
 
     """
-    build = fetch_build_info(build_id=build_id, session=session)
-    while build.status is BuildStatus.in_progress:
-        time.sleep(_BUILD_WAIT_POLLING_DELAY)
-
-        last_phase = build.current_phase
-        last_status = build.status
-        build = fetch_build_info(build_id=build_id, session=session)
-
-        if build.current_phase is not last_phase or build.status is not last_status:
-            _logger.info("phase: %s %s (%s)", build.current_phase.value, build.build_id, build.status.value)
-
-        yield build
-
-    yield build
+    waiter = _build_monitor.watch(build_id=build_id, session=session)
+    try:
+        build: Optional[BuildInfo] = None
+        while build is None or build.status is BuildStatus.in_progress:
+            # Restart the monitor if it stopped without updating this build
+            while not waiter.updated.wait(timeout=_BUILD_WAIT_SLOW_POLLING_DELAY * 4):
+                _build_monitor.ensure_running()
+            waiter.updated.clear()
+            if waiter.error is not None:
+                raise waiter.error
+
+            last_build = build
+            build = cast(BuildInfo, waiter.build)
+
+            if (
+                last_build is None
+                or build.current_phase is not last_build.current_phase
+                or build.status is not last_build.status
+            ):
+                _logger.info("phase: %s %s (%s)", build.current_phase.value, build.build_id, build.status.value)
+
+            yield build
+    finally:
+        _build_monitor.unwatch(build_id=build_id)
 
 
 def generate_spec(
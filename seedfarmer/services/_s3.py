@@ -13,22 +13,40 @@
 #    limitations under the License.
 
 import concurrent.futures
+import functools
 import logging
 import math
+import os
 import random
+import threading
 import time
+from datetime import datetime
 from itertools import repeat
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, cast
+from typing import IO, Any, Callable, Dict, List, Optional, TypeVar, Union, cast
 
 from boto3 import Session
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
+import seedfarmer.errors
 from seedfarmer.services._service_utils import boto3_client, boto3_resource
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
 ChunkifyItemType = TypeVar("ChunkifyItemType")
 
+# Multipart transfer settings for uploads, overridable with environment variables
+S3_MULTIPART_THRESHOLD_ENV = "SEEDFARMER_S3_MULTIPART_THRESHOLD"
+S3_MULTIPART_CHUNKSIZE_ENV = "SEEDFARMER_S3_MULTIPART_CHUNKSIZE"
+S3_MAX_CONCURRENCY_ENV = "SEEDFARMER_S3_MAX_CONCURRENCY"
+_S3_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+_S3_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+_S3_MAX_CONCURRENCY = 10
+# Upload progress is logged every time this share of the upload completes, at INFO level for uploads of
+# at least this size (DEBUG otherwise)
+_UPLOAD_PROGRESS_STEP = 0.1
+_UPLOAD_PROGRESS_INFO_SIZE = 64 * 1024 * 1024
+
 
 def _chunkify(
     lst: List[ChunkifyItemType], num_chunks: int = 1, max_length: Optional[int] = None
@@ -49,6 +67,80 @@ def _delete_objects(
             client_s3.delete_objects(Bucket=bucket, Delete={"Objects": chunk})  # type: ignore[typeddict-item]
 
 
+@functools.lru_cache(maxsize=None)
+def get_transfer_config() -> TransferConfig:
+    """Get the multipart transfer settings used for uploads
+
+    The defaults can be overridden (in bytes and threads) with the
+    `SEEDFARMER_S3_MULTIPART_THRESHOLD`, `SEEDFARMER_S3_MULTIPART_CHUNKSIZE` and
+    `SEEDFARMER_S3_MAX_CONCURRENCY` environment variables
+
+    Returns
+    -------
+    TransferConfig
+        The transfer settings
+    """
+    return TransferConfig(
+        multipart_threshold=_getenv_int(S3_MULTIPART_THRESHOLD_ENV, _S3_MULTIPART_THRESHOLD),
+        multipart_chunksize=_getenv_int(S3_MULTIPART_CHUNKSIZE_ENV, _S3_MULTIPART_CHUNKSIZE),
+        max_concurrency=_getenv_int(S3_MAX_CONCURRENCY_ENV, _S3_MAX_CONCURRENCY),
+        use_threads=True,
+    )
+
+
+def _getenv_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise seedfarmer.errors.InvalidConfigurationError(f"Invalid value of {name}: {value!r}, expected an integer")
+
+
+class _UploadProgress:
+    """Upload callback logging the progress of an upload, called concurrently by the transfer threads"""
+
+    def __init__(self, bucket: str, key: str, size: Optional[int]) -> None:
+        self._location = f"s3://{bucket}/{key}"
+        self._size = size
+        self._level = logging.INFO if size and size >= _UPLOAD_PROGRESS_INFO_SIZE else logging.DEBUG
+        self._uploaded = 0
+        self._next_step = _UPLOAD_PROGRESS_STEP
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __call__(self, bytes_amount: int) -> None:
+        with self._lock:
+            self._uploaded += bytes_amount
+            if not self._size:
+                return
+            progress = self._uploaded / self._size
+            if progress < self._next_step and self._uploaded < self._size:
+                return
+            while self._next_step <= progress:
+                self._next_step += _UPLOAD_PROGRESS_STEP
+            elapsed = max(time.monotonic() - self._started, 1e-6)
+            _logger.log(
+                self._level,
+                "Uploaded %d of %d bytes (%d%%) to %s at %.1f MiB/s",
+                self._uploaded,
+                self._size,
+                int(progress * 100),
+                self._location,
+                self._uploaded / elapsed / (1024 * 1024),
+            )
+
+
+def _fileobj_size(fileobj: IO[bytes]) -> Optional[int]:
+    if not fileobj.seekable():
+        return None
+    position = fileobj.tell()
+    size = fileobj.seek(0, os.SEEK_END) - position
+    fileobj.seek(position)
+    return size
+
+
 def list_keys(bucket: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> List[Dict[str, str]]:
     """List the keys/objects in an S3 Buket
 
@@ -137,9 +229,13 @@ def delete_bucket(bucket: str, session: Optional[Union[Callable[[], Session], Se
 
 
 def upload_file(
-    src: str, bucket: str, key: str, session: Optional[Union[Callable[[], Session], Session]] = None
+    src: str,
+    bucket: str,
+    key: str,
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+    transfer_config: Optional[TransferConfig] = None,
 ) -> None:
-    """Upload file to S3 Bucket
+    """Upload file to S3 Bucket, in concurrent parts for large files
 
     Parameters
     ----------
@@ -151,9 +247,49 @@ def upload_file(
         Key name to upload to
     session: Optional[Union[Callable[[], Session], Session]], optional
         Optional Session or function returning a Session to use for all boto3 operations, by default None
+    transfer_config: Optional[TransferConfig], optional
+        Multipart transfer settings, by default the settings of `get_transfer_config`
     """
     client_s3 = boto3_client("s3", session=session)
-    client_s3.upload_file(Filename=src, Bucket=bucket, Key=key)
+    client_s3.upload_file(
+        Filename=src,
+        Bucket=bucket,
+        Key=key,
+        Config=transfer_config or get_transfer_config(),
+        Callback=_UploadProgress(bucket=bucket, key=key, size=os.path.getsize(src)),
+    )
+
+
+def upload_fileobj(
+    fileobj: IO[bytes],
+    bucket: str,
+    key: str,
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+    transfer_config: Optional[TransferConfig] = None,
+) -> None:
+    """Upload a file object to S3 Bucket, in concurrent parts for large files
+
+    Parameters
+    ----------
+    fileobj : IO[bytes]
+        Readable binary file object, uploaded from its current position
+    bucket : str
+        S3 Bucket
+    key : str
+        Key name to upload to
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+    transfer_config: Optional[TransferConfig], optional
+        Multipart transfer settings, by default the settings of `get_transfer_config`
+    """
+    client_s3 = boto3_client("s3", session=session)
+    client_s3.upload_fileobj(
+        Fileobj=fileobj,
+        Bucket=bucket,
+        Key=key,
+        Config=transfer_config or get_transfer_config(),
+        Callback=_UploadProgress(bucket=bucket, key=key, size=_fileobj_size(fileobj)),
+    )
 
 
 def list_s3_objects(
@@ -224,6 +360,35 @@ def object_exists(bucket: str, key: str, session: Optional[Union[Callable[[], Se
         return True
 
 
+def get_object_last_modified(
+    bucket: str, key: str, session: Optional[Union[Callable[[], Session], Session]] = None
+) -> Optional[datetime]:
+    """Get the last modified time of an object in an S3 Bucket with a HEAD request
+
+    Parameters
+    ----------
+    bucket : str
+        S3 Bucket name
+    key : str
+        Key to check
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+
+    Returns
+    -------
+    Optional[datetime]
+        The last modified time of the object, None if the object does not exist
+    """
+    try:
+        response = boto3_client("s3", session=session).head_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ["404", "NoSuchKey"]:
+            return None
+        else:
+            raise
+    return response["LastModified"]
+
+
 def copy_s3_object(
     src_bucket: str,
     src_key: str,
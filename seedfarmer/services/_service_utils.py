@@ -12,28 +12,34 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import functools
 import logging
 import os
 import random
+import threading
 import time
+import weakref
 from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Tuple, Union, cast, overload
 
 import boto3
 import botocore.config
 import botocore.exceptions
+import botocore.session
 from boto3 import Session
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
-from botocore.credentials import Credentials
+from botocore.credentials import Credentials, RefreshableCredentials
 
 import seedfarmer
 import seedfarmer.errors
+from seedfarmer.models import BotocoreRetryMode, BotocoreSpec
 
 if TYPE_CHECKING:
     from boto3.resources.base import ServiceResource
     from botocore.client import BaseClient
     from mypy_boto3_cloudformation.client import CloudFormationClient
     from mypy_boto3_codebuild import CodeBuildClient
+    from mypy_boto3_dynamodb import DynamoDBClient
     from mypy_boto3_iam import IAMClient, IAMServiceResource
     from mypy_boto3_logs.client import CloudWatchLogsClient
     from mypy_boto3_s3 import S3Client, S3ServiceResource
@@ -43,6 +49,19 @@ if TYPE_CHECKING:
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+# Connection pool and retry settings of the clients, overriding the `botocore` settings of seedfarmer.yaml
+BOTOCORE_MAX_POOL_CONNECTIONS_ENV = "SEEDFARMER_BOTOCORE_MAX_POOL_CONNECTIONS"
+BOTOCORE_MAX_ATTEMPTS_ENV = "SEEDFARMER_BOTOCORE_MAX_ATTEMPTS"
+BOTOCORE_RETRY_MODE_ENV = "SEEDFARMER_BOTOCORE_RETRY_MODE"
+
+# Clients created from a session are cached per thread, keyed by the session and service, so repeated calls reuse the
+# client and its connection pool. The sessions are weakly referenced so a cached client does not outlive its session.
+_client_cache = threading.local()
+
+# The identity of a session does not change when its credentials are refreshed, so it is resolved once per session
+_sts_identity_cache: "weakref.WeakKeyDictionary[Session, Tuple[str, str, str]]" = weakref.WeakKeyDictionary()
+_sts_identity_cache_lock = threading.Lock()
+
 
 def setup_proxies() -> Dict[str, Optional[str]]:
     proxies = {}
@@ -52,11 +71,37 @@ def setup_proxies() -> Dict[str, Optional[str]]:
     return proxies
 
 
+@functools.lru_cache(maxsize=None)
 def get_botocore_config() -> botocore.config.Config:
+    """Get the config of the clients, built once and shared by all clients
+
+    The connection pool size, max attempts and retry mode are read from the `botocore`
+    settings of seedfarmer.yaml, and can be overridden with the
+    `SEEDFARMER_BOTOCORE_MAX_POOL_CONNECTIONS`, `SEEDFARMER_BOTOCORE_MAX_ATTEMPTS` and
+    `SEEDFARMER_BOTOCORE_RETRY_MODE` environment variables
+
+    Returns
+    -------
+    botocore.config.Config
+        The client config
+    """
+    botocore_spec = seedfarmer.config.BOTOCORE or BotocoreSpec()
+    try:
+        max_pool_connections = int(os.getenv(BOTOCORE_MAX_POOL_CONNECTIONS_ENV, botocore_spec.max_pool_connections))
+        max_attempts = int(os.getenv(BOTOCORE_MAX_ATTEMPTS_ENV, botocore_spec.max_attempts))
+        retry_mode = BotocoreRetryMode(os.getenv(BOTOCORE_RETRY_MODE_ENV, botocore_spec.retry_mode.value))
+    except ValueError as e:
+        raise seedfarmer.errors.InvalidConfigurationError(f"Invalid botocore configuration: {e}")
+    _logger.debug(
+        "Botocore config: max_pool_connections=%s, max_attempts=%s, retry_mode=%s",
+        max_pool_connections,
+        max_attempts,
+        retry_mode.value,
+    )
     return botocore.config.Config(
-        retries={"max_attempts": 5},
+        retries={"max_attempts": max_attempts, "mode": retry_mode.value},
         connect_timeout=10,
-        max_pool_connections=10,
+        max_pool_connections=max_pool_connections,
         user_agent_extra=f"seedfarmer/{seedfarmer.__version__} seedfarmer/project/{seedfarmer.config.PROJECT}",
         proxies=setup_proxies(),  # type: ignore[arg-type]
     )
@@ -77,6 +122,32 @@ def create_new_session_with_creds(
     )
 
 
+def create_new_session_with_refreshable_creds(
+    refresh_using: Callable[[], Dict[str, str]], region_name: Optional[str] = None
+) -> Session:
+    """
+    Create a session with credentials refreshed before they expire, with no impact on the clients created.
+
+    Parameters
+    ----------
+    refresh_using : Callable[[], Dict[str, str]]
+        Fetches new credentials, returning the `access_key`, `secret_key`, `token` and `expiry_time` (ISO 8601)
+    region_name : str, optional
+        The region of the session
+
+    Returns
+    -------
+    Session
+        The session, fetching its first credentials when created
+    """
+    credentials = RefreshableCredentials.create_from_metadata(
+        metadata=refresh_using(), refresh_using=refresh_using, method="sts-assume-role"
+    )
+    botocore_session = botocore.session.get_session()
+    botocore_session._credentials = credentials  # type: ignore[attr-defined]
+    return boto3.Session(botocore_session=botocore_session, region_name=region_name)
+
+
 @overload
 def boto3_client(
     service_name: Literal["codebuild"],
@@ -173,6 +244,18 @@ def boto3_client(
 ) -> "CloudWatchLogsClient": ...
 
 
+@overload
+def boto3_client(
+    service_name: Literal["dynamodb"],
+    session: Optional[Union[Callable[[], Session], Session]] = ...,
+    region_name: Optional[str] = ...,
+    profile: Optional[str] = ...,
+    aws_access_key_id: Optional[str] = ...,
+    aws_secret_access_key: Optional[str] = ...,
+    aws_session_token: Optional[str] = ...,
+) -> "DynamoDBClient": ...
+
+
 @overload
 def boto3_client(
     service_name: str,
@@ -204,11 +287,22 @@ def boto3_client(
         )
     else:
         if isinstance(session, Session):
-            return session.client(service_name=service_name, use_ssl=True, config=get_botocore_config())  # type: ignore
+            return _get_cached_client(service_name=service_name, session=session)
         else:
             raise TypeError(f"Expected boto3.Session instance, got {type(session)}")
 
 
+def _get_cached_client(service_name: str, session: Session) -> "BaseClient":
+    if not hasattr(_client_cache, "clients"):
+        _client_cache.clients = weakref.WeakKeyDictionary()
+    session_clients: Dict[str, "BaseClient"] = _client_cache.clients.setdefault(session, {})
+    if service_name not in session_clients:
+        session_clients[service_name] = session.client(  # type: ignore[call-overload]
+            service_name=service_name, use_ssl=True, config=get_botocore_config()
+        )
+    return session_clients[service_name]
+
+
 @overload
 def boto3_resource(
     service_name: Literal["iam"],
@@ -291,10 +385,35 @@ def _call_sts(
 def get_sts_identity_info(
     session: Optional[Union[Callable[[], Session], Session]] = None, profile: Optional[str] = None
 ) -> Tuple[str, str, str]:
+    if isinstance(session, Session):
+        with _sts_identity_cache_lock:
+            identity_info = _sts_identity_cache.get(session)
+        if identity_info is not None:
+            return identity_info
     sts_info = _call_sts(session=session, profile=profile)
-    return cast(
+    identity_info = cast(
         Tuple[str, str, str], (sts_info.get("Account"), sts_info.get("Arn"), str(sts_info.get("Arn")).split(":")[1])
     )
+    if isinstance(session, Session):
+        with _sts_identity_cache_lock:
+            _sts_identity_cache[session] = identity_info
+    return identity_info
+
+
+def set_sts_identity_info(session: Session, arn: str) -> None:
+    """
+    Set the identity of a session already known, for example from an AssumeRole response, skipping the STS call
+
+    Parameters
+    ----------
+    session : Session
+        The session of the identity
+    arn : str
+        The ARN of the identity, the account id and partition are parsed from it
+    """
+    arn_parts = arn.split(":")
+    with _sts_identity_cache_lock:
+        _sts_identity_cache[session] = (arn_parts[4], arn, arn_parts[1])
 
 
 def create_signed_request(
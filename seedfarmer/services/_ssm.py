@@ -12,49 +12,87 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import base64
 import json
 import logging
+import random
 import time
+import zlib
 from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 from boto3 import Session
+from botocore.exceptions import ClientError
 
 import seedfarmer.errors
 from seedfarmer.services._service_utils import boto3_client
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+_PUT_PARAMETER_MAX_RETRIES = 5
+_THROTTLING_ERROR_CODES = ["TooManyUpdates", "ThrottlingException"]
+
+# Compressed values are stored as the marker followed by the base64 encoded zlib compressed JSON.
+# The version in the marker allows changing the encoding while the values written before remain readable.
+COMPRESSED_VALUE_MARKER = "seedfarmer:zlib:v1:"
+_COMPRESSION_MIN_SIZE = 2048
+
+_GET_PARAMETERS_MAX_NAMES = 10
+_DESCRIBE_PARAMETERS_MAX_RESULTS = 50
+
+
+def _dumps(obj: Dict[str, Any], compress: bool = False) -> str:
+    value = json.dumps(obj=obj, sort_keys=True)
+    if compress and len(value) >= _COMPRESSION_MIN_SIZE:
+        compressed = COMPRESSED_VALUE_MARKER + base64.b64encode(zlib.compress(value.encode("utf-8"), 9)).decode("ascii")
+        # Values that do not compress well are stored as plain JSON
+        if len(compressed) < len(value):
+            return compressed
+    return value
+
+
+def _loads(value: str) -> Any:
+    if value.startswith(COMPRESSED_VALUE_MARKER):
+        value = zlib.decompress(base64.b64decode(value[len(COMPRESSED_VALUE_MARKER) :])).decode("utf-8")
+    return json.loads(value)
+
 
 def put_parameter(
-    name: str, obj: Dict[str, Any], session: Optional[Union[Callable[[], Session], Session]] = None
+    name: str,
+    obj: Dict[str, Any],
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+    compress: bool = False,
 ) -> None:
     client = boto3_client(service_name="ssm", session=session)
-    retries = 3
-    while retries > 0:
+    value = _dumps(obj=obj, compress=compress)
+    retries = 0
+    while True:
         try:
             client.put_parameter(
                 Name=name,
-                Value=str(json.dumps(obj=obj, sort_keys=True)),
+                Value=value,
                 Overwrite=True,
                 Tier="Intelligent-Tiering",
                 Type="String",
             )
-            break
-        except client.exceptions.TooManyUpdates as err:
-            if retries < 3:
-                _logger.warning("An error occurred (TooManyUpdates) when calling the PutParameter operation. Retrying")
-                retries -= 1
-                time.sleep(2 ** (4 - retries))
-
-            if retries == 0:
+            return
+        except ClientError as err:
+            if err.response["Error"]["Code"] not in _THROTTLING_ERROR_CODES:
+                raise
+            if retries == _PUT_PARAMETER_MAX_RETRIES:
                 raise seedfarmer.errors.SeedFarmerException(err)  # type: ignore[arg-type]
+            retries += 1
+            _logger.warning(
+                "An error occurred (%s) when calling the PutParameter operation. Retrying",
+                err.response["Error"]["Code"],
+            )
+            time.sleep(random.uniform(1, 2**retries))
 
 
 def get_parameter(name: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> Dict[str, Any]:
     client = boto3_client(service_name="ssm", session=session)
     json_str: str = client.get_parameter(Name=name)["Parameter"]["Value"]
     try:
-        return cast(Dict[str, Any], json.loads(json_str))
+        return cast(Dict[str, Any], _loads(json_str))
     except json.decoder.JSONDecodeError:
         _logger.warn("Parameter %s cannot be parsed, returning it as-is - %s ", name, json_str)
         return cast(Dict[str, Any], json_str)
@@ -68,7 +106,7 @@ def get_parameter_if_exists(
         json_str: str = client.get_parameter(Name=name)["Parameter"]["Value"]
     except client.exceptions.ParameterNotFound:
         return None
-    return cast(Dict[str, Any], json.loads(json_str))
+    return cast(Dict[str, Any], _loads(json_str))
 
 
 def does_parameter_exist(name: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> bool:
@@ -108,6 +146,8 @@ def list_parameters_with_filter(
     client = boto3_client(service_name="ssm", session=session)
     paginator = client.get_paginator("describe_parameters")
 
+    # Only the parameters under the prefix are scanned, the Name filter key can be used once so the
+    # string is matched on the client
     response_iterator = paginator.paginate(
         ParameterFilters=[
             {
@@ -117,13 +157,14 @@ def list_parameters_with_filter(
                     "String",
                 ],
             },
-            {"Key": "Name", "Option": "Contains", "Values": [contains_string]},
+            {"Key": "Name", "Option": "BeginsWith", "Values": [prefix]},
         ],
+        PaginationConfig={"PageSize": _DESCRIBE_PARAMETERS_MAX_RESULTS},
     )
     ret: List[str] = []
     for page in response_iterator:
         for par in page["Parameters"]:
-            if str(par["Name"]).startswith(f"{prefix}"):
+            if contains_string in str(par["Name"]):
                 ret.append(par["Name"])
     return ret
 
@@ -149,14 +190,56 @@ def get_all_parameter_data_by_path(
     ret: Dict[str, Union[str, Dict[str, Any]]] = {}
     for page in response_iterator:
         for par in page["Parameters"]:
-            try:
-                ret[par["Name"]] = json.loads(par["Value"])
-            except json.decoder.JSONDecodeError:
-                _logger.warn("Parameter %s cannot be parsed, returning it as-is", par["Name"])
-                ret[par["Name"]] = par["Value"]
+            ret[par["Name"]] = _parameter_value(par)
+    return ret
+
+
+def get_parameters(
+    names: List[str], session: Optional[Union[Callable[[], Session], Session]] = None
+) -> Dict[str, Union[str, Dict[str, Any]]]:
+    client = boto3_client(service_name="ssm", session=session)
+    ret: Dict[str, Union[str, Dict[str, Any]]] = {}
+    for i in range(0, len(names), _GET_PARAMETERS_MAX_NAMES):
+        for par in client.get_parameters(Names=names[i : i + _GET_PARAMETERS_MAX_NAMES])["Parameters"]:
+            ret[par["Name"]] = _parameter_value(par)
+    return ret
+
+
+def get_parameter_versions_by_path(
+    prefix: str, session: Optional[Union[Callable[[], Session], Session]] = None
+) -> Dict[str, str]:
+    """Version and last modified date of each parameter under a path, without fetching the values"""
+    client = boto3_client(service_name="ssm", session=session)
+    paginator = client.get_paginator("describe_parameters")
+    response_iterator = paginator.paginate(
+        ParameterFilters=[
+            {
+                "Key": "Type",
+                "Option": "Equals",
+                "Values": [
+                    "String",
+                ],
+            },
+            {"Key": "Name", "Option": "BeginsWith", "Values": [prefix if prefix.endswith("/") else f"{prefix}/"]},
+        ],
+        PaginationConfig={"PageSize": _DESCRIBE_PARAMETERS_MAX_RESULTS},
+    )
+    ret: Dict[str, str] = {}
+    for page in response_iterator:
+        for par in page["Parameters"]:
+            # Versions restart when a parameter is deleted and created again, the date tells them apart
+            ret[par["Name"]] = f"{par['Version']}:{par['LastModifiedDate'].isoformat()}"
     return ret
 
 
+def _parameter_value(par: Any) -> Union[str, Dict[str, Any]]:
+    try:
+        return cast(Dict[str, Any], _loads(par["Value"]))
+    except json.decoder.JSONDecodeError:
+        _logger.warn("Parameter %s cannot be parsed, returning it as-is", par["Name"])
+        return cast(str, par["Value"])
+
+
 def delete_parameters(parameters: List[str], session: Optional[Union[Callable[[], Session], Session]] = None) -> None:
     if parameters:
         if len(parameters) < 10:
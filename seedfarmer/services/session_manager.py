@@ -21,14 +21,20 @@ from abc import abstractmethod
 from functools import update_wrapper
 from threading import Thread
 from time import sleep
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, cast
 
 import botocore.exceptions
 from boto3 import Session
-from botocore.credentials import Credentials
+from botocore.credentials import Credentials, RefreshableCredentials
 
 import seedfarmer.errors
-from seedfarmer.services import boto3_client, create_new_session, create_new_session_with_creds, get_sts_identity_info
+from seedfarmer.services import (
+    boto3_client,
+    create_new_session,
+    create_new_session_with_refreshable_creds,
+    get_sts_identity_info,
+    set_sts_identity_info,
+)
 from seedfarmer.utils import get_deployment_role_arn, get_toolchain_role_arn, get_toolchain_role_name
 
 if TYPE_CHECKING:
@@ -37,6 +43,15 @@ if TYPE_CHECKING:
 _logger: logging.Logger = logging.getLogger(__name__)
 
 
+def _get_credentials_metadata(role: "AssumeRoleResponseTypeDef") -> Dict[str, str]:
+    return {
+        "access_key": role["Credentials"]["AccessKeyId"],
+        "secret_key": role["Credentials"]["SecretAccessKey"],
+        "token": role["Credentials"]["SessionToken"],
+        "expiry_time": role["Credentials"]["Expiration"].isoformat(),
+    }
+
+
 class SingletonMeta(type):
     """
     This is a thread-safe implementation of Singleton.
@@ -120,6 +135,11 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
     created: bool = False
     reaper: Thread = None  # type: ignore
     reaper_interval: int = 900  # every 15 minutes
+    # Credentials expiring within this window are refreshed by the reaper, matching the botocore advisory refresh
+    refresh_window: int = 15 * 60
+    # Each session is created once under its own lock, so threads creating different sessions do not wait on each other
+    _session_locks: Dict[str, threading.Lock] = {}
+    _session_locks_lock: threading.Lock = threading.Lock()
 
     def __init__(self) -> None:
         super().__init__()
@@ -176,11 +196,10 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
                 "The SessionManager object was never properly created...)"
             )
 
-        toolchain_role = self.sessions[self.TOOLCHAIN_KEY][self.ROLE]
+        # Freezing the credentials refreshes them first if they are close to expiry
+        frozen = self.toolchain_session.get_credentials().get_frozen_credentials()  # type: ignore[union-attr]
         creds = Credentials(
-            access_key=toolchain_role["Credentials"]["AccessKeyId"],
-            secret_key=toolchain_role["Credentials"]["SecretAccessKey"],
-            token=toolchain_role["Credentials"]["SessionToken"],
+            access_key=cast(str, frozen.access_key), secret_key=cast(str, frozen.secret_key), token=frozen.token
         )
         return creds
 
@@ -192,19 +211,30 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
         toolchain_region = self.config.get("toolchain_region")
         if not self.created:
             raise seedfarmer.errors.InvalidConfigurationError("The SessionManager object was never properly created...")
-        if session_key not in self.sessions.keys():
+        session_entry = self.sessions.get(session_key)
+        if session_entry is not None:
+            return session_entry[self.SESSION]  # type: ignore[no-any-return]
+        with self._get_session_lock(session_key):
+            session_entry = self.sessions.get(session_key)
+            if session_entry is not None:
+                return session_entry[self.SESSION]  # type: ignore[no-any-return]
             _logger.info(f"Creating Session for {session_key}")
             self._check_for_toolchain()
             toolchain_role = self.sessions[self.TOOLCHAIN_KEY][self.ROLE]
-            # the boto sessions are not thread safe, so create a new one for the toolchain role every time to be sure
-            sts_toolchain_client = boto3_client(
-                service_name="sts",
-                aws_access_key_id=toolchain_role["Credentials"]["AccessKeyId"],
-                aws_secret_access_key=toolchain_role["Credentials"]["SecretAccessKey"],
-                aws_session_token=toolchain_role["Credentials"]["SessionToken"],
-                region_name=toolchain_region if toolchain_region else region_name,
-            )
-            partition = sts_toolchain_client.get_caller_identity()["Arn"].split(":")[1]
+
+            def _get_sts_toolchain_client() -> Any:
+                # the boto sessions are not thread safe, so create a new one for the toolchain role every time
+                # to be sure, using the current toolchain credentials as the deployment role is also refreshed
+                toolchain_creds = self.get_toolchain_credentials()
+                return boto3_client(
+                    service_name="sts",
+                    aws_access_key_id=toolchain_creds.access_key,
+                    aws_secret_access_key=toolchain_creds.secret_key,
+                    aws_session_token=toolchain_creds.token,
+                    region_name=toolchain_region if toolchain_region else region_name,
+                )
+
+            _, _, partition = get_sts_identity_info(session=self.toolchain_session)
             deployment_role_arn = get_deployment_role_arn(
                 partition=partition,
                 deployment_account_id=account_id,
@@ -216,43 +246,71 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
                 f"""The assumed toolchain role {toolchain_role["AssumedRoleUser"]["Arn"]} will
                  try and assume the deployment role: {deployment_role_arn}"""
             )
-            try:
-                deployment_role = sts_toolchain_client.assume_role(
-                    RoleArn=deployment_role_arn,
-                    RoleSessionName="deployment_role",
-                )
-            except botocore.exceptions.ClientError as ce:
-                raise seedfarmer.errors.InvalidSessionError(
-                    f"""
-                {ce}
-                The toolchain role cannot assume a deployment role for this account / region mapping.
-                Make sure that the toolchain role is in the trust policy of the deployment role...
-                   (HINT: if not, your seedfarmer bootstrap is incorrect. Use the SeedFarmer CLI to bootstrap.)
-                Make sure that the account id is correct in your targetAccountMappings of the deployment manifest.
-                   (HINT: look at the arn of the deployment role...the account id is REALLY important to be correct.
-                   This is gotten from the deployment manifest under the targetAccountMappings section.)
-                """
-                )
-            deployment_session = create_new_session_with_creds(
-                aws_access_key_id=deployment_role["Credentials"]["AccessKeyId"],
-                aws_secret_access_key=deployment_role["Credentials"]["SecretAccessKey"],
-                aws_session_token=deployment_role["Credentials"]["SessionToken"],
-                region_name=region_name,
+
+            def _assume_deployment_role() -> "AssumeRoleResponseTypeDef":
+                try:
+                    return cast(
+                        "AssumeRoleResponseTypeDef",
+                        _get_sts_toolchain_client().assume_role(
+                            RoleArn=deployment_role_arn,
+                            RoleSessionName="deployment_role",
+                        ),
+                    )
+                except botocore.exceptions.ClientError as ce:
+                    raise seedfarmer.errors.InvalidSessionError(
+                        f"""
+                    {ce}
+                    The toolchain role cannot assume a deployment role for this account / region mapping.
+                    Make sure that the toolchain role is in the trust policy of the deployment role...
+                       (HINT: if not, your seedfarmer bootstrap is incorrect. Use the SeedFarmer CLI to bootstrap.)
+                    Make sure that the account id is correct in your targetAccountMappings of the deployment manifest.
+                       (HINT: look at the arn of the deployment role...the account id is REALLY important to be
+                       correct. This is gotten from the deployment manifest under the targetAccountMappings section.)
+                    """
+                    )
+
+            session_entry = self._create_session_entry(
+                session_key=session_key, assume_role=_assume_deployment_role, region_name=region_name
             )
-            self.sessions[session_key] = {self.SESSION: deployment_session, self.ROLE: deployment_role}
-            return deployment_session
-        else:
-            return self.sessions[session_key][self.SESSION]  # type: ignore[no-any-return]
+            self.sessions[session_key] = session_entry
+            return session_entry[self.SESSION]  # type: ignore[no-any-return]
 
     # These methods below should not be called outside of this class
 
+    def _get_session_lock(self, session_key: str) -> threading.Lock:
+        with self._session_locks_lock:
+            return self._session_locks.setdefault(session_key, threading.Lock())
+
     def _check_for_toolchain(self) -> None:
         if self.TOOLCHAIN_KEY not in self.sessions.keys():
-            _logger.info("Creating toolchain session")
-            session, role = self._get_toolchain()
-            self.sessions = {self.TOOLCHAIN_KEY: {self.SESSION: session, self.ROLE: role}}
+            with self._get_session_lock(self.TOOLCHAIN_KEY):
+                if self.TOOLCHAIN_KEY not in self.sessions.keys():
+                    _logger.info("Creating toolchain session")
+                    self.sessions = {self.TOOLCHAIN_KEY: self._get_toolchain()}
+
+    def _create_session_entry(
+        self, session_key: str, assume_role: Callable[[], "AssumeRoleResponseTypeDef"], region_name: Optional[str]
+    ) -> Dict[str, Any]:
+        # The session credentials are refreshed by assuming the role again when they are close to their expiration,
+        # so clients already created from the session pick up the new credentials
+        session_entry: Dict[str, Any] = {}
+
+        def _refresh() -> Dict[str, str]:
+            if self.ROLE in session_entry:
+                _logger.info(f"Refreshing credentials of the {session_key} session")
+            session_entry[self.ROLE] = assume_role()
+            return _get_credentials_metadata(session_entry[self.ROLE])
+
+        session_entry[self.SESSION] = create_new_session_with_refreshable_creds(
+            refresh_using=_refresh, region_name=region_name
+        )
+        # The assumed role identity is known, so the account id and partition of the session are never fetched from STS
+        set_sts_identity_info(
+            session=session_entry[self.SESSION], arn=session_entry[self.ROLE]["AssumedRoleUser"]["Arn"]
+        )
+        return session_entry
 
-    def _get_toolchain(self) -> Tuple[Session, "AssumeRoleResponseTypeDef"]:
+    def _get_toolchain(self) -> Dict[str, Any]:
         region_name = self.config.get("region_name")
         profile_name = self.config.get("profile")
         project_name = self.config.get("project_name")
@@ -286,29 +344,29 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
                       """
         )
         user_client = boto3_client(service_name="sts", session=user_session)
-        try:
-            toolchain_role = user_client.assume_role(
-                RoleArn=toolchain_role_arn,
-                RoleSessionName="toolchainrole",
-            )
-        except botocore.exceptions.ClientError as ce:
-            raise seedfarmer.errors.InvalidSessionError(
-                f"""
-            {ce}
-            The session used to call SeedFarmer is not permitted to assume the toolchain role.
-            Verify the user tied to your active session is in the trust policy of the toolchain role
-            or use a session that DOES have that user.
-            """
-            )
-        toolchain_session = create_new_session_with_creds(
-            aws_access_key_id=toolchain_role["Credentials"]["AccessKeyId"],
-            aws_secret_access_key=toolchain_role["Credentials"]["SecretAccessKey"],
-            aws_session_token=toolchain_role["Credentials"]["SessionToken"],
+
+        def _assume_toolchain_role() -> "AssumeRoleResponseTypeDef":
+            try:
+                return user_client.assume_role(
+                    RoleArn=toolchain_role_arn,
+                    RoleSessionName="toolchainrole",
+                )
+            except botocore.exceptions.ClientError as ce:
+                raise seedfarmer.errors.InvalidSessionError(
+                    f"""
+                {ce}
+                The session used to call SeedFarmer is not permitted to assume the toolchain role.
+                Verify the user tied to your active session is in the trust policy of the toolchain role
+                or use a session that DOES have that user.
+                """
+                )
+
+        return self._create_session_entry(
+            session_key=self.TOOLCHAIN_KEY,
+            assume_role=_assume_toolchain_role,
             region_name=toolchain_region if toolchain_region else region_name,
         )
 
-        return toolchain_session, toolchain_role
-
     def _setup_reaper(self) -> None:
         _logger.info("Starting Session Reaper")
         t = Thread(target=self._reap_sessions, args=(self.reaper_interval,), daemon=True, name="SessionReaper")
@@ -319,8 +377,19 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
         _logger.debug("Reaper Is Set")
         while True:
             sleep(interval)
-            _logger.info(f"Reaping Sessions - sleeping for {interval} seconds")
-            self.sessions = {}
+            _logger.info(f"Refreshing Sessions close to expiry - sleeping for {interval} seconds")
+            self._refresh_sessions()
+
+    def _refresh_sessions(self) -> None:
+        # Only the sessions whose credentials are close to expiry are refreshed, each at its own expiration,
+        # so the deployment sessions are not all recreated at once
+        for session_key, session_entry in list(self.sessions.items()):
+            creds = session_entry[self.SESSION].get_credentials()
+            if isinstance(creds, RefreshableCredentials) and creds.refresh_needed(refresh_in=self.refresh_window):
+                try:
+                    creds.get_frozen_credentials()
+                except Exception as e:
+                    _logger.warning(f"Failed to refresh the credentials of the {session_key} session: {e}")
 
 
 class SessionManagerLocalImpl(ISessionManager, metaclass=SingletonMeta):
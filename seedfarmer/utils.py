@@ -18,6 +18,7 @@ import logging
 import os
 import re
 import shutil
+from threading import Lock
 from typing import Any, Dict, List, Optional, Union
 
 import humps
@@ -34,6 +35,9 @@ _logger: logging.Logger = logging.getLogger(__name__)
 
 NoDatesSafeLoader = yaml.SafeLoader
 
+_path_locks: Dict[str, Lock] = {}
+_path_locks_guard = Lock()
+
 
 class CfnSafeYamlLoader(yaml.SafeLoader):
     """
@@ -303,6 +307,24 @@ def batch_replace_env(payload: Dict[str, Any]) -> Dict[str, Any]:
     return payload
 
 
+def get_path_lock(path: str) -> Lock:
+    """
+    Get the lock guarding a local path, so concurrent threads do not clone or extract into the same directory
+
+    Parameters
+    ----------
+    path : str
+        The local path to guard
+
+    Returns
+    -------
+    Lock
+        The same Lock object for every call with the same path
+    """
+    with _path_locks_guard:
+        return _path_locks.setdefault(os.path.abspath(path), Lock())
+
+
 def create_output_dir(name: str, path_override: Optional[str] = None) -> str:
     """Helper function for creating or clearing a .seedfarmer.out output directory by default
 
@@ -41,3 +41,198 @@ def test_private_methods_checksum():
 
     _check_non = checksum._generate_file_hash(filepath=f"{file_tst}_bak")
     assert _check_non == "d41d8cd98f00b204e9800998ecf8427e"
+
+
+def _write_module(tmp_path):
+    module_dir = tmp_path / "modules" / "hashed"
+    module_dir.mkdir(parents=True)
+    for name, content in [("a.txt", "alpha"), ("b.txt", "bravo")]:
+        (module_dir / name).write_text(content)
+        # Outside of the racy window so the hashes are cached
+        os.utime(module_dir / name, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+    return module_dir
+
+
+@pytest.mark.checksum
+def test_checksum_hash_cache(tmp_path, mocker):
+    import seedfarmer.checksum as checksum
+
+    module_dir = _write_module(tmp_path)
+    uncached = checksum.get_module_md5(project_path=str(tmp_path), module_path="modules/hashed", use_cache=False)
+    assert not (tmp_path / checksum.HASH_CACHE_DIR / checksum.HASH_CACHE_FILE).exists()
+
+    assert checksum.get_module_md5(project_path=str(tmp_path), module_path="modules/hashed") == uncached
+    # The cache is only written once the modules are hashed
+    assert not (tmp_path / checksum.HASH_CACHE_DIR / checksum.HASH_CACHE_FILE).exists()
+    checksum.save_hash_caches()
+    assert (tmp_path / checksum.HASH_CACHE_DIR / checksum.HASH_CACHE_FILE).exists()
+
+    # A fresh process reuses the cache without reading the files again
+    mocker.patch.dict(checksum._hash_caches, clear=True)
+    spy = mocker.spy(checksum, "_generate_file_hash")
+    assert checksum.get_module_md5(project_path=str(tmp_path), module_path="modules/hashed") == uncached
+    assert spy.call_count == 0
+
+    # Changed files are hashed again
+    (module_dir / "a.txt").write_text("charlie")
+    changed = checksum.get_module_md5(project_path=str(tmp_path), module_path="modules/hashed")
+    assert changed != uncached
+    assert spy.call_count == 1
+    assert changed == checksum.get_module_md5(project_path=str(tmp_path), module_path="modules/hashed", use_cache=False)
+
+
+@pytest.mark.checksum
+def test_checksum_hash_cache_eviction(tmp_path, mocker):
+    import seedfarmer.checksum as checksum
+
+    module_dir = _write_module(tmp_path)
+    mocker.patch.dict(checksum._hash_caches, clear=True)
+    checksum.get_module_md5(project_path=str(tmp_path), module_path="modules/hashed")
+    assert len(checksum.get_hash_cache(str(tmp_path))._entries) == 2
+    checksum.save_hash_caches()
+
+    (module_dir / "b.txt").unlink()
+    mocker.patch.dict(checksum._hash_caches, clear=True)
+    hash_cache = checksum.get_hash_cache(str(tmp_path))
+    assert list(hash_cache._entries.keys()) == [str(module_dir / "a.txt")]
+
+    # An unreadable cache is ignored and rebuilt
+    (tmp_path / checksum.HASH_CACHE_DIR / checksum.HASH_CACHE_FILE).write_text("{not json")
+    mocker.patch.dict(checksum._hash_caches, clear=True)
+    assert checksum.get_hash_cache(str(tmp_path))._entries == {}
+
+
+def _legacy_module_files(project_path, module_path, excluded_files):
+    # The two-scandir walk get_module_md5 used before _list_module_files, evaluating each .gitignore per path
+    import seedfarmer.checksum as checksum
+
+    ignore_maps = checksum._evaluate_gitignore(project_path=project_path, module_path=module_path)
+    all_files = []
+
+    def scandir(dirname):
+        all_files.extend(
+            [
+                f.path
+                for f in os.scandir(dirname)
+                if f.is_file()
+                and os.path.split(f)[1] not in excluded_files
+                and not checksum._evaluate_file(f.path, ignore_maps)
+            ]
+        )
+        for f in os.scandir(dirname):
+            if f.is_dir() and not f.name.startswith(".") and not checksum._evaluate_file(f.path, ignore_maps):
+                scandir(f.path)
+
+    scandir(os.path.join(project_path, module_path))
+    return all_files
+
+
+@pytest.mark.checksum
+def test_list_module_files_matches_gitignore_evaluation(tmp_path):
+    import seedfarmer.checksum as checksum
+
+    layout = {
+        ".gitignore": "*.log\n/module/generated/\n",
+        "module/.gitignore": "build/\n*.tmp\n!keep.tmp\n# comment\n\nnested/skip_*.txt\n",
+        "module/README.md": "readme",
+        "module/app.py": "app",
+        "module/debug.log": "log",
+        "module/keep.tmp": "keep",
+        "module/drop.tmp": "drop",
+        "module/build/out.txt": "built",
+        "module/generated/code.py": "gen",
+        "module/.hidden/secret.txt": "hidden",
+        "module/.env": "env",
+        "module/nested/skip_me.txt": "skip",
+        "module/nested/keep_me.txt": "keep",
+        "module/nested/deeper/README.md": "deeper readme",
+        "module/nested/deeper/data.bin": "data",
+    }
+    for path, content in layout.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content)
+
+    fixtures = [
+        (str(tmp_path), "module", ["README.md", ".gitignore"]),
+        (
+            os.path.join(os.getcwd(), "test", "unit-test", "mock_data"),
+            os.path.join("modules", "module-test"),
+            [],
+        ),
+    ]
+    for project_path, module_path, excluded_files in fixtures:
+        files = checksum._list_module_files(project_path, module_path, excluded_files)
+        legacy_files = _legacy_module_files(project_path, module_path, excluded_files)
+        assert files and sorted(files) == sorted(legacy_files)
+        assert checksum.get_module_md5(
+            project_path=project_path, module_path=module_path, excluded_files=excluded_files, use_cache=False
+        ) == checksum._consolidate_hash([checksum._generate_file_hash(f) for f in legacy_files])
+
+    files = checksum._list_module_files(str(tmp_path), "module", ["README.md", ".gitignore"])
+    assert sorted(os.path.relpath(f, tmp_path / "module") for f in files) == [
+        ".env",
+        "app.py",
+        "keep.tmp",
+        os.path.join("nested", "deeper", "data.bin"),
+        os.path.join("nested", "keep_me.txt"),
+    ]
+
+
+@pytest.mark.checksum
+def test_hash_files_concurrently(tmp_path, mocker):
+    import hashlib
+
+    import seedfarmer.checksum as checksum
+
+    large = tmp_path / "large.bin"
+    large.write_bytes(os.urandom(256 * 1024))
+    files = [str(large)]
+    for i in range(50):
+        (tmp_path / f"file{i}.txt").write_text(f"content {i}")
+        files.append(str(tmp_path / f"file{i}.txt"))
+    files.append(str(tmp_path / "missing.txt"))
+    serial = [checksum._generate_file_hash(f) for f in files]
+
+    # Memory mapped files hash the same as files read in blocks
+    mocker.patch.object(checksum, "_HASH_MMAP_MIN_SIZE", 128 * 1024)
+    mmap_spy = mocker.spy(checksum.mmap, "mmap")
+    assert checksum._hash_files(files) == serial
+    assert mmap_spy.call_count == 1
+    assert serial[0] == hashlib.md5(large.read_bytes(), usedforsecurity=False).hexdigest()
+    assert checksum._consolidate_hash(checksum._hash_files(list(reversed(files)))) == checksum._consolidate_hash(serial)
+
+
+@pytest.mark.checksum
+def test_module_inventory(tmp_path):
+    import seedfarmer.checksum as checksum
+    import seedfarmer.mgmt.bundle as bundle
+
+    layout = {
+        ".gitignore": "venv/\n*.local.json\n",
+        "module/app.py": "app",
+        "module/README.md": "readme",
+        "module/config.local.json": "local",
+        "module/.python-version": "3.11",
+        "module/.env": "env",
+        "module/venv/lib/site.py": "site",
+        "module/node_modules/pkg/index.js": "index",
+        "module/src/__pycache__/app.pyc": "pyc",
+        "module/src/handler.py": "handler",
+    }
+    for path, content in layout.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content)
+
+    inventory = checksum.ModuleInventory(project_path=str(tmp_path), module_path="module", excluded_files=["README.md"])
+    assert sorted(inventory.md5_files) == sorted(_legacy_module_files(str(tmp_path), "module", ["README.md"]))
+    assert checksum.get_module_md5(
+        project_path=str(tmp_path), module_path="module", excluded_files=["README.md"], use_cache=False
+    ) == checksum.get_module_md5(project_path=str(tmp_path), module_path="module", use_cache=False, inventory=inventory)
+
+    # The gitignored venv is only walked once the bundle files are requested
+    assert len(inventory._pending_bundle_dirs) == 1
+    module_dir = str(tmp_path / "module")
+    expected = sorted(os.path.relpath(f, module_dir) for f in bundle._list_files(os.path.realpath(module_dir)))
+    assert sorted(inventory.bundle_files) == expected
+    assert os.path.join("venv", "lib", "site.py") in expected
+    assert sorted(inventory.bundle_files) == expected
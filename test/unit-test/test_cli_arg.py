@@ -38,6 +38,15 @@ _PROJECT = config.PROJECT
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+_deployed_module_keys = {
+    ("optionals", "networking"): {
+        "group": "optionals",
+        "module_name": "networking",
+        "account_id": "123456789012",
+        "region": "us-east-1",
+    }
+}
+
 
 @pytest.fixture(scope="function")
 def aws_credentials():
@@ -439,7 +448,7 @@ def test_list_help():
 @pytest.mark.parametrize("session", [None, boto3_client])
 def test_list_deployspec_deployed_error(session, mocker):
     mocker.patch("seedfarmer.cli_groups._list_group.mi.get_deployspec", return_value=None)
-    mocker.patch("seedfarmer.cli_groups._list_group.du.generate_deployed_manifest", return_value=None)
+    mocker.patch("seedfarmer.cli_groups._list_group.du.get_deployed_module_keys", return_value=None)
     _test_command(
         list,
         options=[
@@ -462,7 +471,7 @@ def test_list_deployspec_deployed_error(session, mocker):
 @pytest.mark.list_deployspec
 def test_list_deployspec_deployed_none(session_manager, mocker):
     mocker.patch("seedfarmer.cli_groups._list_group.mi.get_deployspec", return_value=None)
-    mocker.patch("seedfarmer.cli_groups._list_group.du.generate_deployed_manifest", return_value=None)
+    mocker.patch("seedfarmer.cli_groups._list_group.du.get_deployed_module_keys", return_value=None)
     _test_command(
         list,
         options=[
@@ -485,10 +494,7 @@ def test_list_deployspec_deployed_none(session_manager, mocker):
 @pytest.mark.list_deployspec
 def test_list_deployspec_missing_session(session_manager, mocker):
     mocker.patch("seedfarmer.cli_groups._list_group.mi.get_deployspec", return_value={"deploy": {"commands": "echo"}})
-    mocker.patch(
-        "seedfarmer.cli_groups._list_group.du.generate_deployed_manifest",
-        return_value=(DeploymentManifest(**mock_manifests.deployment_manifest)),
-    )
+    mocker.patch("seedfarmer.cli_groups._list_group.du.get_deployed_module_keys", return_value=_deployed_module_keys)
     mocker.patch(
         "seedfarmer.cli_groups._list_group.mi.get_deployspec", return_value=DeploySpec(**mock_manifests.deployspec)
     )
@@ -514,10 +520,7 @@ def test_list_deployspec_missing_session(session_manager, mocker):
 @pytest.mark.list_deployspec
 def test_list_deployspec(session_manager, mocker):
     mocker.patch("seedfarmer.cli_groups._list_group.mi.get_deployspec", return_value={"deploy": {"commands": "echo"}})
-    mocker.patch(
-        "seedfarmer.cli_groups._list_group.du.generate_deployed_manifest",
-        return_value=(DeploymentManifest(**mock_manifests.deployment_manifest)),
-    )
+    mocker.patch("seedfarmer.cli_groups._list_group.du.get_deployed_module_keys", return_value=_deployed_module_keys)
     mocker.patch(
         "seedfarmer.cli_groups._list_group.mi.get_deployspec", return_value=DeploySpec(**mock_manifests.deployspec)
     )
@@ -663,7 +666,7 @@ def test_list_moduledata_missing_deployment_option():
 @pytest.mark.list
 @pytest.mark.list_moduledata
 def test_list_moduledata_no_dep_manifest(session_manager, mocker):
-    mocker.patch("seedfarmer.cli_groups._list_group.du.generate_deployed_manifest", return_value=None)
+    mocker.patch("seedfarmer.cli_groups._list_group.du.get_deployed_module_keys", return_value=None)
     _test_command(
         sub_command=list,
         options=[
@@ -685,10 +688,7 @@ def test_list_moduledata_no_dep_manifest(session_manager, mocker):
 @pytest.mark.list
 @pytest.mark.list_moduledata
 def test_list_moduledata(session_manager, mocker):
-    mocker.patch(
-        "seedfarmer.cli_groups._list_group.du.generate_deployed_manifest",
-        return_value=(DeploymentManifest(**mock_manifests.deployment_manifest)),
-    )
+    mocker.patch("seedfarmer.cli_groups._list_group.du.get_deployed_module_keys", return_value=_deployed_module_keys)
     mocker.patch(
         "seedfarmer.cli_groups._list_group.mi.get_module_metadata", return_value=mock_manifests.sample_metadata
     )
@@ -714,10 +714,7 @@ def test_list_moduledata(session_manager, mocker):
 @pytest.mark.list
 @pytest.mark.list_moduledata
 def test_list_moduledata_export_envs(session_manager, mocker):
-    mocker.patch(
-        "seedfarmer.cli_groups._list_group.du.generate_deployed_manifest",
-        return_value=(DeploymentManifest(**mock_manifests.deployment_manifest)),
-    )
+    mocker.patch("seedfarmer.cli_groups._list_group.du.get_deployed_module_keys", return_value=_deployed_module_keys)
     mocker.patch(
         "seedfarmer.cli_groups._list_group.mi.get_module_metadata", return_value=mock_manifests.sample_metadata
     )
@@ -747,10 +744,7 @@ def test_list_moduledata_export_envs(session_manager, mocker):
 @pytest.mark.list
 @pytest.mark.list_moduledata
 def test_list_moduledata_mod_not_found(session_manager, mocker):
-    mocker.patch(
-        "seedfarmer.cli_groups._list_group.du.generate_deployed_manifest",
-        return_value=(DeploymentManifest(**mock_manifests.deployment_manifest)),
-    )
+    mocker.patch("seedfarmer.cli_groups._list_group.du.get_deployed_module_keys", return_value=_deployed_module_keys)
     mocker.patch(
         "seedfarmer.cli_groups._list_group.mi.get_module_metadata", return_value=mock_manifests.sample_metadata
     )
@@ -818,7 +812,8 @@ def test_list_all_moduledata(session_manager, mocker):
         return_value=(DeploymentManifest(**mock_manifests.deployment_manifest)),
     )
     mocker.patch(
-        "seedfarmer.cli_groups._list_group.mi.get_module_metadata", return_value=mock_manifests.sample_metadata
+        "seedfarmer.cli_groups._list_group.du.get_deployed_modules_metadata",
+        return_value={"test-module": mock_manifests.sample_metadata},
     )
 
     _test_command(
@@ -1582,6 +1577,42 @@ def test_taint(mocker):
     )
 
 
+@pytest.mark.metadata
+def test_taint_invalidates_cached_module_info(aws_credentials, mocker, tmp_path):
+    import boto3
+
+    import seedfarmer.mgmt.module_info as mi
+    import seedfarmer.services._ssm as ssm
+
+    mocker.patch.object(type(config), "OPS_ROOT", new_callable=mocker.PropertyMock, return_value=str(tmp_path))
+    cache_key = "123456789012-us-east-1"
+    with mock_aws():
+        session = boto3.Session(region_name="us-east-1")
+        ssm.put_parameter(name=mi._manifest_key("myapp", "test", "mymodule1"), obj={"name": "mymodule1"})
+        ssm.put_parameter(
+            name=mi._md5_module_key("myapp", "test", "mymodule1", mi.ModuleConst.BUNDLE), obj={"hash": "1"}
+        )
+        mi.get_parameter_data_cache(deployment="myapp", session=session, cache_key=cache_key)
+        store = mi.get_module_state_store()
+        stale_versions = store.get_versions_by_path(path=mi._deployment_key("myapp"), session=session)
+
+        mocker.patch(
+            "seedfarmer.cli_groups._taint_group.du.get_deployed_module_keys",
+            return_value={("test", "mymodule1"): {"account_id": "123456789012", "region": "us-east-1"}},
+        )
+        session_manager = mocker.patch("seedfarmer.cli_groups._taint_group.SessionManager")
+        session_manager.return_value.get_or_create.return_value.get_deployment_session.return_value = session
+        _test_command(
+            sub_command=taint, options=["module", "-d", "myapp", "-g", "test", "-m", "mymodule1"], exit_code=0
+        )
+
+        # The apply that follows lists the versions from before the taint, the module is still redeployed
+        mocker.patch.object(type(store), "get_versions_by_path", return_value=stale_versions)
+        data = mi.get_parameter_data_cache(deployment="myapp", session=session, cache_key=cache_key)
+        assert mi._manifest_key("myapp", "test", "mymodule1") in data
+        assert not mi.does_md5_match("myapp", "test", "mymodule1", "1", mi.ModuleConst.BUNDLE, data, session=session)
+
+
 @pytest.mark.metadata
 def test_taint_missing_param(mocker):
     mocker.patch("seedfarmer.cli_groups._taint_group.mi.remove_module_md5", return_value=None)
@@ -448,6 +448,153 @@ def test_deploy_deployment(session_manager, mocker):
     )
 
 
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_deploy_deployment_plan_is_deterministic(session_manager, mocker):
+    import random
+    import time
+
+    import seedfarmer.mgmt.deploy_utils as du
+
+    def _mock_md5(module_path, **kwargs):
+        time.sleep(random.uniform(0, 0.05))
+        return f"md5-{module_path}"
+
+    need_to_build_calls = []
+
+    def _mock_need_to_build(group_name, module_manifest, active_modules, **kwargs):
+        need_to_build_calls.append((f"{group_name}-{module_manifest.name}", list(active_modules)))
+        return module_manifest.name in ["networking", "eks"]
+
+    dep = DeploymentManifest(**mock_deployment_manifest_huge.deployment_manifest)
+    dep.validate_and_set_module_defaults()
+    mocker.patch("seedfarmer.commands._deployment_commands.print_manifest_inventory", return_value=None)
+    mocker.patch(
+        "seedfarmer.commands._deployment_commands.get_deployspec_path",
+        return_value="test/unit-test/mock_data/mock_deployspec.yaml",
+    )
+    mocker.patch("seedfarmer.commands._deployment_commands.checksum.get_module_md5", side_effect=_mock_md5)
+    mocker.patch("seedfarmer.commands._deployment_commands.resolve_params_for_checksum", return_value=None)
+    mocker.patch("seedfarmer.commands._deployment_commands.du.need_to_build", side_effect=_mock_need_to_build)
+    validated = mocker.patch("seedfarmer.commands._deployment_commands._deploy_validated_deployment")
+    mocker.patch("seedfarmer.commands._deployment_commands.print_bolded", return_value=None)
+
+    dc.deploy_deployment(deployment_manifest=dep, module_info_index=du.ModuleInfoIndex(), module_upstream_dep={})
+
+    expected_order = [f"{group.name}-{module.name}" for group in dep.groups for module in group.modules]
+    assert [c[0] for c in need_to_build_calls] == expected_order
+    # Modules scheduled to deploy are only seen by the modules after them in the manifest
+    assert need_to_build_calls[0][1] == []
+    assert need_to_build_calls[-1][1] == ["optionals-networking", "core-eks"]
+    for group in validated.call_args.kwargs["groups_to_deploy"]:
+        for module in group.modules:
+            assert module.bundle_md5 == f"md5-{module.get_local_path()}"
+            assert module.deploy_spec is not None
+
+
+def _dependency_scheduled_manifest() -> DeploymentManifest:
+    dep = DeploymentManifest(**mock_manifests.deployment_manifest)
+    dep.dependency_scheduling = True
+    dep.validate_and_set_module_defaults()
+    for group in dep.groups:
+        for module in group.modules:
+            module.deploy_spec = DeploySpec(**mock_deployspec.dummy_deployspec)
+    return dep
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_deploy_by_dependency(session_manager, mocker):
+    import threading
+
+    from seedfarmer.mgmt.deploy_utils import generate_dependency_maps
+    from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
+
+    dep = _dependency_scheduled_manifest()
+    module_depends_on, _ = generate_dependency_maps(dep)
+    platform_started = threading.Event()
+    started = []
+
+    def _mock_execute_deploy(mdo, build_limiter=None, module_info_index=None):
+        started.append(f"{mdo.group_name}-{mdo.module_name}")
+        if mdo.module_name == "datalake-buckets":
+            # Would never be set if the groups were deployed one after the other
+            assert platform_started.wait(timeout=10)
+        if mdo.module_name == "kubeflow-platform":
+            platform_started.set()
+        return ModuleDeploymentResponse(
+            deployment="mlops", group=mdo.group_name, module=mdo.module_name, status="SUCCESS"
+        )
+
+    mocker.patch("seedfarmer.commands._deployment_commands._execute_deploy", side_effect=_mock_execute_deploy)
+    responses = dc._deploy_by_dependency(deployment_manifest_wip=dep, module_upstream_dep=module_depends_on)
+
+    assert len(responses) == 7
+    assert started.index("optionals-networking") < started.index("core-eks")
+    assert started.index("core-eks") < started.index("platform-kubeflow-platform")
+    assert started.index("core-efs") < started.index("platform-efs-on-eks")
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_deploy_by_dependency_without_deployspec(session_manager, mocker):
+    from seedfarmer.mgmt.deploy_utils import generate_dependency_maps
+    from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
+
+    dep = _dependency_scheduled_manifest()
+    dep.groups[0].modules[0].deploy_spec = None
+    skipped = f"{dep.groups[0].name}-{dep.groups[0].modules[0].name}"
+    module_depends_on, _ = generate_dependency_maps(dep)
+    started = []
+
+    def _mock_execute_deploy(mdo, build_limiter=None, module_info_index=None):
+        started.append(f"{mdo.group_name}-{mdo.module_name}")
+        return ModuleDeploymentResponse(
+            deployment="mlops", group=mdo.group_name, module=mdo.module_name, status="SUCCESS"
+        )
+
+    mocker.patch("seedfarmer.commands._deployment_commands._execute_deploy", side_effect=_mock_execute_deploy)
+    # The modules depending on the module without a deployspec are deployed, not reported as a dependency cycle
+    responses = dc._deploy_by_dependency(deployment_manifest_wip=dep, module_upstream_dep=module_depends_on)
+
+    assert len(responses) == 6
+    assert skipped not in started
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_deploy_by_dependency_error(session_manager, mocker):
+    from seedfarmer.mgmt.deploy_utils import generate_dependency_maps
+    from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
+
+    dep = _dependency_scheduled_manifest()
+    dep.max_concurrent_modules = 1
+    module_depends_on, _ = generate_dependency_maps(dep)
+    started = []
+
+    def _mock_execute_deploy(mdo, build_limiter=None, module_info_index=None):
+        started.append(f"{mdo.group_name}-{mdo.module_name}")
+        return ModuleDeploymentResponse(
+            deployment="mlops",
+            group=mdo.group_name,
+            module=mdo.module_name,
+            status="ERROR" if mdo.module_name == "networking" else "SUCCESS",
+        )
+
+    mocker.patch("seedfarmer.commands._deployment_commands._execute_deploy", side_effect=_mock_execute_deploy)
+    mocker.patch("seedfarmer.commands._deployment_commands.print_manifest_inventory", return_value=None)
+    mocker.patch("seedfarmer.commands._deployment_commands.print_errored_modules_build_info", return_value=None)
+    with pytest.raises(seedfarmer.errors.ModuleDeploymentError):
+        dc._deploy_validated_deployment(
+            deployment_manifest=dep,
+            deployment_manifest_wip=dep,
+            groups_to_deploy=dep.groups,
+            dryrun=False,
+            module_upstream_dep=module_depends_on,
+        )
+    assert started == ["optionals-networking"]
+
+
 @pytest.mark.commands
 @pytest.mark.commands_deployment
 @pytest.mark.parametrize(
@@ -196,6 +196,57 @@ def test_generate_dir(sample_files_structure, temp_dir):
     assert not os.path.exists(os.path.join(result_dir, "build", "ignored.txt"))
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_generate_dir_with_files(sample_files_structure, temp_dir):
+    """Test generate_dir copies only the listed files."""
+    out_dir = os.path.join(temp_dir, "output")
+
+    result_dir = bundle.generate_dir(
+        out_dir=out_dir,
+        dir=sample_files_structure["temp_dir"],
+        name="test_bundle",
+        files=["regular.txt", os.path.join("subdir", "sub.txt")],
+    )
+
+    assert os.path.exists(os.path.join(result_dir, "regular.txt"))
+    assert os.path.exists(os.path.join(result_dir, "subdir", "sub.txt"))
+    assert not os.path.exists(os.path.join(result_dir, ".python-version"))
+
+    with pytest.raises(ValueError, match="is empty"):
+        bundle.generate_dir(out_dir=out_dir, dir=sample_files_structure["temp_dir"], name="empty_bundle", files=[])
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_list_files_matches_is_valid_image_file(sample_files_structure):
+    """Test _list_files prunes directories the same as checking every file with _is_valid_image_file."""
+    temp_dir = sample_files_structure["temp_dir"]
+    for path in [
+        "node_modules/pkg/index.js",
+        "pkg.egg-info/PKG-INFO",
+        "src/__pycache__/mod.pyc",
+        "src/mod.py",
+        "src/.hidden/file.txt",
+        "src/.python-version",
+        "src/notes__pycache__.txt",
+        "cdk.out/manifest.json",
+        "dist/pkg.whl",
+    ]:
+        Path(temp_dir, path).parent.mkdir(parents=True, exist_ok=True)
+        Path(temp_dir, path).write_text(path)
+
+    expected = []
+    for dirpath, dirnames, filenames in os.walk(temp_dir):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        expected.extend(
+            os.path.join(dirpath, f) for f in filenames if bundle._is_valid_image_file(os.path.join(dirpath, f))
+        )
+
+    assert sorted(bundle._list_files(temp_dir)) == sorted(expected)
+    assert bundle._list_files(os.path.join(temp_dir, "build")) == []
+
+
 @pytest.mark.mgmt
 @pytest.mark.mgmt_bundle
 def test_generate_dir_empty_directory(temp_dir):
@@ -272,8 +323,8 @@ def test_generate_bundle_with_dirs(mock_generate_dir, mock_create_output_dir, te
 
             # Verify generate_dir was called for each directory
             assert mock_generate_dir.call_count == 2
-            mock_generate_dir.assert_any_call(out_dir=bundle_dir, dir="/source/dir1", name="dest1")
-            mock_generate_dir.assert_any_call(out_dir=bundle_dir, dir="/source/dir2", name="dest2")
+            mock_generate_dir.assert_any_call(out_dir=bundle_dir, dir="/source/dir1", name="dest1", files=None)
+            mock_generate_dir.assert_any_call(out_dir=bundle_dir, dir="/source/dir2", name="dest2", files=None)
 
 
 @pytest.mark.mgmt
@@ -317,6 +368,105 @@ def test_generate_bundle_with_files(mock_create_output_dir, temp_dir):
                 assert len(custom_calls) == 2
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_stream_bundle(sample_files_structure):
+    """Test stream_bundle zips the same contents as generate_bundle without staging copies."""
+    import io
+
+    extra_file = os.path.join(sample_files_structure["temp_dir"], "subdir", "extra.yaml")
+    Path(extra_file).write_text("extra")
+    dirs = [(sample_files_structure["temp_dir"], "module")]
+    files = [(extra_file, "seedfarmer.yaml"), (extra_file, "module/data/extra.yaml")]
+
+    with tempfile.TemporaryDirectory() as staging_dir:
+        zip_path = bundle.generate_bundle(dirs=dirs, files=files, path_override=staging_dir)
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            staged = {name: zf.read(name) for name in zf.namelist() if not name.endswith("/")}
+
+    with patch("seedfarmer.mgmt.bundle.shutil.copy") as mock_copy:
+        buffer = bundle.stream_bundle(dirs=dirs, files=files, fileobj=io.BytesIO())
+        mock_copy.assert_not_called()
+    with zipfile.ZipFile(buffer, "r") as zf:
+        assert {name: zf.read(name) for name in zf.namelist()} == staged
+    assert "bundle/module/data/extra.yaml" in staged
+
+    spooled = bundle.stream_bundle(dirs=dirs, files=files, dir_files={"module": ["regular.txt"]})
+    with spooled, zipfile.ZipFile(spooled, "r") as zf:
+        assert "bundle/module/regular.txt" in zf.namelist()
+        assert "bundle/module/subdir/sub.txt" not in zf.namelist()
+
+    with pytest.raises(ValueError, match="is empty"):
+        bundle.stream_bundle(dirs=dirs, dir_files={"module": []})
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_stream_bundle_is_reproducible(sample_files_structure):
+    """Test stream_bundle zips the same files to the same bytes."""
+    import io
+
+    script = Path(sample_files_structure["temp_dir"], "deploy.sh")
+    script.write_text("#!/bin/bash")
+    script.chmod(0o755)
+    dirs = [(sample_files_structure["temp_dir"], "module")]
+
+    first = bundle.stream_bundle(dirs=dirs, fileobj=io.BytesIO()).read()
+    os.utime(sample_files_structure["regular_file"], (0, 0))
+    second = bundle.stream_bundle(dirs=dirs, fileobj=io.BytesIO()).read()
+    assert first == second
+
+    with zipfile.ZipFile(io.BytesIO(first), "r") as zf:
+        assert zf.namelist() == sorted(zf.namelist())
+        assert {info.date_time for info in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        assert zf.getinfo("bundle/module/deploy.sh").external_attr >> 16 == 0o100755
+        assert zf.getinfo("bundle/module/regular.txt").external_attr >> 16 == 0o100644
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_bundle_cache(sample_files_structure, mocker):
+    """Test get_bundle reuses bundles of unchanged files and evicts the least recently used."""
+    import seedfarmer.checksum as checksum
+    import seedfarmer.mgmt.bundle_cache as bundle_cache
+
+    mocker.patch.dict(checksum._hash_caches, clear=True)
+    with tempfile.TemporaryDirectory() as project_path:
+        dirs = [(sample_files_structure["temp_dir"], "module")]
+        write_spy = mocker.spy(bundle, "_write_bundle_zip")
+
+        with bundle_cache.get_bundle(project_path=project_path, dirs=dirs) as first:
+            first_bytes = first.read()
+        with bundle_cache.get_bundle(project_path=project_path, dirs=dirs) as second:
+            assert second.read() == first_bytes
+        assert write_spy.call_count == 1
+
+        # Changed files are bundled again
+        Path(sample_files_structure["regular_file"]).write_text("changed content")
+        with bundle_cache.get_bundle(project_path=project_path, dirs=dirs, max_size=len(first_bytes)) as third:
+            with zipfile.ZipFile(third, "r") as zf:
+                assert zf.read("bundle/module/regular.txt") == b"changed content"
+        assert write_spy.call_count == 2
+
+        # Only the most recent bundle fits in the cache
+        cache_dir = os.path.join(project_path, checksum.HASH_CACHE_DIR, bundle_cache.BUNDLE_CACHE_DIR)
+        assert os.listdir(cache_dir) == [os.path.basename(third.name)]
+
+        # A file made executable is bundled again with its new mode
+        os.chmod(sample_files_structure["regular_file"], 0o755)
+        with bundle_cache.get_bundle(project_path=project_path, dirs=dirs) as fourth:
+            with zipfile.ZipFile(fourth, "r") as zf:
+                assert zf.getinfo("bundle/module/regular.txt").external_attr >> 16 == bundle._BUNDLE_ZIP_EXECUTABLE_MODE
+        assert write_spy.call_count == 3
+
+        # Without the hash cache the files are hashed directly, keying the same bundle
+        hash_spy = mocker.spy(checksum.FileHashCache, "get_file_hash")
+        with bundle_cache.get_bundle(project_path=project_path, dirs=dirs, use_hash_cache=False) as fifth:
+            assert fifth.name == fourth.name
+        assert hash_spy.call_count == 0
+        assert write_spy.call_count == 3
+
+
 @pytest.mark.mgmt
 @pytest.mark.mgmt_bundle
 def test_extract_zip(temp_dir):
@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import json
 import logging
 import os
 
@@ -25,6 +26,7 @@ from moto import mock_aws
 
 import seedfarmer.errors
 import seedfarmer.mgmt.deploy_utils as du
+from seedfarmer import config
 from seedfarmer.models.manifests import DataFile, DeploymentManifest, ModulesManifest
 from seedfarmer.services._service_utils import boto3_client
 from seedfarmer.services.session_manager import SessionManager
@@ -70,6 +72,71 @@ def test_dependency_maps():
     assert "core-eks" in list(module_dependencies["optionals-networking"])
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_deployment_utils
+def test_deploy_dependency_graph():
+    manifest = DeploymentManifest(**mock_manifests.deployment_manifest)
+    module_depends_on, _ = du.generate_dependency_maps(manifest)
+    graph = du.generate_deploy_dependency_graph(manifest.groups, module_depends_on)
+    assert graph["optionals-networking"] == set()
+    assert graph["core-eks"] == {"optionals-networking"}
+    assert graph["platform-efs-on-eks"] == {"core-eks", "core-efs"}
+    assert graph["users-kubeflow-users"] == {"core-eks"}
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_deployment_utils
+def test_deploy_dependency_graph_without_edges():
+    manifest = DeploymentManifest(**mock_manifests.deployment_manifest)
+    # Drop the optionals group (unchanged) and only deploy core and platform
+    graph = du.generate_deploy_dependency_graph(manifest.groups[1:3], {})
+    assert graph["core-eks"] == set()
+    assert graph["platform-kubeflow-platform"] == {"core-eks", "core-efs"}
+
+    module_depends_on, _ = du.generate_dependency_maps(manifest)
+    graph = du.generate_deploy_dependency_graph(manifest.groups[1:3], module_depends_on)
+    assert graph["core-eks"] == set()
+    assert graph["platform-kubeflow-platform"] == {"core-eks"}
+
+
+def _max_concurrent_builds(limiter, account_id, region, builds=6):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    lock = threading.Lock()
+    counts = {"active": 0, "max": 0}
+
+    def _build(_):
+        with limiter.acquire(account_id, region):
+            with lock:
+                counts["active"] += 1
+                counts["max"] = max(counts["max"], counts["active"])
+            time.sleep(0.1)
+            with lock:
+                counts["active"] -= 1
+
+    with ThreadPoolExecutor(max_workers=builds) as workers:
+        list(workers.map(_build, range(builds)))
+    return counts["max"]
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_deployment_utils
+def test_build_concurrency_limiter():
+    manifest = DeploymentManifest(**mock_manifests.deployment_manifest)
+    assert _max_concurrent_builds(du.BuildConcurrencyLimiter(manifest), "123456789012", "us-east-1") == 6
+
+    manifest.max_concurrent_builds = 3
+    assert _max_concurrent_builds(du.BuildConcurrencyLimiter(manifest), "123456789012", "us-east-1") <= 3
+
+    manifest.target_account_mappings[0].region_mappings[0].max_concurrent_builds = 2
+    limiter = du.BuildConcurrencyLimiter(manifest)
+    assert _max_concurrent_builds(limiter, "123456789012", "us-east-1") <= 2
+    # The regional limit does not apply to other regions
+    assert _max_concurrent_builds(limiter, "123456789012", "us-west-2") == 3
+
+
 @pytest.mark.mgmt
 @pytest.mark.mgmt_deployment_utils
 def test_validate_group_parameters():
@@ -177,12 +244,12 @@ def test_write_group_manifest(mocker, session_manager):
 @pytest.mark.mgmt
 @pytest.mark.mgmt_deployment_utils
 def test_prepare_ssm_for_deploy(mocker, session_manager):
-    mocker.patch("seedfarmer.mgmt.deploy_utils.mi.write_module_manifest", return_value=None)
-    mocker.patch("seedfarmer.mgmt.deploy_utils.mi.write_deployspec", return_value=None)
-    mocker.patch("seedfarmer.mgmt.deploy_utils.mi.write_module_md5", return_value=None)
-    mocker.patch("seedfarmer.mgmt.deploy_utils.mi.remove_module_md5", return_value=None)
+    put_parameter = mocker.patch("seedfarmer.mgmt.module_info.ssm.put_parameter", return_value=None)
+    delete_parameters = mocker.patch("seedfarmer.mgmt.module_info.ssm.delete_parameters", return_value=None)
     manifest = DeploymentManifest(**mock_manifests.deployment_manifest)
     module_manifest = manifest.groups[1].modules[0]
+    module_manifest.deployspec_md5 = "deployspec-md5"
+    module_manifest.manifest_md5 = "manifest-md5"
     du.prepare_ssm_for_deploy(
         deployment_name="test",
         group_name="group",
@@ -190,6 +257,27 @@ def test_prepare_ssm_for_deploy(mocker, session_manager):
         account_id="123456789012",
         region="us-east-1",
     )
+    # The manifest, the deployspec (if any) and both md5s
+    assert put_parameter.call_count == (4 if module_manifest.deploy_spec else 3)
+    delete_parameters.assert_called_once()
+
+    # Values already stored are not written again, and md5s not stored are not deleted
+    written = {call.kwargs["name"]: call.kwargs["obj"] for call in put_parameter.call_args_list}
+    put_parameter.reset_mock()
+    delete_parameters.reset_mock()
+    module_info = {name: json.loads(json.dumps(obj)) for name, obj in written.items()}
+    module_info[f"/{config.PROJECT}/test/group/{module_manifest.name}/md5/manifest"] = {"hash": "changed"}
+    du.prepare_ssm_for_deploy(
+        deployment_name="test",
+        group_name="group",
+        module_manifest=module_manifest,
+        account_id="123456789012",
+        region="us-east-1",
+        module_info=module_info,
+    )
+    put_parameter.assert_called_once()
+    assert put_parameter.call_args.kwargs["obj"] == {"hash": "manifest-md5"}
+    delete_parameters.assert_not_called()
 
 
 @pytest.mark.mgmt
@@ -225,6 +313,42 @@ def test_generate_deployed_manifest(mocker, session_manager):
     du.generate_deployed_manifest(deployment_name="myapp", skip_deploy_spec=True, ignore_deployed=False)
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_deployment_utils
+def test_get_deployed_module_keys(mocker, session_manager):
+    mocker.patch("seedfarmer.mgmt.deploy_utils.mi.get_deployed_deployment_manifest", return_value=None)
+    mocker.patch("seedfarmer.mgmt.deploy_utils.mi.get_deployment_manifest", return_value=None)
+    assert du.get_deployed_module_keys(deployment_name="myapp") is None
+
+    mocker.patch(
+        "seedfarmer.mgmt.deploy_utils.mi.get_deployment_manifest", return_value=mock_manifests.deployment_manifest
+    )
+    module_info_index = du.ModuleInfoIndex()
+    for module, module_info in [
+        ("networking", {du.mi._manifest_key("myapp", "optionals", "networking"): {"name": "networking"}}),
+        ("datalake-buckets", {du.mi._metadata_key("myapp", "optionals", "datalake-buckets"): {}}),
+    ]:
+        module_info_index.index_module_info(
+            group="optionals",
+            account_id="123456789012",
+            region="us-east-1",
+            module_name=module,
+            module_info=module_info,
+        )
+    mocker.patch("seedfarmer.mgmt.deploy_utils.populate_module_info_index", return_value=module_info_index)
+    model_init = mocker.spy(du.ModuleManifest, "__init__")
+
+    assert du.get_deployed_module_keys(deployment_name="myapp") == {
+        ("optionals", "networking"): {
+            "group": "optionals",
+            "module_name": "networking",
+            "account_id": "123456789012",
+            "region": "us-east-1",
+        }
+    }
+    model_init.assert_not_called()
+
+
 @pytest.mark.mgmt
 @pytest.mark.mgmt_deployment_utils
 def test_get_deployed_group_ordering_not_deployed(mocker, session_manager):
@@ -282,6 +406,38 @@ def test_populate_module_info_index(session_manager, mocker):
     du.populate_module_info_index(deployment_manifest=DeploymentManifest(**mock_manifests.deployment_manifest))
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_deployment_utils
+def test_get_deployed_modules_metadata(session_manager, mocker):
+    mocker.patch("seedfarmer.mgmt.deploy_utils.SessionManager")
+    get_modules_metadata = mocker.patch(
+        "seedfarmer.mgmt.deploy_utils.mi.get_modules_metadata",
+        side_effect=lambda deployment, modules, session: {m: {"fetched": m[1]} for m in modules},
+    )
+    deployment_manifest = DeploymentManifest(**mock_manifests.deployment_manifest)
+    deployment_manifest.validate_and_set_module_defaults()
+    module_info_index = du.ModuleInfoIndex()
+    for group in deployment_manifest.groups[:2]:
+        for module in group.modules:
+            module_info_index.index_module_info(
+                group=group.name,
+                account_id=module.get_target_account_id(),
+                region=module.target_region,
+                module_name=module.name,
+                module_info={du.mi._metadata_key("myapp", group.name, module.name): {"indexed": module.name}},
+            )
+
+    metadata = du.get_deployed_modules_metadata(
+        deployment_manifest=deployment_manifest, module_info_index=module_info_index
+    )
+    assert list(metadata) == [f"{g.name}-{m.name}" for g in deployment_manifest.groups for m in g.modules]
+    assert metadata["optionals-networking"] == {"indexed": "networking"}
+    assert metadata["core-efs"] == {"indexed": "efs"}
+    assert metadata["users-kubeflow-users"] == {"fetched": "kubeflow-users"}
+    gaps = {(m.get_target_account_id(), m.target_region) for g in deployment_manifest.groups[2:] for m in g.modules}
+    assert get_modules_metadata.call_count == len(gaps)
+
+
 # -----------------------
 # Test Filtering for Deploy / Destroy
 # -----------------------
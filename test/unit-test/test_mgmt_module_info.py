@@ -17,6 +17,7 @@ import os
 
 import boto3
 import pytest
+from moto import mock_aws
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -56,6 +57,23 @@ def test_get_all_deployments_with_manifest(aws_credentials, session, mocker):
     mi.get_all_deployments(session=session)
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_info
+def test_get_all_deployments_of_project(aws_credentials, session, mocker):
+    import seedfarmer.mgmt.module_info as mi
+    import seedfarmer.services._ssm as ssm
+
+    with mock_aws():
+        for name in [
+            "/myapp/dep1/manifest",
+            "/myapp/dep1/group/manifest",
+            "/myapp/dep2/manifest",
+            "/myapp2/dep3/manifest",
+        ]:
+            ssm.put_parameter(name=name, obj={"name": "testing"})
+        assert sorted(mi.get_all_deployments(session=session)) == ["dep1", "dep2"]
+
+
 @pytest.mark.mgmt
 @pytest.mark.mgmt_module_info
 def test_get_all_deployments_with_nothing(aws_credentials, session, mocker):
@@ -218,6 +236,7 @@ def test_write_metadata(aws_credentials, session, mocker):
 def test_write_group_manifest(aws_credentials, session, mocker):
     import seedfarmer.mgmt.module_info as mi
 
+    mocker.patch("seedfarmer.mgmt.module_info.ssm.get_parameter_if_exists", return_value=None)
     mocker.patch("seedfarmer.mgmt.module_info.ssm.put_parameter", return_value=True)
     mi.write_group_manifest(deployment="myapp", group="test", data={"Hey", "Yo"}, session=session)
 
@@ -259,10 +278,133 @@ def test_write_module_md5(aws_credentials, session, mocker):
 def test_write_deployment_manifest(aws_credentials, session, mocker):
     import seedfarmer.mgmt.module_info as mi
 
+    mocker.patch("seedfarmer.mgmt.module_info.ssm.get_parameter_if_exists", return_value=None)
     mocker.patch("seedfarmer.mgmt.module_info.ssm.put_parameter", return_value=True)
     mi.write_deployment_manifest(deployment="myapp", data={"Hey", "Yo"}, session=session)
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_info
+def test_write_skips_unchanged(aws_credentials, session, mocker):
+    import seedfarmer.mgmt.module_info as mi
+
+    put_parameter = mocker.patch("seedfarmer.mgmt.module_info.ssm.put_parameter", return_value=True)
+    get_parameter = mocker.patch("seedfarmer.mgmt.module_info.ssm.get_parameter_if_exists")
+    skipped = mi.get_skipped_write_count()
+
+    params_cache = {
+        mi._deployment_manifest_key("myapp"): {"name": "myapp", "groups": []},
+        mi._deployspec_key("myapp", "test", "mymodule"): {"deploy": {"phases": {}}},
+    }
+    mi.write_deployment_manifest(
+        deployment="myapp", data={"name": "myapp", "groups": []}, session=session, params_cache=params_cache
+    )
+    mi.write_deployspec(
+        deployment="myapp",
+        group="test",
+        module="mymodule",
+        data={"deploy": {"phases": {}}},
+        params_cache=params_cache,
+        session=session,
+    )
+    put_parameter.assert_not_called()
+    assert mi.get_skipped_write_count() == skipped + 2
+
+    mi.write_deployment_manifest(
+        deployment="myapp", data={"name": "myapp", "groups": [{}]}, session=session, params_cache=params_cache
+    )
+    mi.write_deployspec(
+        deployment="myapp",
+        group="test",
+        module="mymodule",
+        data={"deploy": {"phases": {"build": {}}}},
+        params_cache=params_cache,
+        session=session,
+    )
+    assert put_parameter.call_count == 2
+    assert mi.get_skipped_write_count() == skipped + 2
+
+    # Without a cache the value is written without being fetched first
+    mi.write_deployment_manifest(deployment="myapp", data={"name": "myapp", "groups": []}, session=session)
+    assert put_parameter.call_count == 3
+    get_parameter.assert_not_called()
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_info
+def test_get_parameter_data_cache_cached(aws_credentials, session, mocker, tmp_path):
+    import seedfarmer.mgmt.module_info as mi
+    import seedfarmer.services._ssm as ssm
+    from seedfarmer import config
+
+    mocker.patch.object(type(config), "OPS_ROOT", new_callable=mocker.PropertyMock, return_value=str(tmp_path))
+    with mock_aws():
+        for module in ["mymodule1", "mymodule2", "mymodule3"]:
+            ssm.put_parameter(name=mi._manifest_key("myapp", "test", module), obj={"name": module})
+        ssm.put_parameter(name="/myapp/myapp2/test/mymodule1/manifest", obj={"name": "other"})
+        get_parameters = mocker.spy(ssm, "get_parameters")
+        get_by_path = mocker.spy(ssm, "get_all_parameter_data_by_path")
+
+        data = mi.get_parameter_data_cache(deployment="myapp", session=session, cache_key="123456789012-us-east-1")
+        assert len(data) == 3
+        assert get_by_path.call_count == 1
+        assert os.path.exists(os.path.join(tmp_path, mi.MODULE_INFO_CACHE_DIR, "myapp-123456789012-us-east-1.json"))
+
+        assert (
+            mi.get_parameter_data_cache(deployment="myapp", session=session, cache_key="123456789012-us-east-1") == data
+        )
+        assert get_by_path.call_count == 1
+        get_parameters.assert_not_called()
+
+        ssm.put_parameter(name=mi._manifest_key("myapp", "test", "mymodule1"), obj={"name": "updated"})
+        ssm.delete_parameters(parameters=[mi._manifest_key("myapp", "test", "mymodule2")])
+        data = mi.get_parameter_data_cache(deployment="myapp", session=session, cache_key="123456789012-us-east-1")
+        assert data == {
+            mi._manifest_key("myapp", "test", "mymodule1"): {"name": "updated"},
+            mi._manifest_key("myapp", "test", "mymodule3"): {"name": "mymodule3"},
+        }
+        assert get_by_path.call_count == 1
+        assert get_parameters.call_args.kwargs["names"] == [mi._manifest_key("myapp", "test", "mymodule1")]
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_info
+def test_get_parameter_data_cache_written(aws_credentials, session, mocker, tmp_path):
+    import seedfarmer.mgmt.module_info as mi
+    import seedfarmer.services._ssm as ssm
+    from seedfarmer import config
+
+    mocker.patch.object(type(config), "OPS_ROOT", new_callable=mocker.PropertyMock, return_value=str(tmp_path))
+    cache_key = "123456789012-us-east-1"
+    with mock_aws():
+        for module in ["mymodule1", "mymodule2"]:
+            ssm.put_parameter(name=mi._manifest_key("myapp", "test", module), obj={"name": module})
+            ssm.put_parameter(
+                name=mi._md5_module_key("myapp", "test", module, mi.ModuleConst.BUNDLE), obj={"hash": "1"}
+            )
+        current = mi.get_parameter_data_cache(deployment="myapp", session=session, cache_key=cache_key)
+        store = mi.get_module_state_store()
+        stale_versions = store.get_versions_by_path(path=mi._deployment_key("myapp"), session=session)
+
+        batch = mi.ModuleInfoBatch(
+            deployment="myapp", group="test", module="mymodule1", current=current, session=session, cache_key=cache_key
+        )
+        batch.write_module_manifest(data={"name": "mymodule1", "path": "updated"})
+        batch.write_deployspec(data={"deploy": {"phases": {"build": {}}}})
+        batch.remove_module_md5(type=mi.ModuleConst.BUNDLE)
+        batch.flush()
+
+        # The versions listed may not include the writes yet, the values written are fetched again by name
+        mocker.patch.object(type(store), "get_versions_by_path", return_value=stale_versions)
+        data = mi.get_parameter_data_cache(deployment="myapp", session=session, cache_key=cache_key)
+        assert data == {
+            mi._manifest_key("myapp", "test", "mymodule1"): {"name": "mymodule1", "path": "updated"},
+            mi._deployspec_key("myapp", "test", "mymodule1"): {"deploy": {"phases": {"build": {}}}},
+            mi._manifest_key("myapp", "test", "mymodule2"): {"name": "mymodule2"},
+            mi._md5_module_key("myapp", "test", "mymodule2", mi.ModuleConst.BUNDLE): {"hash": "1"},
+        }
+
+
 @pytest.mark.mgmt
 @pytest.mark.mgmt_module_info
 def test_write_deployed_deployment_manifest(aws_credentials, session, mocker):
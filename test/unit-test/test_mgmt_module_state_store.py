@@ -0,0 +1,164 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+
+import boto3
+import pytest
+from moto import mock_aws
+
+import seedfarmer.mgmt.module_info as mi
+from seedfarmer.mgmt import module_state_store as mss
+
+
+@pytest.fixture(scope="function")
+def aws_credentials():
+    """Mocked AWS Credentials for moto."""
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    os.environ["AWS_SECURITY_TOKEN"] = "testing"
+    os.environ["AWS_SESSION_TOKEN"] = "testing"
+    os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+    os.environ["MOTO_ACCOUNT_ID"] = "123456789012"
+
+
+@pytest.fixture(scope="function", params=["sqlite", "dynamodb"])
+def store(request, aws_credentials):
+    if request.param == "sqlite":
+        yield mss.SqliteModuleStateStore(path=":memory:")
+    else:
+        with mock_aws():
+            boto3.client("dynamodb").create_table(
+                TableName="myapp-module-state",
+                KeySchema=[
+                    {"AttributeName": "deployment", "KeyType": "HASH"},
+                    {"AttributeName": "name", "KeyType": "RANGE"},
+                ],
+                AttributeDefinitions=[
+                    {"AttributeName": "deployment", "AttributeType": "S"},
+                    {"AttributeName": "name", "AttributeType": "S"},
+                ],
+                BillingMode="PAY_PER_REQUEST",
+            )
+            yield mss.DynamoDbModuleStateStore(table_name="myapp-module-state")
+
+
+@pytest.fixture(scope="function")
+def module_info_store(store):
+    mss.set_module_state_store(store)
+    yield store
+    mss.set_module_state_store(None)
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_state_store
+def test_store(store):
+    store.put(name="/myapp/dep/group/module/manifest", obj={"name": "module"})
+    store.put_many(
+        items={
+            "/myapp/dep/group/module/deployspec": {"deploy": {}},
+            "/myapp/dep/group2/module/manifest": {"name": "module"},
+            "/myapp/dep2/group/module/manifest": {"name": "module"},
+        }
+    )
+    assert store.get(name="/myapp/dep/group/module/manifest") == {"name": "module"}
+    assert store.get(name="/myapp/dep/group/missing/manifest") is None
+    assert store.exists(name="/myapp/dep/group/module/deployspec")
+    assert store.get_many(names=["/myapp/dep/group/module/manifest", "/myapp/dep/missing"]) == {
+        "/myapp/dep/group/module/manifest": {"name": "module"}
+    }
+    assert sorted(store.get_by_path(path="/myapp/dep/group")) == [
+        "/myapp/dep/group/module/deployspec",
+        "/myapp/dep/group/module/manifest",
+    ]
+    assert sorted(store.list_names(prefix="/myapp", contains_string="manifest")) == [
+        "/myapp/dep/group/module/manifest",
+        "/myapp/dep/group2/module/manifest",
+        "/myapp/dep2/group/module/manifest",
+    ]
+
+    store.put(name="/myapp/dep/group/module/manifest", obj={"name": "updated"})
+    assert store.get(name="/myapp/dep/group/module/manifest") == {"name": "updated"}
+    store.delete(names=["/myapp/dep/group/module/manifest", "/myapp/dep/missing"])
+    assert not store.exists(name="/myapp/dep/group/module/manifest")
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_state_store
+def test_store_batches(store):
+    items = {f"/myapp/dep/group/module{i}/md5/bundle": {"hash": str(i)} for i in range(60)}
+    store.put_many(items=items)
+    assert store.get_many(names=list(items)) == items
+    store.delete(names=list(items))
+    assert store.get_by_path(path="/myapp/dep/") == {}
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_state_store
+def test_module_info_with_store(module_info_store):
+    mi.write_deployment_manifest(deployment="dep", data={"name": "dep"})
+    mi.write_module_manifest(deployment="dep", group="group", module="module", data={"name": "module"})
+    mi.write_module_md5(deployment="dep", group="group", module="module", hash="12345", type=mi.ModuleConst.BUNDLE)
+
+    assert mi.get_module_manifest(deployment="dep", group="group", module="module") == {"name": "module"}
+    assert mi.get_module_md5(deployment="dep", group="group", module="module", type=mi.ModuleConst.BUNDLE) == "12345"
+    assert mi.does_module_exist(deployment="dep", group="group", module="module")
+    assert mi.get_all_deployments() == ["dep"]
+    assert mi.get_deployed_modules(deployment="dep", group="group") == ["module"]
+    assert len(mi.get_parameter_data_cache(deployment="dep", session=None)) == 3
+
+    mi.remove_module_info(deployment="dep", group="group", module="module")
+    assert not mi.does_module_exist(deployment="dep", group="group", module="module")
+    assert len(mi.get_parameter_data_cache(deployment="dep", session=None)) == 1
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_state_store
+def test_get_module_state_store(mocker, tmp_path):
+    from seedfarmer.models import ModuleStateStoreSpec
+
+    mss.set_module_state_store(None)
+    spec = mocker.patch.object(
+        type(mss.config), "MODULE_STATE_STORE", new_callable=mocker.PropertyMock, return_value=None
+    )
+    assert isinstance(mss.get_module_state_store(), mss.SsmModuleStateStore)
+
+    mss.set_module_state_store(None)
+    spec.return_value = ModuleStateStoreSpec(type="dynamodb")
+    store = mss.get_module_state_store()
+    assert isinstance(store, mss.DynamoDbModuleStateStore)
+    assert store.table_name == "myapp-module-state"
+
+    mss.set_module_state_store(None)
+    spec.return_value = ModuleStateStoreSpec(type="sqlite", path=str(tmp_path / "state.db"))
+    assert isinstance(mss.get_module_state_store(), mss.SqliteModuleStateStore)
+    assert (tmp_path / "state.db").exists()
+    mss.set_module_state_store(None)
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_state_store
+def test_check_remote_module_state_store(mocker):
+    import seedfarmer.errors
+    from seedfarmer.models import ModuleStateStoreSpec
+
+    spec = mocker.patch.object(
+        type(mss.config), "MODULE_STATE_STORE", new_callable=mocker.PropertyMock, return_value=None
+    )
+    mss.check_remote_module_state_store()
+    spec.return_value = ModuleStateStoreSpec(type="dynamodb")
+    mss.check_remote_module_state_store()
+    spec.return_value = ModuleStateStoreSpec(type="sqlite")
+    with pytest.raises(seedfarmer.errors.InvalidConfigurationError):
+        mss.check_remote_module_state_store()
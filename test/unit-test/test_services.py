@@ -8,6 +8,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import json
 import logging
 import os
 
@@ -76,6 +77,19 @@ def test_utils_get_region(sts_client, session):
     assert _service_utils.get_region(session) == "us-east-1"
 
 
+def test_utils_boto3_client_cached(aws_credentials):
+    from concurrent.futures import ThreadPoolExecutor
+
+    session = boto3.Session()
+    client = _service_utils.boto3_client("ssm", session)
+    assert _service_utils.boto3_client("ssm", session) is client
+    assert _service_utils.boto3_client("s3", session) is not client
+    assert _service_utils.boto3_client("ssm", boto3.Session()) is not client
+    # Clients are not shared across threads
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_service_utils.boto3_client, "ssm", session).result() is not client
+
+
 def test_utils_get_account_id(sts_client, mocker):
     mocker.patch(
         "seedfarmer.services._service_utils._call_sts", return_value={"Account": "123456789012", "Arn": "arn:aws:iam::"}
@@ -84,6 +98,59 @@ def test_utils_get_account_id(sts_client, mocker):
     assert account_id == "123456789012"
 
 
+def test_utils_get_botocore_config(aws_credentials, mocker):
+    import seedfarmer.errors
+    from seedfarmer.models import BotocoreSpec
+
+    spec = mocker.patch.object(
+        type(_service_utils.seedfarmer.config), "BOTOCORE", new_callable=mocker.PropertyMock, return_value=None
+    )
+    _service_utils.get_botocore_config.cache_clear()
+    botocore_config = _service_utils.get_botocore_config()
+    assert _service_utils.get_botocore_config() is botocore_config
+    assert botocore_config.max_pool_connections == 10
+    assert botocore_config.retries == {"max_attempts": 5, "mode": "legacy"}
+
+    spec.return_value = BotocoreSpec(max_pool_connections=50, retry_mode="adaptive")
+    mocker.patch.dict(os.environ, {_service_utils.BOTOCORE_MAX_ATTEMPTS_ENV: "10"})
+    _service_utils.get_botocore_config.cache_clear()
+    botocore_config = _service_utils.get_botocore_config()
+    assert botocore_config.max_pool_connections == 50
+    assert botocore_config.retries == {"max_attempts": 10, "mode": "adaptive"}
+
+    mocker.patch.dict(os.environ, {_service_utils.BOTOCORE_RETRY_MODE_ENV: "unknown"})
+    _service_utils.get_botocore_config.cache_clear()
+    with pytest.raises(seedfarmer.errors.InvalidConfigurationError):
+        _service_utils.get_botocore_config()
+    _service_utils.get_botocore_config.cache_clear()
+
+
+def test_utils_get_sts_identity_info_cached(sts_client, mocker):
+    call_sts = mocker.patch(
+        "seedfarmer.services._service_utils._call_sts",
+        return_value={"Account": "123456789012", "Arn": "arn:aws-cn:iam::123456789012:user/test"},
+    )
+    session = boto3.Session()
+    assert _service_utils.get_sts_identity_info(session=session) == (
+        "123456789012",
+        "arn:aws-cn:iam::123456789012:user/test",
+        "aws-cn",
+    )
+    assert _service_utils.get_sts_identity_info(session=session)[0] == "123456789012"
+    call_sts.assert_called_once()
+
+    session = boto3.Session()
+    _service_utils.set_sts_identity_info(
+        session=session, arn="arn:aws-us-gov:sts::111111111111:assumed-role/deployment-role/deployment_role"
+    )
+    assert _service_utils.get_sts_identity_info(session=session) == (
+        "111111111111",
+        "arn:aws-us-gov:sts::111111111111:assumed-role/deployment-role/deployment_role",
+        "aws-us-gov",
+    )
+    call_sts.assert_called_once()
+
+
 @pytest.fixture(scope="function")
 def iam_client(aws_credentials):
     with mock_aws():
@@ -100,6 +167,254 @@ def test_codebuild(session) -> None:
         codebuild.get_build_data(build_ids=["12345"], session=session)
 
 
+@pytest.mark.service
+def test_codebuild_wait_batches_builds(mocker) -> None:
+    import concurrent.futures
+    import datetime
+
+    import seedfarmer.services._codebuild as codebuild
+
+    polls = []
+    phases = {f"project:{i}": ["BUILD", "POST_BUILD", "COMPLETED"] for i in range(3)}
+
+    def batch_get_builds(ids):
+        polls.append(sorted(ids))
+        now = datetime.datetime.now(datetime.timezone.utc)
+        builds = []
+        for build_id in ids:
+            phase = phases[build_id].pop(0) if len(phases[build_id]) > 1 else phases[build_id][0]
+            builds.append(
+                {
+                    "id": build_id,
+                    "buildStatus": "SUCCEEDED" if phase == "COMPLETED" else "IN_PROGRESS",
+                    "currentPhase": phase,
+                    "startTime": now,
+                    "phases": [],
+                    "logs": {"cloudWatchLogs": {"status": "DISABLED"}},
+                }
+            )
+        return {"builds": builds}
+
+    client = mocker.Mock()
+    client.batch_get_builds.side_effect = batch_get_builds
+    mocker.patch.object(codebuild, "boto3_client", return_value=client)
+    mocker.patch.object(codebuild, "_BUILD_WAIT_POLLING_DELAY", 0.2)
+    mocker.patch.object(codebuild, "_BUILD_WAIT_SLOW_POLLING_DELAY", 0.1)
+    mocker.patch.object(codebuild, "_BUILD_WAIT_FAST_POLLING_DELAY", 0.05)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        results = list(executor.map(lambda build_id: list(codebuild.wait(build_id=build_id)), phases))
+
+    assert [[build.current_phase.value for build in builds] for builds in results] == [
+        ["BUILD", "POST_BUILD", "COMPLETED"]
+    ] * 3
+    # All the builds are fetched together with a single call per poll
+    assert polls == [sorted(phases)] * 3
+    assert codebuild._build_monitor._thread is None or not codebuild._build_monitor._waiters
+
+    client.batch_get_builds.side_effect = lambda ids: {"builds": []}
+    with pytest.raises(RuntimeError):
+        list(codebuild.wait(build_id="project:missing"))
+
+    # A malformed build fails its wait, the monitor keeps serving the next waits
+    client.batch_get_builds.side_effect = lambda ids: {"builds": [{"id": build_id} for build_id in ids]}
+    with pytest.raises(KeyError):
+        list(codebuild.wait(build_id="project:malformed"))
+    mocker.patch.object(codebuild, "boto3_client", side_effect=TypeError("invalid session"))
+    with pytest.raises(TypeError):
+        list(codebuild.wait(build_id="project:session"))
+
+    phases["project:0"] = ["COMPLETED"]
+    client.batch_get_builds.side_effect = batch_get_builds
+    mocker.patch.object(codebuild, "boto3_client", return_value=client)
+    assert [build.status.value for build in codebuild.wait(build_id="project:0")] == ["SUCCEEDED"]
+
+
+@pytest.mark.service
+def test_codebuild_monitor_restarted(mocker) -> None:
+    import datetime
+
+    import seedfarmer.services._codebuild as codebuild
+
+    client = mocker.Mock()
+    client.batch_get_builds.side_effect = lambda ids: {
+        "builds": [
+            {
+                "id": build_id,
+                "buildStatus": "SUCCEEDED",
+                "currentPhase": "COMPLETED",
+                "startTime": datetime.datetime.now(datetime.timezone.utc),
+                "phases": [],
+                "logs": {"cloudWatchLogs": {"status": "DISABLED"}},
+            }
+            for build_id in ids
+        ]
+    }
+    mocker.patch.object(codebuild, "boto3_client", return_value=client)
+    mocker.patch.object(codebuild, "_BUILD_WAIT_POLLING_DELAY", 0.05)
+    mocker.patch.object(codebuild, "_BUILD_WAIT_SLOW_POLLING_DELAY", 0.05)
+    monitor = codebuild._BuildMonitor()
+    mocker.patch.object(codebuild, "_build_monitor", monitor)
+
+    # The monitor thread is not started by the watch, the waiting deployment starts it again
+    start = monitor._start
+    starts = []
+
+    def _start():
+        starts.append(True)
+        if len(starts) > 1:
+            start()
+
+    mocker.patch.object(monitor, "_start", side_effect=_start)
+    assert [build.status.value for build in codebuild.wait(build_id="project:0")] == ["SUCCEEDED"]
+    assert len(starts) > 1
+
+
+### CloudWatch
+@pytest.mark.service
+def test_log_tailer(session) -> None:
+    import time
+
+    import seedfarmer.services._cloudwatch as cloudwatch
+
+    def put_messages(messages):
+        now = int(time.time() * 1000)
+        client.put_log_events(
+            logGroupName="/aws/codebuild/project",
+            logStreamName="codeseeder-abc/123",
+            logEvents=[{"timestamp": now + i, "message": message} for i, message in enumerate(messages)],
+        )
+
+    with mock_aws():
+        client = boto3.client("logs")
+        client.create_log_group(logGroupName="/aws/codebuild/project")
+        client.create_log_stream(logGroupName="/aws/codebuild/project", logStreamName="codeseeder-abc/123")
+
+        tailer = cloudwatch.LogTailer(group_name="/aws/codebuild/project", stream_name="codeseeder-abc/123")
+        assert list(tailer.tail()) == []
+
+        put_messages(["first", "second"])
+        assert [event.message for event in tailer.tail()] == ["first", "second"]
+        assert list(tailer.tail()) == []
+
+        # Only the events logged since the previous call are returned
+        put_messages(["third"])
+        assert [event.message for event in tailer.tail()] == ["third"]
+
+
+### S3
+@pytest.mark.service
+def test_content_addressed_bundle(session, mocker) -> None:
+    import io
+
+    import seedfarmer.deployment.codebuild_remote as codebuild_remote
+    import seedfarmer.services._s3 as s3
+
+    with mock_aws():
+        boto3.client("s3").create_bucket(Bucket="seedkit-bucket")
+        assert s3.get_object_last_modified(bucket="seedkit-bucket", key="missing.zip", session=session) is None
+
+        upload = mocker.spy(codebuild_remote, "_upload_bundle")
+        key = codebuild_remote._upload_content_addressed_bundle(
+            bundle_path=io.BytesIO(b"bundle"), bucket="seedkit-bucket", session=session
+        )
+        assert key.startswith(f"{codebuild_remote.CONTENT_ADDRESSED_BUNDLE_PREFIX}/")
+        assert s3.get_object_last_modified(bucket="seedkit-bucket", key=key, session=session) is not None
+        assert upload.call_count == 1
+
+        # The same content maps to the same key and is not uploaded again
+        assert (
+            codebuild_remote._upload_content_addressed_bundle(
+                bundle_path=io.BytesIO(b"bundle"), bucket="seedkit-bucket", session=session
+            )
+            == key
+        )
+        assert upload.call_count == 1
+
+        # Bundles close to expiring are uploaded again
+        mocker.patch.object(codebuild_remote, "_CONTENT_ADDRESSED_BUNDLE_MAX_AGE", codebuild_remote.timedelta(0))
+        codebuild_remote._upload_content_addressed_bundle(
+            bundle_path=io.BytesIO(b"bundle"), bucket="seedkit-bucket", session=session
+        )
+        assert upload.call_count == 2
+
+        # Content addressed bundles are left in the bucket after the build
+        mocker.patch.object(codebuild_remote, "_execute_codebuild", return_value=None)
+        delete = mocker.spy(s3, "delete_objects")
+        codebuild_remote.run(
+            stack_outputs={"Bucket": "seedkit-bucket"},
+            bundle_path=io.BytesIO(b"other bundle"),
+            buildspec={},
+            timeout=10,
+            session=session,
+            content_addressed_bundle=True,
+        )
+        delete.assert_not_called()
+
+
+@pytest.mark.service
+def test_upload_multipart(session, mocker, tmp_path, caplog) -> None:
+    import io
+
+    import seedfarmer.services._s3 as s3
+
+    mocker.patch.dict(
+        os.environ,
+        {s3.S3_MULTIPART_THRESHOLD_ENV: str(5 * 1024 * 1024), s3.S3_MULTIPART_CHUNKSIZE_ENV: str(5 * 1024 * 1024)},
+    )
+    s3.get_transfer_config.cache_clear()
+    transfer_config = s3.get_transfer_config()
+    s3.get_transfer_config.cache_clear()
+    assert transfer_config.multipart_threshold == 5 * 1024 * 1024
+    assert transfer_config.multipart_chunksize == 5 * 1024 * 1024
+
+    data = os.urandom(12 * 1024 * 1024)
+    src = tmp_path / "bundle.zip"
+    src.write_bytes(data)
+    with mock_aws(), caplog.at_level(logging.DEBUG, logger="seedfarmer.services._s3"):
+        client = boto3.client("s3")
+        client.create_bucket(Bucket="seedkit-bucket")
+        s3.upload_file(
+            src=str(src), bucket="seedkit-bucket", key="file.zip", session=session, transfer_config=transfer_config
+        )
+        s3.upload_fileobj(
+            fileobj=io.BytesIO(data),
+            bucket="seedkit-bucket",
+            key="fileobj.zip",
+            session=session,
+            transfer_config=transfer_config,
+        )
+        for key in ["file.zip", "fileobj.zip"]:
+            head = client.head_object(Bucket="seedkit-bucket", Key=key)
+            # Multipart uploads have an ETag suffixed with the number of parts
+            assert head["ETag"].strip('"').endswith("-3")
+            assert client.get_object(Bucket="seedkit-bucket", Key=key)["Body"].read() == data
+    assert "(100%) to s3://seedkit-bucket/fileobj.zip" in caplog.text
+    assert all(record.levelno == logging.DEBUG for record in caplog.records if "Uploaded" in record.message)
+
+    # Uploads above the size threshold log their progress at INFO
+    mocker.patch.object(s3, "_UPLOAD_PROGRESS_INFO_SIZE", 10 * 1024 * 1024)
+    caplog.clear()
+    with mock_aws(), caplog.at_level(logging.INFO, logger="seedfarmer.services._s3"):
+        boto3.client("s3").create_bucket(Bucket="seedkit-bucket")
+        s3.upload_file(
+            src=str(src), bucket="seedkit-bucket", key="file.zip", session=session, transfer_config=transfer_config
+        )
+    assert "(100%) to s3://seedkit-bucket/file.zip" in caplog.text
+
+
+@pytest.mark.service
+def test_get_transfer_config_invalid(mocker) -> None:
+    import seedfarmer.errors
+    import seedfarmer.services._s3 as s3
+
+    mocker.patch.dict(os.environ, {s3.S3_MULTIPART_CHUNKSIZE_ENV: "16MB"})
+    s3.get_transfer_config.cache_clear()
+    with pytest.raises(seedfarmer.errors.InvalidConfigurationError, match=s3.S3_MULTIPART_CHUNKSIZE_ENV):
+        s3.get_transfer_config()
+    s3.get_transfer_config.cache_clear()
+
+
 ### IAM
 @pytest.mark.service
 def test_iam(iam_client, session) -> None:
@@ -178,6 +493,62 @@ def test_put_ssm_param(session) -> None:
         ssm.put_parameter(name="/myapp/test/", obj={"Hey": "tsting"}, session=session)
 
 
+@pytest.mark.service
+def test_put_ssm_param_compressed(session) -> None:
+    import seedfarmer.services._ssm as ssm
+
+    manifest = {"name": "module", "parameters": [{"name": f"param-{i}", "value": "value" * 10} for i in range(100)]}
+    with mock_aws():
+        ssm.put_parameter(name="/myapp/dep/group/module/manifest", obj=manifest, session=session, compress=True)
+        ssm.put_parameter(
+            name="/myapp/dep/group/module/md5/bundle", obj={"hash": "12345"}, session=session, compress=True
+        )
+        ssm.put_parameter(name="/myapp/dep/group/module/deployspec", obj=manifest, session=session)
+
+        client = boto3.client("ssm")
+        value = client.get_parameter(Name="/myapp/dep/group/module/manifest")["Parameter"]["Value"]
+        assert value.startswith(ssm.COMPRESSED_VALUE_MARKER)
+        assert len(value) < len(json.dumps(manifest))
+        value = client.get_parameter(Name="/myapp/dep/group/module/md5/bundle")["Parameter"]["Value"]
+        assert json.loads(value) == {"hash": "12345"}
+
+        assert ssm.get_parameter(name="/myapp/dep/group/module/manifest", session=session) == manifest
+        assert ssm.get_parameter_if_exists(name="/myapp/dep/group/module/manifest", session=session) == manifest
+        assert ssm.get_all_parameter_data_by_path(prefix="/myapp/dep/", session=session) == {
+            "/myapp/dep/group/module/manifest": manifest,
+            "/myapp/dep/group/module/md5/bundle": {"hash": "12345"},
+            "/myapp/dep/group/module/deployspec": manifest,
+        }
+
+
+@pytest.mark.service
+def test_put_ssm_param_throttled(mocker) -> None:
+    from botocore.exceptions import ClientError
+
+    import seedfarmer.errors
+    import seedfarmer.services._ssm as ssm
+
+    def throttle(code):
+        return ClientError({"Error": {"Code": code, "Message": "Rate exceeded"}}, "PutParameter")
+
+    client = mocker.Mock()
+    mocker.patch.object(ssm, "boto3_client", return_value=client)
+    sleep = mocker.patch.object(ssm.time, "sleep")
+
+    client.put_parameter.side_effect = [throttle("ThrottlingException"), throttle("TooManyUpdates"), None]
+    ssm.put_parameter(name="/myapp/test/", obj={"Hey": "testing"})
+    assert client.put_parameter.call_count == 3
+    assert sleep.call_count == 2
+
+    client.put_parameter.side_effect = throttle("TooManyUpdates")
+    with pytest.raises(seedfarmer.errors.SeedFarmerException):
+        ssm.put_parameter(name="/myapp/test/", obj={"Hey": "testing"})
+
+    client.put_parameter.side_effect = throttle("AccessDeniedException")
+    with pytest.raises(ClientError):
+        ssm.put_parameter(name="/myapp/test/", obj={"Hey": "testing"})
+
+
 @pytest.mark.service
 def test_list_ssm_param(session) -> None:
     import seedfarmer.services._ssm as ssm
@@ -188,6 +559,24 @@ def test_list_ssm_param(session) -> None:
         ssm.list_parameters_with_filter(prefix="/myapp/", contains_string="test", session=session)
 
 
+@pytest.mark.service
+def test_list_ssm_param_with_filter(session) -> None:
+    import seedfarmer.services._ssm as ssm
+
+    with mock_aws():
+        for name in ["/myapp/dep/manifest", "/myapp/dep/group/manifest", "/myapp/dep/group/module/md5/bundle"]:
+            ssm.put_parameter(name=name, obj={"Hey": "testing"}, session=session)
+        ssm.put_parameter(name="/myapp2/dep/manifest", obj={"Hey": "testing"}, session=session)
+        ssm.put_parameter(name="/other/myapp/manifest", obj={"Hey": "testing"}, session=session)
+
+        assert sorted(
+            ssm.list_parameters_with_filter(prefix="/myapp/", contains_string="manifest", session=session)
+        ) == [
+            "/myapp/dep/group/manifest",
+            "/myapp/dep/manifest",
+        ]
+
+
 @pytest.mark.service
 def test_delete_ssm_param(session) -> None:
     import seedfarmer.services._ssm as ssm
@@ -18,6 +18,7 @@ import pytest
 from moto import mock_aws
 
 import seedfarmer.errors
+from seedfarmer.services import _service_utils
 from seedfarmer.services._service_utils import boto3_client
 from seedfarmer.services.session_manager import (
     SessionManager,
@@ -79,3 +80,59 @@ def test_deployment_session(session_manager, sts_client):
     SessionManager().get_or_create(project_name="test").get_deployment_session(
         account_id="111111111111", region_name="us-east-1"
     )
+
+
+@pytest.mark.session_manager
+def test_refresh_sessions(session_manager, sts_client, mocker):
+    from datetime import datetime, timedelta, timezone
+
+    from botocore.credentials import RefreshableCredentials
+
+    session_manager = SessionManager().get_or_create(project_name="test")
+    deployment_session = session_manager.get_deployment_session(account_id="222222222222", region_name="us-east-1")
+    creds = deployment_session.get_credentials()
+    assert isinstance(creds, RefreshableCredentials)
+
+    # Nothing is close to expiry, no session is refreshed
+    refresh = mocker.spy(creds, "_refresh_using")
+    session_manager._refresh_sessions()
+    refresh.assert_not_called()
+
+    # Only the session close to expiry assumes its role again
+    creds._expiry_time = datetime.now(timezone.utc) + timedelta(minutes=5)
+    session_manager._refresh_sessions()
+    refresh.assert_called_once()
+    assert creds._expiry_time > datetime.now(timezone.utc) + timedelta(minutes=30)
+    assert (
+        session_manager.get_deployment_session(account_id="222222222222", region_name="us-east-1") is deployment_session
+    )
+
+
+@pytest.mark.session_manager
+def test_deployment_session_created_once(session_manager, sts_client, mocker):
+    from concurrent.futures import ThreadPoolExecutor
+
+    session_manager = SessionManager().get_or_create(project_name="test")
+    create = mocker.spy(session_manager, "_create_session_entry")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(
+            executor.map(
+                lambda _: session_manager.get_deployment_session(account_id="333333333333", region_name="us-west-2"),
+                range(8),
+            )
+        )
+    create.assert_called_once()
+    assert all(session is sessions[0] for session in sessions)
+
+
+@pytest.mark.session_manager
+def test_deployment_session_identity(session_manager, sts_client, mocker):
+    from seedfarmer.services import get_sts_identity_info
+
+    session_manager = SessionManager().get_or_create(project_name="test")
+    call_sts = mocker.spy(_service_utils, "_call_sts")
+    deployment_session = session_manager.get_deployment_session(account_id="444444444444", region_name="us-east-1")
+    account_id, _, partition = get_sts_identity_info(session=deployment_session)
+    assert (account_id, partition) == ("444444444444", "aws")
+    get_sts_identity_info(session=session_manager.toolchain_session)
+    call_sts.assert_not_called()
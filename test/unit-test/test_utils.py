@@ -55,3 +55,10 @@ def test_validate_module_dependencies(env_params):
     assert replaced["name"] == "testing"
     assert replaced["toolchain_region"] == "us-east-1"
     assert replaced["target_account_mappings"][0]["account_id"] == "123456789012"
+
+
+@pytest.mark.utils_test
+def test_get_path_lock():
+    lock = utils.get_path_lock("seedfarmer.gitmodules/repo")
+    assert lock is utils.get_path_lock(os.path.abspath("seedfarmer.gitmodules/repo"))
+    assert lock is not utils.get_path_lock("seedfarmer.gitmodules/other-repo")